@@ -0,0 +1,118 @@
+"""
+Catálogo de estações BDMEP compartilhado entre sessões do aplicativo
+Lê uma vez a pasta (ou o ZIP) de arquivos CSV e mantém o resumo das estações, os dados brutos e os rótulos prontos,
+para serem reaproveitados por todas as sessões do Streamlit e pelas ferramentas de linha de comando
+"""
+import os
+import tempfile
+import zipfile
+from types import MappingProxyType
+
+import pandas as pd
+
+from instrumentacao import etapa
+
+
+def versao_arquivo(caminho):
+    """
+    Versão de um arquivo ou pasta a partir do tamanho e da data de modificação (muda a cada sincronização).
+    Para pastas, considera a modificação mais recente e o tamanho total dos arquivos contidos.
+    """
+    if os.path.isdir(caminho):
+        infos = [entrada.stat() for entrada in os.scandir(caminho) if entrada.is_file()]
+        return f"{max((i.st_mtime_ns for i in infos), default=0)}-{sum(i.st_size for i in infos)}-{len(infos)}"
+    info = os.stat(caminho)
+    return f"{info.st_mtime_ns}-{info.st_size}"
+
+
+def ler_catalogo_pasta(pasta):
+    """
+    Lê os CSV do BDMEP de uma pasta.
+    Retorna o resumo das estações (metadados e percentuais de falha), o dicionário {codigo: DataFrame com os dados brutos}
+    e a lista de erros de leitura (arquivo, mensagem).
+    """
+    resumo = []
+    planilhas_completas = {}
+    erros = []
+
+    for file in sorted(f for f in os.listdir(pasta) if f.endswith('.csv')):
+        file_path = os.path.join(pasta, file)
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                linhas = [next(f).strip() for _ in range(9)]
+
+            cabecalho = {}
+            for linha in linhas:
+                if ':' in linha:
+                    chave, valor = linha.split(':', 1)
+                    cabecalho[chave.strip().lower().replace(' ', '_')] = valor.strip()
+
+            cod = cabecalho.get("codigo_estacao", file)
+            with etapa('ler_csv', cod) as medida:
+                df_dados = pd.read_csv(file_path, sep=";", encoding="utf-8", skiprows=9)
+                medida.linhas = len(df_dados)
+            planilhas_completas[cod] = df_dados
+
+            total_linhas = len(df_dados)
+            def calc_falha_percent(col):
+                return (df_dados[col].isna().sum() / total_linhas * 100) if col in df_dados.columns else None
+
+            resumo.append({
+                "arquivo": file,
+                "nome": cabecalho.get("nome", ""),
+                "codigo_estacao": cabecalho.get("codigo_estacao", ""),
+                "latitude": float(cabecalho.get("latitude", 0)),
+                "longitude": float(cabecalho.get("longitude", 0)),
+                "altitude": float(cabecalho.get("altitude", 0)),
+                "situacao": cabecalho.get("situacao", ""),
+                "data_inicial": cabecalho.get("data_inicial", ""),
+                "data_final": cabecalho.get("data_final", ""),
+                "falha de precipitação (%)": calc_falha_percent("PRECIPITACAO TOTAL, DIARIO (AUT)(mm)"),
+                "falha de temperatura média (%)": calc_falha_percent("TEMPERATURA MEDIA, DIARIA (AUT)(°C)"),
+                "falha de umidade relativa (%)": calc_falha_percent("UMIDADE RELATIVA DO AR, MEDIA DIARIA (AUT)(%)"),
+                "falha de velocidade do vento (%)": calc_falha_percent("VENTO, VELOCIDADE MEDIA DIARIA (AUT)(m/s)")
+            })
+        except Exception as e:
+            erros.append((file, str(e)))
+
+    return pd.DataFrame(resumo), planilhas_completas, erros
+
+
+class CatalogoEstacoes:
+    """
+    Catálogo imutável de estações: resumo, dados brutos (somente leitura) e rótulos 'NOME (CODIGO)' já montados.
+    Uma única instância pode ser compartilhada por todas as sessões; o estado de cada sessão fica só na interface.
+    """
+
+    def __init__(self, df_resumo, planilhas_completas, nome_pasta, versao, erros=()):
+        self.df_resumo = df_resumo
+        self.planilhas_completas = MappingProxyType(planilhas_completas)
+        self.nome_pasta = nome_pasta
+        self.versao = versao
+        self.erros = tuple(erros)
+
+        rotulos = [f"{nome} ({cod})" for nome, cod in zip(df_resumo["nome"], df_resumo["codigo_estacao"])] if len(df_resumo) else []
+        self.rotulos = tuple(rotulos)
+        self.rotulos_por_codigo = tuple(rotulo for _, rotulo in sorted(zip(df_resumo.get("codigo_estacao", []), rotulos),
+                                                                         key=lambda par: par[0]))
+        self.rotulos_ordenados = tuple(sorted(rotulos))
+
+
+def carregar_catalogo(caminho):
+    """
+    Carrega o catálogo a partir de uma pasta de CSV ou de um ZIP do BDMEP (com os CSV na raiz ou em uma subpasta).
+    """
+    versao = versao_arquivo(caminho)
+    if os.path.isdir(caminho):
+        df_resumo, planilhas_completas, erros = ler_catalogo_pasta(caminho)
+        return CatalogoEstacoes(df_resumo, planilhas_completas, os.path.basename(os.path.normpath(caminho)), versao, erros)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with zipfile.ZipFile(caminho, 'r') as zip_ref:
+            zip_ref.extractall(tmpdir)
+
+        folders = [f for f in os.scandir(tmpdir) if f.is_dir()]
+        folder_path = folders[0].path if folders else tmpdir
+        df_resumo, planilhas_completas, erros = ler_catalogo_pasta(folder_path)
+
+    return CatalogoEstacoes(df_resumo, planilhas_completas, os.path.basename(folder_path), versao, erros)
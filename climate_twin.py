@@ -1,10 +1,15 @@
 """ClimateTwin - Módulo para manipulação de dados da plataforma Banco de Dados Meteorológicos do INMET"""
+import os
+import warnings
 from datetime import datetime
 
 import pandas as pd
 import numpy as np
 
 
+VARIAVEIS_BDMEP = ['precipitacao total diaria (mm)', 'temperatura media diaria (°C)', 'umidade relativa ar media diaria (%)', 'velocidade vento media diaria (m/s)']
+
+
 def ler_dados(dados: pd.DataFrame) -> tuple[dict, pd.DataFrame]:
     """
     Leitura de dados do arquivo CSV do BDMEP e  extração do cabeçalho.
@@ -29,7 +34,7 @@ def ler_dados(dados: pd.DataFrame) -> tuple[dict, pd.DataFrame]:
                 cabecalho[chave_formatada] = valor
     df = pd.read_csv(dados, sep=";", encoding="utf-8", skiprows=9)
     df.drop(columns=['Unnamed: 5'], inplace=True, errors='ignore')
-    df.columns = ['data medicao', 'precipitacao total diaria (mm)', 'temperatura media diaria (°C)', 'umidade relativa ar media diaria (%)', 'velocidade vento media diaria (m/s)']
+    df.columns = ['data medicao'] + VARIAVEIS_BDMEP
     df['data medicao'] = pd.to_datetime(df['data medicao'], errors='coerce')
     
     return cabecalho, df
@@ -94,10 +99,10 @@ def calculo_precipitacoes(df: pd.DataFrame, metadados: dict) -> tuple[pd.DataFra
     :return: saida[0] = Precipitação máxima diária (mm) em função do período de retorno (anos), saida[1] = Matriz de intensidade de chuva (mm/h) em função do tempo de concentração (tc) em minutos e tempo de retorno (tr) em anos.
     """
     
-    # Limpeza e formatação dos dados
-    df.dropna(subset=['temperatura media diaria (°C)', 'umidade relativa ar media diaria (%)', 'velocidade vento media diaria (m/s)'], inplace=True)
-    df['ano hidrologico'] = df['data medicao'].dt.year
+    # Limpeza e formatação dos dados (apenas os dias sem precipitação são descartados, de modo que as falhas preenchidas por preencher_falhas/aplicar_matriz entram nas máximas anuais)
     df['precipitacao total diaria (mm)'] = pd.to_numeric(df['precipitacao total diaria (mm)'], errors='coerce')
+    df.dropna(subset=['data medicao', 'precipitacao total diaria (mm)'], inplace=True)
+    df['ano hidrologico'] = df['data medicao'].dt.year
 
     # Extração da média e desvio padrão das maiores precipitações anuais
     maiores_precipitacoes_por_ano = df.groupby('ano hidrologico')['precipitacao total diaria (mm)'].max()
@@ -117,3 +122,671 @@ def calculo_precipitacoes(df: pd.DataFrame, metadados: dict) -> tuple[pd.DataFra
     matriz_chuva['cidade'] = metadados['nome']
 
     return df_hmax1, matriz_chuva
+
+
+def ler_dados_pasta(caminho_pasta: str) -> tuple[pd.DataFrame, dict]:
+    """
+    Leitura de todos os arquivos CSV do BDMEP de uma pasta.
+
+    :param caminho_pasta: Caminho para a pasta com os arquivos CSV da base de dados BDMEP.
+
+    :return: saida[0] = Metadados de todas as estações indexados por 'codigo_estacao', saida[1] = Dicionário {codigo_estacao: dados meteorológicos base BDMEP}
+    """
+
+    arquivos = sorted(arquivo for arquivo in os.listdir(caminho_pasta) if arquivo.endswith('.csv'))
+    metadados = []
+    dados = {}
+    for arquivo in arquivos:
+        cabecalho, df = ler_dados(os.path.join(caminho_pasta, arquivo))
+        cabecalho['arquivo'] = arquivo
+        metadados.append(cabecalho)
+        dados[cabecalho['codigo_estacao']] = df
+    df_metadados = pd.DataFrame(metadados).set_index('codigo_estacao')
+
+    return df_metadados, dados
+
+
+def matriz_estacoes(dados: dict, coluna: str = 'precipitacao total diaria (mm)') -> pd.DataFrame:
+    """
+    Organiza uma variável diária de várias estações em uma matriz única (datas x estações).
+
+    :param dados: Dicionário {codigo_estacao: dados meteorológicos base BDMEP}.
+    :param coluna: Variável a ser extraída dos dados meteorológicos base BDMEP.
+
+    :return: Matriz com índice diário contínuo 'data medicao' e uma coluna por estação. Dias sem registro ficam como NaN.
+    """
+
+    codigos = list(dados.keys())
+    inicio = min(df['data medicao'].min() for df in dados.values())
+    fim = max(df['data medicao'].max() for df in dados.values())
+    datas = pd.date_range(inicio, fim, freq='D', name='data medicao')
+
+    # Preenchimento direto por posição do dia, sem alinhamento de índices
+    valores = np.full((len(datas), len(codigos)), np.nan)
+    for j, codigo in enumerate(codigos):
+        df = dados[codigo].dropna(subset=['data medicao'])
+        pos = ((df['data medicao'] - inicio) // pd.Timedelta(days=1)).to_numpy()
+        valores[pos, j] = pd.to_numeric(df[coluna], errors='coerce').to_numpy(dtype=float)
+
+    return pd.DataFrame(valores, index=datas, columns=codigos)
+
+
+def distancia_haversine(lat_1, lon_1, lat_2, lon_2) -> np.ndarray:
+    """
+    Distância de grande círculo entre pontos (aceita arrays com broadcasting).
+
+    :param lat_1: Latitude do ponto 1 (graus).
+    :param lon_1: Longitude do ponto 1 (graus).
+    :param lat_2: Latitude do ponto 2 (graus).
+    :param lon_2: Longitude do ponto 2 (graus).
+
+    :return: Distância entre os pontos (km).
+    """
+
+    lat_1, lon_1, lat_2, lon_2 = map(np.radians, (lat_1, lon_1, lat_2, lon_2))
+    a = np.sin((lat_2 - lat_1) / 2) ** 2 + np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) / 2) ** 2
+
+    return 2 * 6371.0 * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _estatisticas_pares(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Somatórios pareados entre séries com falhas, ao longo do eixo 0 (dias).
+
+    :param x: Série da estação alvo (dias x ...).
+    :param y: Série da estação vizinha (mesmo formato de x).
+
+    :return: saida[0] = dias comuns, saida[1] = correlação de Pearson, saida[2] = coeficiente angular, saida[3] = coeficiente linear (regressão x = a + b * y)
+    """
+
+    mascara = ~np.isnan(x) & ~np.isnan(y)
+    x = np.where(mascara, x, 0.0)
+    y = np.where(mascara, y, 0.0)
+    n = mascara.sum(axis=0).astype(float)
+    sx, sy = x.sum(axis=0), y.sum(axis=0)
+    sxy, sxx, syy = (x * y).sum(axis=0), (x * x).sum(axis=0), (y * y).sum(axis=0)
+    cov = n * sxy - sx * sy
+    var_x = n * sxx - sx ** 2
+    var_y = n * syy - sy ** 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        correlacao = cov / np.sqrt(var_x * var_y)
+        coef_angular = cov / var_y
+        coef_linear = (sx - coef_angular * sy) / n
+
+    return n, correlacao, coef_angular, coef_linear
+
+
+def grafo_vizinhos(matriz: pd.DataFrame, metadados: pd.DataFrame, n_vizinhos: int = 5, n_candidatos: int = 15, raio_max_km: float = 300.0, correlacao_min: float = 0.3, dias_comuns_min: int = 365, bloco: int = 64) -> pd.DataFrame:
+    """
+    Pré-calcula o grafo de vizinhança entre estações: para cada estação, as vizinhas mais próximas e mais correlacionadas.
+
+    :param matriz: Matriz diária (datas x estações), ver matriz_estacoes.
+    :param metadados: Metadados das estações indexados por 'codigo_estacao' (colunas 'latitude' e 'longitude').
+    :param n_vizinhos: Número máximo de vizinhas mantidas por estação.
+    :param n_candidatos: Número de estações mais próximas avaliadas antes do filtro por correlação.
+    :param raio_max_km: Distância máxima (km) entre a estação e uma vizinha.
+    :param correlacao_min: Correlação de Pearson mínima entre as séries diárias.
+    :param dias_comuns_min: Número mínimo de dias com registro simultâneo nas duas estações.
+    :param bloco: Número de estações processadas por vez (controla o uso de memória).
+
+    :return: Grafo em formato longo ('codigo_estacao', 'vizinha', 'ordem', 'distancia (km)', 'correlacao', 'dias comuns', 'coef angular', 'coef linear').
+    """
+
+    codigos = np.asarray(matriz.columns)
+    lat = metadados.loc[codigos, 'latitude'].to_numpy(dtype=float)
+    lon = metadados.loc[codigos, 'longitude'].to_numpy(dtype=float)
+    n_estacoes = len(codigos)
+    n_candidatos = min(n_candidatos, n_estacoes - 1)
+    n_vizinhos = min(n_vizinhos, n_candidatos)
+
+    # Candidatas: as estações mais próximas
+    distancias = distancia_haversine(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+    np.fill_diagonal(distancias, np.inf)
+    candidatas = np.argsort(distancias, axis=1)[:, :n_candidatos]
+    dist_candidatas = np.take_along_axis(distancias, candidatas, axis=1)
+
+    # Estatísticas pareadas estação x candidata, em blocos de estações
+    valores = matriz.to_numpy(dtype=float)
+    n_comuns = np.zeros((n_estacoes, n_candidatos))
+    correlacao = np.zeros((n_estacoes, n_candidatos))
+    coef_angular = np.zeros((n_estacoes, n_candidatos))
+    coef_linear = np.zeros((n_estacoes, n_candidatos))
+    for inicio in range(0, n_estacoes, bloco):
+        fim = min(inicio + bloco, n_estacoes)
+        x = valores[:, inicio:fim, None]
+        y = valores[:, candidatas[inicio:fim]]
+        n_comuns[inicio:fim], correlacao[inicio:fim], \
+            coef_angular[inicio:fim], coef_linear[inicio:fim] = _estatisticas_pares(x, y)
+
+    # Filtro e ordenação das vizinhas pela correlação
+    validas = (dist_candidatas <= raio_max_km) & (n_comuns >= dias_comuns_min) & (np.nan_to_num(correlacao, nan=-1) >= correlacao_min)
+    chave = np.where(validas, np.nan_to_num(correlacao, nan=-1), -np.inf)
+    ordem = np.argsort(-chave, axis=1, kind='stable')[:, :n_vizinhos]
+    selecionadas = np.take_along_axis(validas, ordem, axis=1)
+    linhas = np.repeat(np.arange(n_estacoes)[:, None], n_vizinhos, axis=1)[selecionadas]
+    colunas = ordem[selecionadas]
+
+    grafo = pd.DataFrame({
+        'codigo_estacao': codigos[linhas],
+        'vizinha': codigos[candidatas[linhas, colunas]],
+        'ordem': np.cumsum(selecionadas, axis=1)[selecionadas] - 1,
+        'distancia (km)': dist_candidatas[linhas, colunas],
+        'correlacao': correlacao[linhas, colunas],
+        'dias comuns': n_comuns[linhas, colunas].astype(int),
+        'coef angular': coef_angular[linhas, colunas],
+        'coef linear': coef_linear[linhas, colunas],
+    })
+
+    return grafo
+
+
+def preencher_falhas(matriz: pd.DataFrame, grafo: pd.DataFrame, metodo: str = 'idw', potencia: float = 2.0, n_vizinhos_min: int = 1, valor_min: float | None = 0.0, bloco: int = 64) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Preenchimento de falhas diárias a partir das estações vizinhas do grafo (vetorizado em todas as estações e dias). Apenas as falhas dentro do período de operação de cada estação são preenchidas.
+
+    :param matriz: Matriz diária (datas x estações), ver matriz_estacoes.
+    :param grafo: Grafo de vizinhança, ver grafo_vizinhos.
+    :param metodo: 'idw' (inverso da distância ponderada) ou 'regressao' (regressão linear com cada vizinha, ponderada pelo r²).
+    :param potencia: Expoente da distância no método 'idw'.
+    :param n_vizinhos_min: Número mínimo de vizinhas com registro no dia para que a falha seja preenchida.
+    :param valor_min: Limite inferior dos valores estimados (0 para precipitação). Use None para não limitar.
+    :param bloco: Número de estações processadas por vez (controla o uso de memória).
+
+    :return: saida[0] = Matriz com as falhas preenchidas, saida[1] = Máscara booleana dos valores preenchidos
+    """
+
+    if metodo not in ['idw', 'regressao']:
+        raise ValueError("O método de preenchimento deve ser 'idw' ou 'regressao'.")
+
+    codigos = list(matriz.columns)
+    posicao = {codigo: i for i, codigo in enumerate(codigos)}
+    n_estacoes = len(codigos)
+    n_max = int(grafo['ordem'].max()) + 1 if len(grafo) else 1
+
+    # Grafo em arrays (estações x vizinhas); a coluna extra n_estacoes aponta para uma série vazia
+    indices = np.full((n_estacoes, n_max), n_estacoes)
+    pesos = np.zeros((n_estacoes, n_max))
+    coef_angular = np.zeros((n_estacoes, n_max))
+    coef_linear = np.zeros((n_estacoes, n_max))
+    grafo = grafo[grafo['codigo_estacao'].isin(posicao) & grafo['vizinha'].isin(posicao)]
+    linhas = grafo['codigo_estacao'].map(posicao).to_numpy()
+    colunas = grafo['ordem'].to_numpy()
+    indices[linhas, colunas] = grafo['vizinha'].map(posicao).to_numpy()
+    if metodo == 'idw':
+        pesos[linhas, colunas] = 1 / np.maximum(grafo['distancia (km)'].to_numpy(), 1e-3) ** potencia
+    else:
+        pesos[linhas, colunas] = grafo['correlacao'].to_numpy() ** 2
+        coef_angular[linhas, colunas] = grafo['coef angular'].to_numpy()
+        coef_linear[linhas, colunas] = grafo['coef linear'].to_numpy()
+
+    # Período de operação de cada estação (não extrapola antes do primeiro ou após o último registro)
+    valores = matriz.to_numpy(dtype=float)
+    registrado = ~np.isnan(valores)
+    dias = np.arange(len(valores))[:, None]
+    primeiro = np.where(registrado.any(axis=0), registrado.argmax(axis=0), len(valores))
+    ultimo = len(valores) - 1 - registrado[::-1].argmax(axis=0)
+    em_operacao = (dias >= primeiro) & (dias <= ultimo)
+
+    # Estimativa em blocos de estações
+    estendida = np.concatenate([valores, np.full((len(valores), 1), np.nan)], axis=1)
+    preenchida = valores.copy()
+    for inicio in range(0, n_estacoes, bloco):
+        fim = min(inicio + bloco, n_estacoes)
+        vizinhas = estendida[:, indices[inicio:fim]]
+        if metodo == 'regressao':
+            vizinhas = coef_linear[inicio:fim] + coef_angular[inicio:fim] * vizinhas
+        disponivel = ~np.isnan(vizinhas)
+        peso = np.where(disponivel, pesos[inicio:fim], 0.0)
+        soma_pesos = peso.sum(axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            estimativa = (np.where(disponivel, vizinhas, 0.0) * peso).sum(axis=2) / soma_pesos
+        if valor_min is not None:
+            estimativa = np.maximum(estimativa, valor_min)
+        suficiente = (disponivel.sum(axis=2) >= n_vizinhos_min) & (soma_pesos > 0)
+        falha = np.isnan(valores[:, inicio:fim]) & suficiente & em_operacao[:, inicio:fim]
+        preenchida[:, inicio:fim] = np.where(falha, estimativa, valores[:, inicio:fim])
+    mascara = np.isnan(valores) & ~np.isnan(preenchida)
+
+    return pd.DataFrame(preenchida, index=matriz.index, columns=codigos), pd.DataFrame(mascara, index=matriz.index, columns=codigos)
+
+
+def aplicar_matriz(dados: dict, matriz: pd.DataFrame, coluna: str = 'precipitacao total diaria (mm)') -> dict:
+    """
+    Devolve uma matriz (datas x estações) para os dados meteorológicos de cada estação, por exemplo após o preenchimento de falhas.
+
+    :param dados: Dicionário {codigo_estacao: dados meteorológicos base BDMEP}.
+    :param matriz: Matriz diária (datas x estações).
+    :param coluna: Variável a ser substituída nos dados meteorológicos base BDMEP.
+
+    :return: Novo dicionário {codigo_estacao: dados meteorológicos base BDMEP} com a coluna atualizada.
+    """
+
+    inicio = matriz.index[0]
+    valores = matriz.to_numpy(dtype=float)
+    saida = {}
+    for codigo, df in dados.items():
+        df = df.copy()
+        if codigo in matriz.columns:
+            validas = df['data medicao'].notna().to_numpy()
+            pos = ((df.loc[validas, 'data medicao'] - inicio) // pd.Timedelta(days=1)).to_numpy()
+            df.loc[validas, coluna] = valores[pos, matriz.columns.get_loc(codigo)]
+        saida[codigo] = df
+
+    return saida
+
+
+def radiacao_extraterrestre(latitude, dia_juliano) -> np.ndarray:
+    """
+    Radiação extraterrestre diária (FAO-56, eq. 21), aceita arrays com broadcasting.
+
+    :param latitude: Latitude (graus).
+    :param dia_juliano: Dia do ano (1 a 366).
+
+    :return: Radiação extraterrestre (MJ/m²/dia).
+    """
+
+    phi = np.radians(latitude)
+    dr = 1 + 0.033 * np.cos(2 * np.pi * dia_juliano / 365)
+    delta = 0.409 * np.sin(2 * np.pi * dia_juliano / 365 - 1.39)
+    ws = np.arccos(np.clip(-np.tan(phi) * np.tan(delta), -1, 1))
+
+    return 24 * 60 / np.pi * 0.0820 * dr * (ws * np.sin(phi) * np.sin(delta) + np.cos(phi) * np.cos(delta) * np.sin(ws))
+
+
+def pressao_atmosferica(altitude) -> np.ndarray:
+    """
+    Pressão atmosférica em função da altitude (FAO-56, eq. 7).
+
+    :param altitude: Altitude (m).
+
+    :return: Pressão atmosférica (kPa).
+    """
+
+    return 101.3 * ((293 - 0.0065 * np.asarray(altitude, dtype=float)) / 293) ** 5.26
+
+
+def pressao_saturacao(temperatura) -> np.ndarray:
+    """
+    Pressão de saturação de vapor (FAO-56, eq. 11).
+
+    :param temperatura: Temperatura do ar (°C).
+
+    :return: Pressão de saturação de vapor (kPa).
+    """
+
+    return 0.6108 * np.exp(17.27 * temperatura / (temperatura + 237.3))
+
+
+def evapotranspiracao_referencia(temperatura: pd.DataFrame, metadados: pd.DataFrame, umidade: pd.DataFrame | None = None, vento: pd.DataFrame | None = None, metodo: str = 'penman-monteith', temperatura_max: pd.DataFrame | None = None, temperatura_min: pd.DataFrame | None = None, amplitude_termica: float = 10.0, krs: float = 0.16, altura_anemometro: float = 10.0) -> pd.DataFrame:
+    """
+    Evapotranspiração de referência diária (ET0) de todas as estações em uma única passagem vetorizada.
+
+    As estações automáticas do BDMEP (ler_dados) fornecem apenas a temperatura média diária. Sem 'temperatura_max' e 'temperatura_min', a amplitude térmica diária é assumida constante ('amplitude_termica') para estimar a radiação solar (FAO-56, eq. 50).
+
+    :param temperatura: Matriz (datas x estações) de temperatura média diária (°C), ver matriz_estacoes.
+    :param metadados: Metadados das estações indexados por 'codigo_estacao' (colunas 'latitude' e 'altitude').
+    :param umidade: Matriz de umidade relativa média diária (%). Obrigatória para 'penman-monteith'.
+    :param vento: Matriz de velocidade média diária do vento (m/s). Obrigatória para 'penman-monteith'.
+    :param metodo: 'penman-monteith' (FAO-56) ou 'hargreaves'.
+    :param temperatura_max: Matriz de temperatura máxima diária (°C), opcional.
+    :param temperatura_min: Matriz de temperatura mínima diária (°C), opcional.
+    :param amplitude_termica: Amplitude térmica diária assumida (°C) quando não há temperatura máxima e mínima.
+    :param krs: Coeficiente de ajuste da radiação solar (0.16 interior, 0.19 litoral).
+    :param altura_anemometro: Altura de medição do vento (m), convertida para 2 m.
+
+    :return: Matriz (datas x estações) de ET0 (mm/dia).
+    """
+
+    if metodo not in ['penman-monteith', 'hargreaves']:
+        raise ValueError("O método de evapotranspiração deve ser 'penman-monteith' ou 'hargreaves'.")
+    if metodo == 'penman-monteith' and (umidade is None or vento is None):
+        raise ValueError("O método 'penman-monteith' exige as matrizes de umidade e vento.")
+
+    codigos = temperatura.columns
+    t_med = temperatura.to_numpy(dtype=float)
+    latitude = metadados.loc[codigos, 'latitude'].to_numpy(dtype=float)[None, :]
+    altitude = metadados.loc[codigos, 'altitude'].to_numpy(dtype=float)[None, :]
+    dia_juliano = temperatura.index.dayofyear.to_numpy()[:, None]
+
+    # Amplitude térmica e radiação
+    if temperatura_max is not None and temperatura_min is not None:
+        t_max = temperatura_max.reindex(index=temperatura.index, columns=codigos).to_numpy(dtype=float)
+        t_min = temperatura_min.reindex(index=temperatura.index, columns=codigos).to_numpy(dtype=float)
+        amplitude = np.maximum(t_max - t_min, 0)
+    else:
+        t_max = t_min = None
+        amplitude = np.full_like(t_med, amplitude_termica)
+    ra = radiacao_extraterrestre(latitude, dia_juliano)
+
+    if metodo == 'hargreaves':
+        et0 = 0.0023 * 0.408 * ra * (t_med + 17.8) * np.sqrt(amplitude)
+    else:
+        ur = umidade.reindex(index=temperatura.index, columns=codigos).to_numpy(dtype=float)
+        u_z = vento.reindex(index=temperatura.index, columns=codigos).to_numpy(dtype=float)
+        u_2 = u_z * 4.87 / np.log(67.8 * altura_anemometro - 5.42)
+
+        # Pressão de vapor
+        if t_max is not None:
+            es = (pressao_saturacao(t_max) + pressao_saturacao(t_min)) / 2
+            t_k4 = ((t_max + 273.16) ** 4 + (t_min + 273.16) ** 4) / 2
+        else:
+            es = pressao_saturacao(t_med)
+            t_k4 = (t_med + 273.16) ** 4
+        ea = np.clip(ur, 0, 100) / 100 * es
+
+        # Saldo de radiação (G = 0 na escala diária)
+        rs = krs * np.sqrt(amplitude) * ra
+        rso = (0.75 + 2e-5 * altitude) * ra
+        rns = 0.77 * rs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            razao = np.clip(np.where(rso > 0, rs / rso, 1.0), 0, 1)
+        rnl = 4.903e-9 * t_k4 * (0.34 - 0.14 * np.sqrt(ea)) * (1.35 * razao - 0.35)
+        rn = rns - rnl
+
+        # Penman-Monteith FAO-56 (eq. 6)
+        delta = 4098 * pressao_saturacao(t_med) / (t_med + 237.3) ** 2
+        gama = 0.665e-3 * pressao_atmosferica(altitude)
+        et0 = (0.408 * delta * rn + gama * 900 / (t_med + 273) * u_2 * (es - ea)) / (delta + gama * (1 + 0.34 * u_2))
+
+    return pd.DataFrame(np.maximum(et0, 0), index=temperatura.index, columns=codigos)
+
+
+def _posicao_dia_ano(datas: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Posição do dia em um calendário de 366 dias (29/02 ocupa sempre a posição 59).
+
+    :param datas: Datas diárias.
+
+    :return: Posição do dia (0 a 365).
+    """
+
+    return datas.dayofyear.to_numpy() - 1 + ((~datas.is_leap_year) & (datas.month > 2)).astype(int)
+
+
+def _estatisticas_amostras(amostras: np.ndarray, percentis: list, amostra_min: int) -> np.ndarray:
+    """
+    Média, desvio padrão e percentis ao longo do eixo 0, ignorando NaN.
+
+    :param amostras: Amostras (n x ...).
+    :param percentis: Percentis calculados (0 a 100).
+    :param amostra_min: Número mínimo de amostras válidas; abaixo dele o resultado é NaN.
+
+    :return: Estatísticas com o eixo das estatísticas por último (..., 2 + len(percentis)).
+    """
+
+    # Percentis por interpolação linear sobre as amostras ordenadas (NaN vão para o fim)
+    ordenadas = np.sort(amostras, axis=0)
+    n = np.sum(~np.isnan(amostras), axis=0)
+    quantis = []
+    for p in percentis:
+        posicao = np.maximum(n - 1, 0) * p / 100
+        inferior = np.floor(posicao).astype(int)
+        superior = np.minimum(inferior + 1, np.maximum(n - 1, 0))
+        v_inf = np.take_along_axis(ordenadas, inferior[None], axis=0)[0]
+        v_sup = np.take_along_axis(ordenadas, superior[None], axis=0)[0]
+        quantis.append(v_inf + (v_sup - v_inf) * (posicao - inferior))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        saida = np.stack([np.nanmean(amostras, axis=0), np.nanstd(amostras, axis=0, ddof=1)] + quantis, axis=0)
+    saida[:, n < max(amostra_min, 2)] = np.nan
+
+    return np.moveaxis(saida, 0, -1)
+
+
+def _normais_matriz(matriz: pd.DataFrame, precipitacao: bool, janela: int, percentis: list, amostra_min: int, dias: np.ndarray, meses: np.ndarray, bloco: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Normais diárias (janela móvel centrada) e mensais de uma variável para todas as estações da matriz.
+
+    :param matriz: Matriz diária (datas x estações).
+    :param precipitacao: True para agregar os meses por soma, False para agregar por média.
+    :param janela: Largura (dias) da janela móvel centrada no dia do ano.
+    :param percentis: Percentis calculados (0 a 100).
+    :param amostra_min: Número mínimo de amostras válidas por dia do ano ou mês.
+    :param dias: Posições de dia do ano (0 a 365) a calcular.
+    :param meses: Meses (0 a 11) a calcular.
+    :param bloco: Número de estações processadas por vez (controla o uso de memória).
+
+    :return: saida[0] = Normais diárias (estações x dias x estatísticas), saida[1] = Normais mensais (estações x meses x estatísticas)
+    """
+
+    # Reorganização em (anos, dia do ano, estações)
+    datas = matriz.index
+    anos = datas.year.to_numpy() - datas.year.min()
+    valores = np.full((anos.max() + 1, 366, matriz.shape[1]), np.nan)
+    valores[anos, _posicao_dia_ano(datas)] = matriz.to_numpy(dtype=float)
+    meia = janela // 2
+    posicoes = (dias[None, :] + np.arange(-meia, meia + 1)[:, None]) % 366
+
+    # Agregação mensal (anos x meses x estações)
+    if precipitacao:
+        mensal = matriz.resample('MS').sum(min_count=20)
+    else:
+        mensal = matriz.resample('MS').mean()
+    valores_mensais = np.full((anos.max() + 1, 12, matriz.shape[1]), np.nan)
+    valores_mensais[mensal.index.year - datas.year.min(), mensal.index.month - 1] = mensal.to_numpy(dtype=float)
+
+    n_estatisticas = 2 + len(percentis)
+    diario = np.empty((matriz.shape[1], len(dias), n_estatisticas))
+    for inicio in range(0, matriz.shape[1], bloco):
+        fim = min(inicio + bloco, matriz.shape[1])
+        amostras = valores[:, posicoes, inicio:fim].reshape(-1, len(dias), fim - inicio)
+        diario[inicio:fim] = np.moveaxis(_estatisticas_amostras(amostras, percentis, amostra_min), 1, 0)
+    mensais = np.moveaxis(_estatisticas_amostras(valores_mensais[:, meses], percentis, min(amostra_min, 3)), 1, 0)
+
+    return diario, mensais
+
+
+def cubo_normais(matrizes: dict, percentis: tuple = (5, 10, 25, 50, 75, 90, 95), janela: int = 15, amostra_min: int = 30, bloco: int = 64) -> dict:
+    """
+    Pré-calcula o cubo de normais climatológicas (dia do ano e mês) por variável e estação.
+
+    :param matrizes: Dicionário {variavel: matriz diária (datas x estações)}, ver matriz_estacoes. Todas as matrizes devem ter as mesmas estações.
+    :param percentis: Percentis armazenados (0 a 100).
+    :param janela: Largura (dias) da janela móvel centrada usada nas normais diárias.
+    :param amostra_min: Número mínimo de amostras válidas por dia do ano; abaixo dele a normal é NaN.
+    :param bloco: Número de estações processadas por vez (controla o uso de memória).
+
+    :return: Cubo de normais: 'variaveis', 'estacoes', 'estatisticas', 'diario' (variáveis x estações x 366 x estatísticas), 'mensal' (variáveis x estações x 12 x estatísticas) e os parâmetros de cálculo.
+    """
+
+    variaveis = list(matrizes.keys())
+    estacoes = list(matrizes[variaveis[0]].columns)
+    estatisticas = ['media', 'desvio'] + [f'p{p}' for p in percentis]
+    cubo = {
+        'variaveis': variaveis,
+        'estacoes': estacoes,
+        'estatisticas': estatisticas,
+        'percentis': list(percentis),
+        'janela': janela,
+        'amostra_min': amostra_min,
+        'diario': np.full((len(variaveis), len(estacoes), 366, len(estatisticas)), np.nan),
+        'mensal': np.full((len(variaveis), len(estacoes), 12, len(estatisticas)), np.nan),
+    }
+    for v, variavel in enumerate(variaveis):
+        cubo['diario'][v], cubo['mensal'][v] = _normais_matriz(matrizes[variavel][estacoes], 'precipitacao' in variavel,
+                                                               janela, percentis, amostra_min,
+                                                               np.arange(366), np.arange(12), bloco)
+
+    return cubo
+
+
+def atualizar_cubo_normais(cubo: dict, matrizes: dict, datas_novas: pd.DatetimeIndex, bloco: int = 64) -> dict:
+    """
+    Atualização incremental do cubo de normais após uma sincronização: recalcula apenas os dias do ano, os meses e as estações afetados pelas novas datas.
+
+    :param cubo: Cubo de normais, ver cubo_normais.
+    :param matrizes: Dicionário {variavel: matriz diária (datas x estações)} já com os dados sincronizados.
+    :param datas_novas: Datas recebidas na sincronização.
+    :param bloco: Número de estações processadas por vez (controla o uso de memória).
+
+    :return: Cubo de normais atualizado (o mesmo objeto, modificado).
+    """
+
+    datas_novas = pd.DatetimeIndex(datas_novas)
+    meia = cubo['janela'] // 2
+    dias = np.unique((_posicao_dia_ano(datas_novas)[:, None] + np.arange(-meia, meia + 1)[None, :]) % 366)
+    meses = np.unique(datas_novas.month.to_numpy() - 1)
+    for v, variavel in enumerate(cubo['variaveis']):
+        matriz = matrizes[variavel].reindex(columns=cubo['estacoes'])
+        novos = matriz.reindex(datas_novas).notna().any(axis=0).to_numpy()
+        if not novos.any():
+            continue
+        diario, mensal = _normais_matriz(matriz.loc[:, novos], 'precipitacao' in variavel,
+                                         cubo['janela'], cubo['percentis'], cubo['amostra_min'],
+                                         dias, meses, bloco)
+        indices = np.flatnonzero(novos)
+        cubo['diario'][v][np.ix_(indices, dias)] = diario
+        cubo['mensal'][v][np.ix_(indices, meses)] = mensal
+
+    return cubo
+
+
+def _percentil_estimado(valores: np.ndarray, quantis: np.ndarray, niveis: np.ndarray) -> np.ndarray:
+    """
+    Percentil de cada valor por interpolação linear entre os quantis da sua linha (vetorizado em todas as linhas).
+    Em quantis empatados (ex.: vários percentis iguais a 0 mm em meses secos) o valor recebe o menor percentil do empate, e não o ponto médio como em np.interp.
+
+    :param valores: Valores observados (n).
+    :param quantis: Quantis de cada linha em ordem crescente (n x len(niveis)).
+    :param niveis: Percentis correspondentes aos quantis (0 a 100).
+
+    :return: Percentil estimado de cada valor, limitado ao primeiro e ao último nível; NaN quando o valor ou algum quantil da linha não é finito.
+    """
+
+    # Número de quantis estritamente menores que o valor: o valor fica entre quantis[k - 1] < valor <= quantis[k]
+    k = np.sum(quantis < valores[:, None], axis=1)
+    linhas = np.arange(len(valores))
+    anterior = np.maximum(k - 1, 0)
+    posterior = np.minimum(k, len(niveis) - 1)
+    q_0, q_1 = quantis[linhas, anterior], quantis[linhas, posterior]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fracao = np.where(q_1 > q_0, (valores - q_0) / (q_1 - q_0), 1.0)
+    percentil = niveis[anterior] + (niveis[posterior] - niveis[anterior]) * fracao
+    percentil = np.where(k == 0, niveis[0], percentil)
+    validos = np.isfinite(valores) & np.isfinite(quantis).all(axis=1)
+
+    return np.where(validos, percentil, np.nan)
+
+
+def anomalia_periodo(cubo: dict, matriz: pd.DataFrame, codigo_estacao: str, inicio, fim, variavel: str = 'precipitacao total diaria (mm)') -> pd.DataFrame:
+    """
+    Consulta de anomalias diárias de uma estação em um período, por busca direta no cubo de normais.
+
+    :param cubo: Cubo de normais, ver cubo_normais.
+    :param matriz: Matriz diária (datas x estações) da variável consultada.
+    :param codigo_estacao: Código da estação (ex.: 'A001').
+    :param inicio: Data inicial do período.
+    :param fim: Data final do período.
+    :param variavel: Variável consultada (deve estar no cubo).
+
+    :return: Valores observados, normais do dia do ano, anomalia, anomalia padronizada e percentil estimado do valor observado.
+    """
+
+    v = cubo['variaveis'].index(variavel)
+    s = cubo['estacoes'].index(codigo_estacao)
+    observado = matriz[codigo_estacao].loc[inicio:fim]
+    normais = cubo['diario'][v, s, _posicao_dia_ano(observado.index)]
+
+    df = pd.DataFrame(normais, index=observado.index, columns=cubo['estatisticas'])
+    df.insert(0, 'valor', observado.to_numpy(dtype=float))
+    df['anomalia'] = df['valor'] - df['media']
+    df['anomalia padronizada'] = df['anomalia'] / df['desvio']
+    df['percentil estimado'] = _percentil_estimado(df['valor'].to_numpy(), normais[:, 2:], np.asarray(cubo['percentis'], dtype=float))
+
+    return df
+
+
+def indice_eventos(matriz: pd.DataFrame, limiar_mm: float = None, tempo_retorno: float = None, duracoes: tuple = (1, 2, 3, 5), metadados: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Índice de eventos extremos: varre uma única vez a precipitação diária de todas as estações e registra as excedências de limiar para acumulados de 1 ou mais dias.
+
+    :param matriz: Matriz diária de precipitação (datas x estações), ver matriz_estacoes.
+    :param limiar_mm: Limiar fixo (mm) aplicado a todas as estações e durações.
+    :param tempo_retorno: Tempo de retorno (anos) cuja precipitação máxima (calcular_hmax sobre as máximas anuais de cada duração) é usada como limiar por estação.
+    :param duracoes: Durações (dias) dos acumulados avaliados.
+    :param metadados: Metadados indexados por 'codigo_estacao' (ver ler_dados_pasta). Quando informado, acrescenta latitude e longitude para consultas espaciais.
+
+    :return: Tabela de eventos ordenada por 'data' e 'codigo_estacao' ('data' é o último dia do acumulado), com o limiar, o excesso e o tempo de retorno estimado de cada evento.
+    """
+
+    if (limiar_mm is None) == (tempo_retorno is None):
+        raise ValueError("Informe exatamente um entre 'limiar_mm' e 'tempo_retorno'.")
+
+    datas = matriz.index.to_numpy()
+    estacoes = matriz.columns.to_numpy()
+    tabelas = []
+    for duracao in duracoes:
+        acumulado = matriz.rolling(duracao, min_periods=duracao).sum()
+
+        # Ajuste de Gumbel das máximas anuais do acumulado (mesma formulação de calcular_hmax)
+        maximas = acumulado.groupby(acumulado.index.year).max()
+        mu = maximas.mean().to_numpy()
+        sigma = maximas.std().to_numpy()
+        if tempo_retorno is not None:
+            limiar = calcular_hmax(mu, sigma, tempo_retorno)
+        else:
+            limiar = np.full(len(estacoes), float(limiar_mm))
+
+        valores = acumulado.to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'):
+            linhas, colunas = np.nonzero(valores > limiar[None, :])
+        precipitacao = valores[linhas, colunas]
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            y = np.exp(-((precipitacao - mu[colunas]) / sigma[colunas] + 0.45) / 0.7797)
+            tr_estimado = 1 / (1 - np.exp(-y))
+        tabelas.append(pd.DataFrame({
+            'data': datas[linhas],
+            'codigo_estacao': estacoes[colunas],
+            'duracao (dias)': duracao,
+            'precipitacao (mm)': precipitacao,
+            'limiar (mm)': limiar[colunas],
+            'excesso (mm)': precipitacao - limiar[colunas],
+            'tempo de retorno estimado (anos)': tr_estimado,
+        }))
+
+    eventos = pd.concat(tabelas, ignore_index=True)
+    if metadados is not None:
+        eventos['latitude'] = eventos['codigo_estacao'].map(metadados['latitude'])
+        eventos['longitude'] = eventos['codigo_estacao'].map(metadados['longitude'])
+    eventos = eventos.sort_values(['data', 'codigo_estacao', 'duracao (dias)'], kind='mergesort', ignore_index=True)
+
+    return eventos
+
+
+def consultar_eventos(eventos: pd.DataFrame, inicio=None, fim=None, estacoes: list = None, limites: tuple = None, duracao: int = None, tempo_retorno_min: float = None) -> pd.DataFrame:
+    """
+    Consulta ao índice de eventos extremos sem reprocessar as séries diárias.
+
+    :param eventos: Tabela de eventos, ver indice_eventos.
+    :param inicio: Data inicial (inclusive).
+    :param fim: Data final (inclusive).
+    :param estacoes: Códigos das estações de interesse (ex.: estações de uma UF).
+    :param limites: Região retangular (lat_min, lat_max, lon_min, lon_max). Exige latitude e longitude na tabela.
+    :param duracao: Duração (dias) do acumulado.
+    :param tempo_retorno_min: Tempo de retorno estimado mínimo (anos).
+
+    :return: Eventos que atendem a todos os filtros informados.
+    """
+
+    # Recorte temporal por busca binária na coluna ordenada de datas
+    datas = eventos['data'].to_numpy()
+    i_0 = 0 if inicio is None else np.searchsorted(datas, np.datetime64(pd.Timestamp(inicio)), side='left')
+    i_1 = len(datas) if fim is None else np.searchsorted(datas, np.datetime64(pd.Timestamp(fim)), side='right')
+    selecao = eventos.iloc[i_0:i_1]
+
+    filtro = np.ones(len(selecao), dtype=bool)
+    if estacoes is not None:
+        filtro &= selecao['codigo_estacao'].isin(estacoes).to_numpy()
+    if limites is not None:
+        if 'latitude' not in selecao.columns:
+            raise ValueError("A tabela de eventos não possui coordenadas; gere-a com 'metadados'.")
+        lat_min, lat_max, lon_min, lon_max = limites
+        filtro &= selecao['latitude'].between(lat_min, lat_max).to_numpy()
+        filtro &= selecao['longitude'].between(lon_min, lon_max).to_numpy()
+    if duracao is not None:
+        filtro &= (selecao['duracao (dias)'] == duracao).to_numpy()
+    if tempo_retorno_min is not None:
+        filtro &= (selecao['tempo de retorno estimado (anos)'] >= tempo_retorno_min).to_numpy()
+
+    return selecao[filtro]
@@ -1,6 +1,6 @@
 """
 Módulo de funções hidrológicas para uso em aplicativos Streamlit
-Inclui cálculo de SPI, IDF, hmax, desagregação de precipitação e ajuste de parâmetros IDF
+Inclui cálculo de SPI, SPEI, IDF, hmax, desagregação de precipitação e ajuste de parâmetros IDF
 """
 import tempfile
 import numpy as np
@@ -235,6 +235,153 @@ def indice_spi(df_inmet):
     return spi_df, estatisticas_df
 
 
+def agregacao_mensal(matriz, escala=1, dias_min=20):
+    """
+    Soma mensal (acumulada em 'escala' meses) de uma matriz diária (datas x estações).
+    Meses com menos de 'dias_min' dias registrados ficam como NaN.
+    """
+    mensal = matriz.resample('MS').sum(min_count=dias_min)
+    if escala > 1:
+        mensal = mensal.rolling(escala, min_periods=escala).sum()
+    return mensal
+
+
+def momentos_ponderados(amostras):
+    """
+    Momentos ponderados por probabilidade não enviesados (b0, b1, b2) ao longo do eixo 0,
+    ignorando NaN. Retorna também o tamanho de cada amostra.
+    """
+    ordenadas = np.sort(amostras, axis=0)  # NaN ficam no final
+    n = np.sum(~np.isnan(amostras), axis=0)
+    i = np.arange(ordenadas.shape[0]).reshape((-1,) + (1,) * (ordenadas.ndim - 1))
+    validos = i < n
+    x = np.where(validos, ordenadas, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        b0 = x.sum(axis=0) / n
+        b1 = (x * i / (n - 1)).sum(axis=0) / n
+        b2 = (x * i * (i - 1) / ((n - 1) * (n - 2))).sum(axis=0) / n
+    return b0, b1, b2, n
+
+
+def ajuste_gama_lmomentos(b0, b1):
+    """
+    Parâmetros da distribuição gama (alpha, beta) pelos L-momentos (Hosking, 1990), vetorizado.
+    Aproximações racionais da forma alpha em função de t = l2/l1 conforme a rotina PELGAM de Hosking.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (2 * b1 - b0) / b0
+        z = np.where(t < 0.5, np.pi * t ** 2, 1 - t)
+        alpha = np.where(t < 0.5,
+                         (1 - 0.3080 * z) / (z - 0.05812 * z ** 2 + 0.01765 * z ** 3),
+                         (0.7213 * z - 0.5947 * z ** 2) / (1 - 2.1817 * z + 1.2113 * z ** 2))
+        alpha = np.where((t > 0) & (t < 1) & (b0 > 0), alpha, np.nan)
+        beta = b0 / alpha
+    return alpha, beta
+
+
+def ajuste_loglogistica_lmomentos(b0, b1, b2):
+    """
+    Parâmetros da distribuição log-logística de 3 parâmetros, na parametrização logística
+    generalizada de Hosking (kappa, alpha, xi), pelos L-momentos, vetorizado.
+    Aceita assimetria positiva e negativa, ao contrário da forma original de Vicente-Serrano et al. (2010).
+    """
+    l1, l2, l3 = b0, 2 * b1 - b0, 6 * b2 - 6 * b1 + b0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kappa = -l3 / l2
+        kappa = np.where((np.abs(kappa) < 1) & (l2 > 0), kappa, np.nan)
+        k_pi = np.where(np.abs(kappa) < 1e-6, 1.0, kappa * np.pi)
+        razao = np.where(np.abs(kappa) < 1e-6, 1.0, np.sin(k_pi) / k_pi)
+        alpha = l2 * razao
+        xi = l1 - np.where(np.abs(kappa) < 1e-6, 0.0, alpha * (1 / kappa - 1 / razao / kappa))
+    return kappa, alpha, xi
+
+
+def cdf_loglogistica(x, kappa, alpha, xi):
+    """
+    Função de distribuição acumulada da log-logística de 3 parâmetros (logística generalizada), vetorizada.
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        pequeno = np.abs(kappa) < 1e-6
+        argumento = 1 - kappa * (x - xi) / alpha
+        y = np.where(pequeno, (x - xi) / alpha, -np.log(np.where(argumento > 0, argumento, 1.0)) / np.where(pequeno, 1.0, kappa))
+        cdf = 1 / (1 + np.exp(-y))
+        # Fora do suporte: acima do limite superior (kappa > 0) ou abaixo do inferior (kappa < 0)
+        cdf = np.where(~pequeno & (argumento <= 0), np.where(kappa > 0, 1.0, 0.0), cdf)
+    return np.where(np.isnan(kappa) | np.isnan(x), np.nan, cdf)
+
+
+def indices_seca_lote(precipitacao, et0=None, escalas=(1, 3, 6, 12), dias_min=20, n_min=10):
+    """
+    Calcula SPI (gama com probabilidade de zeros) e, se 'et0' for informado, SPEI (log-logística sobre P - ET0)
+    para todas as estações e escalas de tempo em uma única passagem vetorizada.
+    Os parâmetros de cada mês do calendário são ajustados pelos L-momentos, que compartilham
+    o mesmo cálculo de momentos ponderados para os dois índices.
+
+    precipitacao: matriz diária (datas x estações) de precipitação (mm).
+    et0: matriz diária (datas x estações) de evapotranspiração de referência (mm), opcional.
+
+    Retorna:
+        indices: DataFrame mensal com colunas (índice, escala, estação).
+        parametros: DataFrame longo com os parâmetros ajustados por índice, escala, estação e mês.
+    """
+    series = {'SPI': precipitacao}
+    if et0 is not None:
+        et0 = et0.reindex(index=precipitacao.index, columns=precipitacao.columns)
+        series['SPEI'] = precipitacao - et0
+
+    # Agregação mensal de todas as combinações (índice, escala) lado a lado
+    blocos, chaves = [], []
+    for indice, matriz in series.items():
+        for escala in escalas:
+            blocos.append(agregacao_mensal(matriz, escala, dias_min))
+            chaves.append((indice, escala))
+    mensal = pd.concat(blocos, axis=1, keys=chaves, names=['índice', 'escala', 'estação'])
+    meses = mensal.index
+
+    # Reorganização por mês do calendário: (anos, 12, colunas)
+    primeiro_ano = meses[0].year
+    n_anos = meses[-1].year - primeiro_ano + 1
+    pos = (meses.year - primeiro_ano) * 12 + meses.month - 1
+    valores = np.full((n_anos * 12, mensal.shape[1]), np.nan)
+    valores[pos] = mensal.to_numpy(dtype=float)
+    valores = valores.reshape(n_anos, 12, -1)
+
+    e_spi = (mensal.columns.get_level_values('índice') == 'SPI')[None, None, :]
+    positivos = np.where(e_spi & (valores <= 0), np.nan, valores)
+    b0, b1, b2, n = momentos_ponderados(positivos)
+    n_total = np.sum(~np.isnan(valores), axis=0)
+
+    # SPI: gama ajustada aos valores positivos, com probabilidade de zeros
+    alpha_g, beta_g = ajuste_gama_lmomentos(b0, b1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        q_zeros = 1 - n / n_total
+        cdf_spi = q_zeros + (1 - q_zeros) * gamma.cdf(np.maximum(valores, 0), alpha_g, scale=beta_g)
+
+    # SPEI: log-logística de 3 parâmetros sobre o balanço hídrico
+    kappa_l, alpha_l, xi_l = ajuste_loglogistica_lmomentos(b0, b1, b2)
+    cdf_spei = cdf_loglogistica(valores, kappa_l, alpha_l, xi_l)
+
+    cdf = np.where(e_spi, cdf_spi, cdf_spei)
+    cdf = np.where((n >= n_min) & ~np.isnan(valores), np.clip(cdf, 1e-10, 1 - 1e-10), np.nan)
+    indices = pd.DataFrame(norm.ppf(cdf).reshape(n_anos * 12, -1)[pos], index=meses, columns=mensal.columns)
+    indices.index.name = 'AnoMes'
+
+    # Parâmetros ajustados por mês do calendário
+    parametros = pd.DataFrame({
+        'índice': np.tile(mensal.columns.get_level_values('índice'), 12),
+        'escala': np.tile(mensal.columns.get_level_values('escala'), 12),
+        'estação': np.tile(mensal.columns.get_level_values('estação'), 12),
+        'Mês': np.repeat(np.arange(1, 13), mensal.shape[1]),
+        'n': n.ravel(),
+        'q (zeros)': np.where(e_spi[0], q_zeros, np.nan).ravel(),
+        'Forma': np.where(e_spi[0], alpha_g, kappa_l).ravel(),
+        'Escala': np.where(e_spi[0], beta_g, alpha_l).ravel(),
+        'Posição': np.where(e_spi[0], 0.0, xi_l).ravel(),
+    })
+
+    return indices, parametros
+
+
 def save_figure_temp(fig):
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
     fig.savefig(temp_file.name)
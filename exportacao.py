@@ -0,0 +1,532 @@
+"""
+Módulo de exportação de resultados das estações BDMEP para uso em aplicativos Streamlit
+Inclui a geração do pacote ZIP de SPI + IDF com processamento paralelo das estações e escrita contínua em disco,
+o ZIP de dados brutos e a escrita de tabelas em Excel, Parquet, CSV compactado e Feather
+"""
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import uuid
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import TICKDOWN
+from matplotlib.transforms import blended_transform_factory
+from openpyxl import Workbook
+from sklearn.metrics import r2_score
+
+from codigos_hidro import indice_spi, calculo_precipitacoes, problema_inverso_idf
+import instrumentacao
+from instrumentacao import coletar, etapa, incorporar
+
+
+def separar_rotulo(rotulo):
+    """
+    Separa um rótulo 'NOME (CODIGO)' em nome da cidade e código da estação.
+    """
+    nome_cidade, cod_estacao = rotulo.split(" (")
+    return nome_cidade, cod_estacao.replace(")", "").strip()
+
+
+FORMATOS_TABELA = {
+    'xlsx': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'csv.gz': ('.csv.gz', 'application/gzip'),
+    'feather': ('.feather', 'application/vnd.apache.arrow.file'),
+}
+
+
+def escrever_excel(df):
+    """
+    Escreve uma tabela em Excel com memória constante e retorna os bytes do arquivo.
+    Usa o xlsxwriter em modo 'constant_memory' quando instalado; caso contrário, o openpyxl em modo 'write_only'
+    (linhas gravadas em sequência, sem estilos por célula).
+    """
+    buffer = io.BytesIO()
+    try:
+        import xlsxwriter  # noqa: F401
+    except ImportError:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append([str(col) for col in df.columns])
+        for linha in df.astype(object).where(df.notna(), None).itertuples(index=False, name=None):
+            ws.append(linha)
+        wb.save(buffer)
+    else:
+        with pd.ExcelWriter(buffer, engine='xlsxwriter', engine_kwargs={'options': {'constant_memory': True}}) as writer:
+            df.to_excel(writer, index=False)
+    return buffer.getvalue()
+
+
+def escrever_tabela(df, formato='xlsx'):
+    """
+    Escreve uma tabela no formato escolhido ('xlsx', 'parquet', 'csv.gz' ou 'feather') e retorna os bytes do arquivo.
+    Parquet e Feather exigem o pyarrow.
+    """
+    if formato not in FORMATOS_TABELA:
+        raise ValueError(f"Formato '{formato}' inválido. Use um de: {', '.join(FORMATOS_TABELA)}.")
+    with etapa(f"escrever_{formato}", linhas=len(df)):
+        if formato == 'xlsx':
+            return escrever_excel(df)
+        buffer = io.BytesIO()
+        if formato == 'parquet':
+            df.to_parquet(buffer, index=False)
+        elif formato == 'csv.gz':
+            df.to_csv(buffer, index=False, compression={'method': 'gzip', 'compresslevel': 6, 'mtime': 0})
+        else:
+            df.reset_index(drop=True).to_feather(buffer)
+        return buffer.getvalue()
+
+
+def nome_arquivo_tabela(nome, formato='xlsx'):
+    """
+    Nome do arquivo com a extensão do formato de tabela.
+    """
+    return f"{nome}{FORMATOS_TABELA[formato][0]}"
+
+
+EXTENSOES_COMPACTADAS = ('.png', '.xlsx', '.parquet', '.csv.gz', '.feather')
+
+
+def tipo_compressao(nome):
+    """
+    Tipo de compressão do membro no ZIP: artefatos já compactados (PNG, Excel, Parquet, CSV-gz, Feather) são
+    armazenados sem recompressão; os demais (texto) são comprimidos com deflate.
+    """
+    return zipfile.ZIP_STORED if nome.endswith(EXTENSOES_COMPACTADAS) else zipfile.ZIP_DEFLATED
+
+
+# Alterar quando o cálculo (SPI, IDF), o gráfico ou a escrita das tabelas mudar, para invalidar os artefatos em cache
+VERSAO_ARTEFATOS = 1
+
+
+def versao_dados(df, *extras):
+    """
+    Versão (hash curto) do conteúdo de uma tabela, de valores extras que também alteram os artefatos (ex.: nome da
+    estação) e de VERSAO_ARTEFATOS.
+    """
+    h = hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    h.update("\x1f".join(str(v) for v in [VERSAO_ARTEFATOS, *df.columns, *extras]).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+class CacheArtefatos:
+    """
+    Cache em disco dos artefatos prontos de cada estação, indexado pelo código da estação e pela versão dos dados
+    (que inclui VERSAO_ARTEFATOS, então uma mudança no código que gera os artefatos invalida o cache).
+    Cada versão fica em '<diretorio>/<codigo>/<versao>/'; ao gravar uma versão nova, as anteriores da estação são removidas.
+    Cada arquivo é publicado com os.replace, então o cache pode ser compartilhado entre sessões, threads e processos.
+    """
+
+    def __init__(self, diretorio=None):
+        self.diretorio = diretorio or os.path.join(tempfile.gettempdir(), "bdmep_artefatos")
+
+    def ler(self, cod_estacao, versao, nomes):
+        """
+        Retorna {nome: bytes} dos artefatos pedidos, ou None se algum deles não estiver no cache.
+        """
+        pasta = os.path.join(self.diretorio, cod_estacao, versao)
+        artefatos = {}
+        try:
+            for nome in nomes:
+                with open(os.path.join(pasta, nome), "rb") as f:
+                    artefatos[nome] = f.read()
+        except FileNotFoundError:
+            return None
+        return artefatos
+
+    def gravar(self, cod_estacao, versao, artefatos):
+        """
+        Grava os artefatos {nome: bytes ou str} da versão e remove as versões antigas da estação.
+        """
+        pasta_estacao = os.path.join(self.diretorio, cod_estacao)
+        pasta = os.path.join(pasta_estacao, versao)
+        os.makedirs(pasta, exist_ok=True)
+        for nome, conteudo in artefatos.items():
+            if isinstance(conteudo, str):
+                conteudo = conteudo.encode("utf-8")
+            caminho = os.path.join(pasta, nome)
+            # Nome único por escrita: várias threads do mesmo processo podem gravar a mesma estação e versão
+            temporario = f"{caminho}.{uuid.uuid4().hex}.tmp"
+            with open(temporario, "wb") as f:
+                f.write(conteudo)
+            os.replace(temporario, caminho)
+        for antiga in os.listdir(pasta_estacao):
+            if antiga != versao:
+                shutil.rmtree(os.path.join(pasta_estacao, antiga), ignore_errors=True)
+
+
+def codificar_png(rgba, nivel=1):
+    """
+    Codifica uma imagem RGBA (altura x largura x 4, uint8) em PNG sem filtros de linha e com compressão zlib rápida.
+    Os gráficos têm grandes áreas uniformes, então dispensar os filtros adaptativos quase não altera o tamanho.
+    """
+    altura, largura, _ = rgba.shape
+    linhas = np.zeros((altura, largura * 4 + 1), dtype=np.uint8)
+    linhas[:, 1:] = rgba.reshape(altura, -1)
+
+    def bloco(tipo, dados):
+        return struct.pack('>I', len(dados)) + tipo + dados + struct.pack('>I', zlib.crc32(tipo + dados))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + bloco(b'IHDR', struct.pack('>IIBBBBB', largura, altura, 8, 6, 0, 0, 0))
+            + bloco(b'IDAT', zlib.compress(linhas.tobytes(), nivel))
+            + bloco(b'IEND', b''))
+
+
+class RenderizadorSPI:
+    """
+    Renderizador reutilizável do gráfico de SPI sobre uma única figura Agg.
+    Os elementos fixos (eixos, rótulo, linha do zero) são desenhados uma vez por faixa do eixo y e guardados como
+    fundo; a cada estação o fundo é restaurado e apenas a série, o título e os rótulos dos meses são redesenhados,
+    sem figuras do pyplot, sem tight_layout e sem o cálculo da caixa justa do savefig.
+    """
+
+    faixas_y = (3.5, 5.0, 7.0)
+
+    def __init__(self, largura=12, altura=4, dpi=100, n_rotulos=12):
+        self.figura = Figure(figsize=(largura, altura), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figura)
+        self.ax = self.figura.add_subplot()
+        self.figura.subplots_adjust(left=0.06, right=0.99, top=0.92, bottom=0.22)
+        self.ax.axhline(0, color="black", linestyle="--")
+        self.ax.set_ylabel("SPI")
+        self.ax.set_xticks([])
+        self.linha, = self.ax.plot([], [], marker="o", animated=True)
+        self.titulo = self.ax.set_title("", animated=True)
+
+        # Marcas e rótulos do eixo x desenhados manualmente (x em dados, y em coordenadas do eixo)
+        transformacao = blended_transform_factory(self.ax.transData, self.ax.transAxes)
+        self.marcas, = self.ax.plot([], [], linestyle="", marker=TICKDOWN, color="black", markersize=3.5,
+                                    transform=transformacao, clip_on=False, animated=True)
+        self.rotulos = [self.ax.text(0, -0.03, "", transform=transformacao, rotation=45, ha="right", va="top",
+                                     rotation_mode="anchor", fontsize=rcParams["xtick.labelsize"], animated=True)
+                        for _ in range(n_rotulos)]
+        self.fundos = {}
+
+    def _fundo(self, limite):
+        """
+        Fundo (elementos fixos) já rasterizado para a faixa simétrica [-limite, limite] do eixo y.
+        """
+        if limite not in self.fundos:
+            self.ax.set_ylim(-limite, limite)
+            self.canvas.draw()
+            self.fundos[limite] = self.canvas.copy_from_bbox(self.figura.bbox)
+        return self.fundos[limite]
+
+    def renderizar(self, spi_df, titulo):
+        """
+        Desenha o SPI mensal ('AnoMes', 'SPI') e retorna o PNG em bytes.
+        """
+        n = len(spi_df)
+        spi = spi_df["SPI"].to_numpy(dtype=float)
+        extremo = np.nanmax(np.abs(spi), initial=0.0)
+        limite = next((f for f in self.faixas_y if extremo * 1.05 <= f), max(self.faixas_y[-1], extremo * 1.05))
+
+        self.canvas.restore_region(self._fundo(limite))
+        self.ax.set_ylim(-limite, limite)
+        self.ax.set_xlim(-0.05 * max(n - 1, 1), (n - 1) + 0.05 * max(n - 1, 1))
+
+        # Rótulos formatados apenas para os meses exibidos no eixo; o passo garante no máximo um rótulo por texto do conjunto
+        passo = max(1, math.ceil(n / len(self.rotulos)))
+        posicoes = np.arange(0, n, passo)
+        self.marcas.set_data(posicoes, np.zeros(len(posicoes)))
+        for rotulo, posicao, texto in zip(self.rotulos, posicoes, spi_df["AnoMes"].iloc[posicoes]):
+            rotulo.set_x(posicao)
+            rotulo.set_text(str(texto))
+            self.ax.draw_artist(rotulo)
+        self.linha.set_data(np.arange(n), spi)
+        self.titulo.set_text(titulo)
+        for artista in (self.marcas, self.linha, self.titulo):
+            self.ax.draw_artist(artista)
+
+        return codificar_png(np.asarray(self.canvas.buffer_rgba()))
+
+
+_renderizadores = threading.local()
+
+
+def renderizar_spi(spi_df, titulo):
+    """
+    Renderiza o gráfico de SPI com o renderizador da thread atual (criado na primeira chamada), já que a figura
+    não pode ser desenhada por duas tarefas ao mesmo tempo.
+    """
+    renderizador = getattr(_renderizadores, 'renderizador', None)
+    if renderizador is None:
+        renderizador = _renderizadores.renderizador = RenderizadorSPI()
+    return renderizador.renderizar(spi_df, titulo)
+
+
+def analisar_estacao(nome_cidade, cod_estacao, df_estacao, formato='xlsx'):
+    """
+    Executa SPI, IDF e o gráfico do SPI de uma estação e devolve os arquivos prontos para o ZIP.
+    Função de nível de módulo para poder ser executada em processos auxiliares.
+    Retorna os artefatos {nome do arquivo: conteúdo} e a linha do resumo de R², ou None se a estação não tiver dados.
+    """
+    col_data = next((col for col in df_estacao.columns if "data" in col.lower()), None)
+    col_prec = next((col for col in df_estacao.columns if "precip" in col.lower()), None)
+    if not col_data or not col_prec:
+        return None
+
+    df_spi = df_estacao[[col_data, col_prec]].copy()
+    df_spi.columns = ['Data Medição', 'Precipitação Total Diária (mm)']
+
+    with etapa('indice_spi', cod_estacao, len(df_spi)):
+        spi_df, estatisticas_spi = indice_spi(df_spi)
+    with etapa('calculo_precipitacoes', cod_estacao, len(df_estacao)):
+        _, _, _, df_longo, _, _ = calculo_precipitacoes(df_estacao)
+    with etapa('problema_inverso_idf', cod_estacao, len(df_longo)):
+        a, b, c, d = problema_inverso_idf(df_longo)
+
+    with etapa('renderizar_spi', cod_estacao, len(spi_df)):
+        grafico_spi = renderizar_spi(spi_df, f"SPI - {nome_cidade} ({cod_estacao})")
+
+    txt_idf = f"""Parâmetros IDF ajustados para {nome_cidade} ({cod_estacao}):
+
+a = {a:.6f}
+b = {b:.6f}
+c = {c:.6f}
+d = {d:.6f}
+"""
+
+    r2_por_tr = {}
+    for tr_val, grupo in df_longo.groupby('tr'):
+        td_tr = grupo['td (min)'].astype(str).str.replace(',', '.', regex=False).astype(float).values
+        y_true = grupo['y_obs (mm/h)'].values
+        y_pred = (a * tr_val ** b) / ((td_tr + c) ** d)
+        r2_por_tr[f"r2 (tr curva {int(tr_val)} anos)"] = r2_score(y_true, y_pred)
+    r2_medio = sum(r2_por_tr.values()) / len(r2_por_tr)
+
+    with etapa('escrever_tabelas', cod_estacao):
+        artefatos = {
+            "spi_grafico.png": grafico_spi,
+            nome_arquivo_tabela("estatisticas_spi", formato): escrever_tabela(estatisticas_spi, formato),
+            "parametros_idf.txt": txt_idf.encode("utf-8"),
+        }
+    resumo = {
+        "Estação": nome_cidade,
+        "Código": cod_estacao,
+        "a": float(a), "b": float(b), "c": float(c), "d": float(d),
+        **{chave: float(valor) for chave, valor in r2_por_tr.items()},
+        "r2 médio": float(r2_medio)
+    }
+    return artefatos, resumo
+
+
+def nomes_artefatos_spi_idf(formato='xlsx'):
+    """
+    Nomes dos artefatos de SPI + IDF de uma estação no cache (inclui o resumo de R² em JSON).
+    """
+    return ["spi_grafico.png", nome_arquivo_tabela("estatisticas_spi", formato), "parametros_idf.txt", "resumo_idf.json"]
+
+
+def pasta_estacao(nome_cidade, cod_estacao):
+    """
+    Nome da pasta (ou prefixo de arquivo) da estação dentro do ZIP.
+    """
+    return f"{nome_cidade.strip().replace(' ', '_')}_{cod_estacao}"
+
+
+def _analisar_estacao_medida(*tarefa):
+    """
+    Executa analisar_estacao em um processo auxiliar e devolve também os registros de instrumentação do processo.
+    Se a estação falhar, os registros seguem com a exceção (atributo 'registros_instrumentacao').
+    """
+    try:
+        with etapa('analisar_estacao', tarefa[1]):
+            resultado = analisar_estacao(*tarefa)
+    except Exception as erro:
+        erro.registros_instrumentacao = coletar()
+        raise
+    return resultado, coletar()
+
+
+def _executar_serial(tarefas):
+    """
+    Gera os resultados das tarefas no próprio processo, na ordem de entrada.
+    """
+    for i, tarefa in enumerate(tarefas):
+        try:
+            with etapa('analisar_estacao', tarefa[1]):
+                resultado = analisar_estacao(*tarefa)
+            yield i, resultado, None
+        except Exception as e:
+            yield i, None, e
+
+
+def _executar_paralelo(tarefas, workers, em_voo, contexto_processos=None):
+    """
+    Gera os resultados das tarefas à medida que os processos auxiliares terminam.
+    Mantém no máximo 'em_voo' estações em processamento para limitar a memória.
+    'contexto_processos' é o contexto de multiprocessing do pool (None usa o padrão da plataforma).
+    """
+    with ProcessPoolExecutor(max_workers=workers, mp_context=contexto_processos,
+                             initializer=instrumentacao.ativar, initargs=instrumentacao.estado()) as executor:
+        fila = iter(enumerate(tarefas))
+        pendentes = {}
+
+        def submeter():
+            proxima = next(fila, None)
+            if proxima is not None:
+                i, tarefa = proxima
+                pendentes[executor.submit(_analisar_estacao_medida, *tarefa)] = i
+
+        for _ in range(em_voo):
+            submeter()
+        while pendentes:
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                i = pendentes.pop(futuro)
+                erro = futuro.exception()
+                resultado = None
+                if erro is None:
+                    resultado, registros = futuro.result()
+                else:
+                    registros = getattr(erro, 'registros_instrumentacao', [])
+                incorporar(registros)
+                yield i, resultado, erro
+                submeter()
+
+
+def gerar_zip_spi_idf(cidades_selecionadas, planilhas_completas, workers=None, ao_falhar=None, formato='xlsx', cache=None, ao_progresso=None, contexto_processos=None):
+    """
+    Gera o pacote ZIP com SPI, parâmetros IDF e gráfico de cada estação selecionada, mais o resumo de R².
+    As análises são executadas em um pool de processos ('workers'; 1 executa no próprio processo) e um único
+    escritor grava cada estação concluída diretamente no ZIP em disco, de modo que a memória fica limitada
+    a poucas estações por vez. 'ao_falhar(rotulo, erro)' é chamada para cada estação que falhar.
+    'formato' define o formato das tabelas (ver FORMATOS_TABELA). Com um CacheArtefatos em 'cache', estações
+    cujos dados não mudaram são montadas a partir dos artefatos já prontos, sem recalcular.
+    'ao_progresso(rotulo, erro)' é chamada ao fim de cada estação (erro é None em caso de sucesso).
+    'contexto_processos' é o contexto de multiprocessing do pool; use multiprocessing.get_context('spawn') quando a
+    chamada partir de um processo com várias threads (ex.: Streamlit), onde o fork pode travar em locks herdados.
+    Retorna o caminho do arquivo ZIP.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp_zip:
+        zip_path = tmp_zip.name
+
+    nomes_cache = nomes_artefatos_spi_idf(formato)
+    rotulos = []
+    pastas = []
+    versoes = []
+    tarefas = []
+    lista_resumo_r2 = {}
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_total:
+
+        def escrever_estacao(i, artefatos):
+            for nome, conteudo in artefatos.items():
+                if nome != "resumo_idf.json":
+                    zip_total.writestr(f"{pastas[i]}/{nome}", conteudo, compress_type=tipo_compressao(nome))
+
+        for entrada in cidades_selecionadas:
+            try:
+                nome_cidade, cod_estacao = separar_rotulo(entrada)
+            except ValueError as e:
+                if ao_falhar is not None:
+                    ao_falhar(entrada, e)
+                if ao_progresso is not None:
+                    ao_progresso(entrada, e)
+                continue
+            df_estacao = planilhas_completas.get(cod_estacao)
+            if df_estacao is None:
+                if ao_progresso is not None:
+                    ao_progresso(entrada, None)
+                continue
+            i = len(rotulos)
+            rotulos.append(entrada)
+            pastas.append(pasta_estacao(nome_cidade, cod_estacao))
+            versoes.append(versao_dados(df_estacao, nome_cidade) if cache is not None else None)
+
+            # Estações já em cache vão direto para o ZIP; as demais entram na fila de análise
+            artefatos = cache.ler(cod_estacao, versoes[i], nomes_cache) if cache is not None else None
+            if artefatos is not None:
+                escrever_estacao(i, artefatos)
+                lista_resumo_r2[i] = json.loads(artefatos["resumo_idf.json"])
+                if ao_progresso is not None:
+                    ao_progresso(entrada, None)
+            else:
+                tarefas.append((i, (nome_cidade, cod_estacao, df_estacao, formato)))
+
+        indices = [i for i, _ in tarefas]
+        tarefas = [tarefa for _, tarefa in tarefas]
+        if workers > 1 and len(tarefas) > 1:
+            resultados = _executar_paralelo(tarefas, min(workers, len(tarefas)), 2 * workers, contexto_processos)
+        else:
+            resultados = _executar_serial(tarefas)
+
+        for j, resultado, erro in resultados:
+            i = indices[j]
+            if ao_progresso is not None:
+                ao_progresso(rotulos[i], erro)
+            if erro is not None:
+                if ao_falhar is not None:
+                    ao_falhar(rotulos[i], erro)
+                continue
+            if resultado is None:
+                continue
+            artefatos, resumo = resultado
+            with etapa('gravar_zip', tarefas[j][1]):
+                escrever_estacao(i, artefatos)
+            lista_resumo_r2[i] = resumo
+            if cache is not None:
+                cache.gravar(tarefas[j][1], versoes[i], {**artefatos, "resumo_idf.json": json.dumps(resumo)})
+
+        # Salvar o resumo de R² no nível superior do ZIP, na ordem da seleção
+        if lista_resumo_r2:
+            df_resumo = pd.DataFrame([lista_resumo_r2[i] for i in sorted(lista_resumo_r2)])
+            nome_resumo = nome_arquivo_tabela("resumo_idf_r2", formato)
+            zip_total.writestr(nome_resumo, escrever_tabela(df_resumo, formato), compress_type=tipo_compressao(nome_resumo))
+
+    return zip_path
+
+
+def gerar_zip_dados_brutos(selecao_rotulada, planilhas_completas, formato='xlsx', cache=None, ao_progresso=None):
+    """
+    Gera um arquivo ZIP com os dados brutos das estações selecionadas, gravado diretamente em disco.
+    Remove colunas "Unnamed" antes de salvar. 'formato' define o formato das tabelas (ver FORMATOS_TABELA).
+    Com um CacheArtefatos em 'cache', a planilha de cada estação é reaproveitada enquanto os dados não mudarem.
+    'ao_progresso(rotulo, erro)' é chamada ao fim de cada estação.
+    Retorna o caminho do arquivo ZIP.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp_zip:
+        zip_path = tmp_zip.name
+
+    nome_cache = nome_arquivo_tabela("dados_brutos", formato)
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for rotulo in selecao_rotulada:
+            nome_cidade, cod_estacao = separar_rotulo(rotulo)
+
+            df = planilhas_completas.get(cod_estacao)
+            if df is not None:
+                versao = versao_dados(df, nome_cidade) if cache is not None else None
+                artefatos = cache.ler(cod_estacao, versao, [nome_cache]) if cache is not None else None
+                if artefatos is not None:
+                    conteudo = artefatos[nome_cache]
+                else:
+                    # Remove colunas extras tipo "Unnamed: x"
+                    df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
+                    with etapa('dados_brutos', cod_estacao, len(df)):
+                        conteudo = escrever_tabela(df, formato)
+                    if cache is not None:
+                        cache.gravar(cod_estacao, versao, {nome_cache: conteudo})
+
+                nome_arquivo = nome_arquivo_tabela(pasta_estacao(nome_cidade, cod_estacao), formato)
+                zip_file.writestr(nome_arquivo, conteudo, compress_type=tipo_compressao(nome_arquivo))
+            if ao_progresso is not None:
+                ao_progresso(rotulo, None)
+
+    return zip_path
@@ -0,0 +1,243 @@
+"""
+Fila local de tarefas em segundo plano para análises e exportações das estações BDMEP
+As tarefas ficam registradas em uma tabela SQLite persistente (estado, progresso por estação e arquivo de resultado)
+e são executadas fora da thread do Streamlit; as estações de cada tarefa são processadas no pool de processos dos exportadores,
+criado com 'spawn' porque o processo da fila tem várias threads (o fork de um processo com threads pode travar em locks herdados).
+Uso pela linha de comando: python fila_tarefas.py --pasta BD/dados/wander --tipo spi_idf --estacoes A001 A002
+"""
+import argparse
+import multiprocessing
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from catalogo import carregar_catalogo
+from exportacao import FORMATOS_TABELA, CacheArtefatos, gerar_zip_dados_brutos, gerar_zip_spi_idf
+
+TIPOS_TAREFA = {
+    'spi_idf': gerar_zip_spi_idf,
+    'dados_brutos': gerar_zip_dados_brutos,
+}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tarefas (
+    id TEXT PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    estado TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    concluidas INTEGER NOT NULL DEFAULT 0,
+    falhas INTEGER NOT NULL DEFAULT 0,
+    criada REAL NOT NULL,
+    iniciada REAL,
+    finalizada REAL,
+    atualizada REAL NOT NULL,
+    resultado TEXT,
+    erro TEXT,
+    pid INTEGER,
+    host TEXT
+);
+CREATE TABLE IF NOT EXISTS estacoes_tarefa (
+    id_tarefa TEXT NOT NULL,
+    rotulo TEXT NOT NULL,
+    estado TEXT NOT NULL,
+    erro TEXT,
+    PRIMARY KEY (id_tarefa, rotulo)
+);
+"""
+
+
+def _processo_ativo(pid):
+    """
+    Indica se o processo 'pid' desta máquina ainda existe. No Windows (onde os.kill encerraria o processo) devolve
+    sempre True e o abandono é detectado apenas pela falta de pulso.
+    """
+    if os.name == 'nt':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class FilaTarefas:
+    """
+    Executor de tarefas em segundo plano com tabela de tarefas persistente.
+    Estados da tarefa: 'na fila', 'executando', 'concluida', 'falhou' e 'interrompida' (processo encerrado durante a execução).
+    Estados de cada estação: 'pendente', 'concluida' e 'falhou'.
+    Cada tarefa guarda o PID e a máquina do processo dono, que renova 'atualizada' a cada 'intervalo_pulso' segundos
+    enquanto a tarefa está pendente. Ao abrir uma fila (e em listar), tarefas pendentes cujo processo dono terminou
+    (mesma máquina) ou sem pulso há mais de 'tempo_abandono' segundos são marcadas como interrompidas.
+    """
+
+    def __init__(self, banco=None, workers=None, tarefas_simultaneas=1, cache=None, tempo_abandono=120, intervalo_pulso=30):
+        self.banco = banco or os.path.join(tempfile.gettempdir(), "bdmep_tarefas.sqlite")
+        self.workers = workers
+        self.cache = cache
+        self.tempo_abandono = tempo_abandono
+        self.intervalo_pulso = intervalo_pulso
+        self._pid = os.getpid()
+        self._host = socket.gethostname()
+        self._trava = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=tarefas_simultaneas, thread_name_prefix="fila_tarefas")
+        self._pulso = None
+        with self._conectar() as con:
+            con.executescript(_ESQUEMA)
+            colunas = {linha[1] for linha in con.execute("PRAGMA table_info(tarefas)")}
+            for coluna, tipo in (('pid', 'INTEGER'), ('host', 'TEXT')):
+                if coluna not in colunas:
+                    con.execute(f"ALTER TABLE tarefas ADD COLUMN {coluna} {tipo}")
+        self.recuperar_abandonadas()
+
+    def _conectar(self):
+        return sqlite3.connect(self.banco, timeout=30)
+
+    def recuperar_abandonadas(self):
+        """
+        Marca como 'interrompida' as tarefas pendentes de processos que terminaram (mesma máquina) ou sem pulso há mais
+        de 'tempo_abandono' segundos. Tarefas abandonadas não são retomadas. Retorna o número de tarefas marcadas.
+        """
+        with self._trava, self._conectar() as con:
+            pendentes = con.execute("SELECT id, pid, host, atualizada FROM tarefas WHERE estado IN ('na fila', 'executando')").fetchall()
+            limite = time.time() - self.tempo_abandono
+            abandonadas = [(id_tarefa,) for id_tarefa, pid, host, atualizada in pendentes
+                           if atualizada < limite or (host == self._host and pid is not None and not _processo_ativo(pid))]
+            con.executemany("UPDATE tarefas SET estado = 'interrompida', erro = 'Processo da fila encerrado durante a execução.' WHERE id = ?",
+                            abandonadas)
+        return len(abandonadas)
+
+    def _pulsar(self):
+        while True:
+            time.sleep(self.intervalo_pulso)
+            self._executar_sql("UPDATE tarefas SET atualizada = ? WHERE pid = ? AND host = ? AND estado IN ('na fila', 'executando')",
+                               (time.time(), self._pid, self._host))
+
+    def _executar_sql(self, sql, parametros=()):
+        with self._trava, self._conectar() as con:
+            con.execute(sql, parametros)
+
+    def submeter(self, tipo, rotulos, planilhas_completas, **opcoes):
+        """
+        Registra uma tarefa ('spi_idf' ou 'dados_brutos') para os rótulos 'NOME (CODIGO)' e a coloca na fila.
+        'opcoes' são repassadas ao exportador (ex.: formato). Retorna o identificador da tarefa.
+        """
+        if tipo not in TIPOS_TAREFA:
+            raise ValueError(f"Tipo de tarefa '{tipo}' inválido. Use um de: {', '.join(TIPOS_TAREFA)}.")
+        rotulos = list(dict.fromkeys(rotulos))
+        id_tarefa = uuid.uuid4().hex[:12]
+        with self._trava, self._conectar() as con:
+            con.execute("INSERT INTO tarefas (id, tipo, estado, total, criada, atualizada, pid, host) VALUES (?, ?, 'na fila', ?, ?, ?, ?, ?)",
+                        (id_tarefa, tipo, len(rotulos), time.time(), time.time(), self._pid, self._host))
+            if self._pulso is None:
+                self._pulso = threading.Thread(target=self._pulsar, name="fila_tarefas_pulso", daemon=True)
+                self._pulso.start()
+            con.executemany("INSERT INTO estacoes_tarefa (id_tarefa, rotulo, estado) VALUES (?, ?, 'pendente')",
+                            [(id_tarefa, rotulo) for rotulo in rotulos])
+        self._executor.submit(self._executar, id_tarefa, tipo, rotulos, planilhas_completas, opcoes)
+        return id_tarefa
+
+    def _executar(self, id_tarefa, tipo, rotulos, planilhas_completas, opcoes):
+        self._executar_sql("UPDATE tarefas SET estado = 'executando', iniciada = ?, atualizada = ? WHERE id = ?",
+                           (time.time(), time.time(), id_tarefa))
+
+        def ao_progresso(rotulo, erro):
+            with self._trava, self._conectar() as con:
+                con.execute("UPDATE estacoes_tarefa SET estado = ?, erro = ? WHERE id_tarefa = ? AND rotulo = ?",
+                            ('falhou' if erro else 'concluida', str(erro) if erro else None, id_tarefa, rotulo))
+                con.execute(f"UPDATE tarefas SET {'falhas = falhas' if erro else 'concluidas = concluidas'} + 1, atualizada = ? WHERE id = ?",
+                            (time.time(), id_tarefa))
+
+        try:
+            if tipo == 'spi_idf':
+                opcoes.setdefault('workers', self.workers)
+                opcoes.setdefault('contexto_processos', multiprocessing.get_context('spawn'))
+            zip_path = TIPOS_TAREFA[tipo](rotulos, planilhas_completas, cache=self.cache, ao_progresso=ao_progresso, **opcoes)
+        except Exception as e:
+            self._executar_sql("UPDATE tarefas SET estado = 'falhou', erro = ?, finalizada = ?, atualizada = ? WHERE id = ?",
+                               (str(e), time.time(), time.time(), id_tarefa))
+        else:
+            self._executar_sql("UPDATE tarefas SET estado = 'concluida', resultado = ?, finalizada = ?, atualizada = ? WHERE id = ?",
+                               (zip_path, time.time(), time.time(), id_tarefa))
+
+    def consultar(self, id_tarefa):
+        """
+        Retorna o registro da tarefa como dicionário, ou None se não existir.
+        """
+        with self._conectar() as con:
+            con.row_factory = sqlite3.Row
+            linha = con.execute("SELECT * FROM tarefas WHERE id = ?", (id_tarefa,)).fetchone()
+        return dict(linha) if linha is not None else None
+
+    def progresso(self, id_tarefa):
+        """
+        Retorna a situação de cada estação da tarefa (rótulo, estado, erro).
+        """
+        with self._conectar() as con:
+            return pd.read_sql_query("SELECT rotulo, estado, erro FROM estacoes_tarefa WHERE id_tarefa = ? ORDER BY rowid",
+                                     con, params=(id_tarefa,))
+
+    def listar(self, limite=50):
+        """
+        Retorna as tarefas mais recentes.
+        """
+        self.recuperar_abandonadas()
+        with self._conectar() as con:
+            return pd.read_sql_query("SELECT * FROM tarefas ORDER BY criada DESC LIMIT ?", con, params=(limite,))
+
+    def aguardar(self, id_tarefa, intervalo=0.5, ao_atualizar=None):
+        """
+        Bloqueia até a tarefa terminar; 'ao_atualizar(registro)' é chamada a cada consulta. Retorna o registro final.
+        """
+        while True:
+            registro = self.consultar(id_tarefa)
+            if ao_atualizar is not None:
+                ao_atualizar(registro)
+            if registro['estado'] not in ('na fila', 'executando'):
+                return registro
+            time.sleep(intervalo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa uma tarefa de exportação BDMEP pela fila de tarefas.")
+    parser.add_argument("--pasta", required=True, help="Pasta (ou ZIP) com os arquivos CSV do BDMEP.")
+    parser.add_argument("--tipo", choices=list(TIPOS_TAREFA), default="spi_idf")
+    parser.add_argument("--estacoes", nargs="*", help="Códigos das estações (padrão: todas).")
+    parser.add_argument("--formato", choices=list(FORMATOS_TABELA), default="xlsx")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--banco", default=None, help="Arquivo SQLite da tabela de tarefas.")
+    parser.add_argument("--cache", default=None, help="Pasta do cache de artefatos por estação.")
+    args = parser.parse_args(argv)
+
+    catalogo = carregar_catalogo(args.pasta)
+    rotulos = catalogo.rotulos_por_codigo
+    if args.estacoes:
+        rotulos = [r for r in rotulos if r.rsplit("(", 1)[-1].rstrip(")") in set(args.estacoes)]
+
+    fila = FilaTarefas(banco=args.banco, workers=args.workers, cache=CacheArtefatos(args.cache))
+    id_tarefa = fila.submeter(args.tipo, rotulos, catalogo.planilhas_completas, formato=args.formato)
+
+    def mostrar(registro):
+        print(f"\r[{id_tarefa}] {registro['estado']}: {registro['concluidas']}/{registro['total']} "
+              f"({registro['falhas']} falhas)", end="", flush=True)
+
+    registro = fila.aguardar(id_tarefa, ao_atualizar=mostrar)
+    print()
+    if registro['estado'] == 'concluida':
+        print(registro['resultado'])
+    else:
+        print(registro['erro'])
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
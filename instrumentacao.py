@@ -0,0 +1,260 @@
+"""
+Instrumentação leve do pipeline (leitura, hidrologia e exportação)
+Registra, por etapa e por estação, o tempo de parede, o tempo de CPU, o número de linhas e, opcionalmente, o pico de
+memória alocada durante a etapa (tracemalloc). Os registros podem ser resumidos em tabela, salvos em JSON, no formato
+Trace Event (chrome://tracing, Perfetto, speedscope) ou em pilhas colapsadas (flamegraph.pl).
+A coleta fica desligada por padrão: ligue com ativar() (ativar(memoria=True) para medir também a memória) ou com as
+variáveis de ambiente BDMEP_INSTRUMENTACAO=1 e BDMEP_INSTRUMENTACAO_MEMORIA=1. Com a coleta ligada, o custo por etapa é
+de poucos microssegundos (a medição de memória deixa o código Python bem mais lento). Cada processo guarda no máximo
+BDMEP_INSTRUMENTACAO_MAX registros (padrão 100000); os mais antigos são descartados, então processos longos que não
+chamam coletar() (ex.: o app) usam memória limitada.
+
+Exemplo:
+    with etapa('ler_dados', estacao='A001') as e:
+        metadados, dados = ler_dados(caminho)
+        e.linhas = len(dados)
+"""
+import collections
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import pandas as pd
+
+_ativo = os.environ.get('BDMEP_INSTRUMENTACAO', '0') not in ('', '0')
+_memoria = _ativo and os.environ.get('BDMEP_INSTRUMENTACAO_MEMORIA', '0') not in ('', '0')
+_registros = collections.deque(maxlen=int(os.environ.get('BDMEP_INSTRUMENTACAO_MAX', 100000)))
+_trava = threading.Lock()
+_pilha = contextvars.ContextVar('pilha_etapas', default=())
+_MB = 1024 * 1024
+# Se o tracemalloc foi iniciado aqui (e pode ser parado por ativar) ou já estava em uso por outro código
+_tracemalloc_proprio = _memoria and not tracemalloc.is_tracing()
+if _tracemalloc_proprio:
+    tracemalloc.start()
+
+
+class Etapa:
+    """
+    Gerenciador de contexto que mede uma etapa. 'linhas' pode ser definido dentro do bloco.
+    Etapas aninhadas formam o caminho 'pai;filha' usado nos gráficos de chama.
+    Com a medição de memória ligada, o pico de cada etapa é o maior volume alocado (tracemalloc) entre a entrada e a
+    saída, incluindo as etapas filhas; com várias threads medindo ao mesmo tempo, os valores são aproximados.
+    """
+
+    __slots__ = ('nome', 'estacao', 'linhas', '_inicio', '_parede', '_cpu', '_memoria', '_pico', '_token')
+
+    def __init__(self, nome, estacao=None, linhas=None):
+        self.nome = nome
+        self.estacao = estacao
+        self.linhas = linhas
+
+    def __enter__(self):
+        if _ativo:
+            pilha = _pilha.get()
+            self._token = _pilha.set(pilha + (self,))
+            self._memoria = None
+            if _memoria and tracemalloc.is_tracing():
+                # O pico do tracemalloc é zerado na entrada de cada etapa; o pico acumulado até aqui fica com a etapa mãe
+                atual, pico = tracemalloc.get_traced_memory()
+                if pilha and pilha[-1]._memoria is not None:
+                    pilha[-1]._pico = max(pilha[-1]._pico, pico)
+                tracemalloc.reset_peak()
+                self._memoria = self._pico = atual
+            self._inicio = time.time()
+            self._cpu = time.process_time()
+            self._parede = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreio):
+        if not _ativo or not hasattr(self, '_token'):
+            return False
+        parede = time.perf_counter() - self._parede
+        cpu = time.process_time() - self._cpu
+        pilha = _pilha.get()
+        caminho = ';'.join(e.nome for e in pilha)
+        _pilha.reset(self._token)
+        pico = adicional = None
+        if self._memoria is not None and tracemalloc.is_tracing():
+            pico_bytes = max(tracemalloc.get_traced_memory()[1], self._pico)
+            if len(pilha) > 1 and pilha[-2]._memoria is not None:
+                pilha[-2]._pico = max(pilha[-2]._pico, pico_bytes)
+            pico, adicional = pico_bytes / _MB, (pico_bytes - self._memoria) / _MB
+        registro = {
+            'etapa': self.nome,
+            'caminho': caminho,
+            'estacao': self.estacao,
+            'inicio': self._inicio,
+            'duracao (s)': parede,
+            'cpu (s)': cpu,
+            'pico memoria (MB)': pico,
+            'memoria adicional (MB)': adicional,
+            'linhas': self.linhas,
+            'pid': os.getpid(),
+            'thread': threading.get_ident(),
+            'erro': tipo_erro.__name__ if tipo_erro is not None else None,
+        }
+        with _trava:
+            _registros.append(registro)
+        return False
+
+
+def etapa(nome, estacao=None, linhas=None):
+    """
+    Mede um bloco de código como uma etapa do pipeline.
+    """
+    return Etapa(nome, estacao, linhas)
+
+
+def instrumentar(nome=None):
+    """
+    Decorador que mede cada chamada da função como uma etapa (nome padrão: nome da função).
+    """
+    def decorador(funcao):
+        nome_etapa = nome or funcao.__name__
+
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            with Etapa(nome_etapa):
+                return funcao(*args, **kwargs)
+        return envolvida
+    return decorador
+
+
+def ativar(ativo=True, memoria=False):
+    """
+    Liga ou desliga a coleta de registros. Com memoria=True, mede também o pico de memória de cada etapa (tracemalloc).
+    """
+    global _ativo, _memoria, _tracemalloc_proprio
+    _ativo = ativo
+    _memoria = ativo and memoria
+    if _memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _tracemalloc_proprio = True
+    elif not _memoria and _tracemalloc_proprio:
+        tracemalloc.stop()
+        _tracemalloc_proprio = False
+
+
+def estado():
+    """
+    (ativo, memoria) deste processo; usado como initargs de ativar nos pools de processos auxiliares.
+    """
+    return _ativo, _memoria
+
+
+def registros():
+    """
+    Cópia dos registros coletados neste processo.
+    """
+    with _trava:
+        return list(_registros)
+
+
+def coletar():
+    """
+    Retorna e remove os registros deste processo (usado para enviar os registros dos processos auxiliares ao principal).
+    """
+    with _trava:
+        coletados = list(_registros)
+        _registros.clear()
+    return coletados
+
+
+def incorporar(novos):
+    """
+    Acrescenta registros vindos de outros processos.
+    """
+    with _trava:
+        _registros.extend(novos)
+
+
+def limpar():
+    """
+    Descarta os registros deste processo.
+    """
+    with _trava:
+        _registros.clear()
+
+
+def para_dataframe():
+    """
+    Registros em tabela, um por etapa executada.
+    """
+    return pd.DataFrame(registros())
+
+
+def resumo():
+    """
+    Resumo por etapa: execuções, tempo total, médio e p95 de parede, CPU total, maior pico de memória
+    (NaN sem a medição de memória) e linhas.
+    """
+    df = para_dataframe()
+    if df.empty:
+        return df
+    return (df.groupby('caminho')
+              .agg(execucoes=('duracao (s)', 'size'),
+                   total_s=('duracao (s)', 'sum'),
+                   media_s=('duracao (s)', 'mean'),
+                   p95_s=('duracao (s)', lambda x: x.quantile(0.95)),
+                   cpu_s=('cpu (s)', 'sum'),
+                   pico_memoria_mb=('pico memoria (MB)', 'max'),
+                   linhas=('linhas', 'sum'))
+              .sort_values('total_s', ascending=False))
+
+
+def salvar_json(caminho):
+    """
+    Salva os registros brutos em JSON.
+    """
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(registros(), f, ensure_ascii=False, default=str)
+
+
+def salvar_trace(caminho):
+    """
+    Salva os registros no formato Trace Event (eventos completos 'X'), aberto em chrome://tracing, Perfetto ou speedscope.
+    """
+    eventos = [{
+        'name': r['etapa'],
+        'cat': 'bdmep',
+        'ph': 'X',
+        'ts': r['inicio'] * 1e6,
+        'dur': r['duracao (s)'] * 1e6,
+        'pid': r['pid'],
+        'tid': r['thread'],
+        'args': {chave: r[chave] for chave in ('estacao', 'linhas', 'cpu (s)', 'pico memoria (MB)') if r[chave] is not None},
+    } for r in registros()]
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, f, default=str)
+
+
+def salvar_pilhas(caminho):
+    """
+    Salva pilhas colapsadas ('pai;filha microssegundos', tempo próprio de cada etapa) para flamegraph.pl ou speedscope.
+    """
+    totais = {}
+    for r in registros():
+        totais[r['caminho']] = totais.get(r['caminho'], 0.0) + r['duracao (s)']
+    proprios = dict(totais)
+    for pilha, total in totais.items():
+        if ';' in pilha:
+            pai = pilha.rsplit(';', 1)[0]
+            if pai in proprios:
+                proprios[pai] -= total
+    with open(caminho, 'w', encoding='utf-8') as f:
+        for pilha, proprio in sorted(proprios.items()):
+            f.write(f"{pilha} {max(int(proprio * 1e6), 0)}\n")
+
+
+def salvar(prefixo):
+    """
+    Salva os registros em '<prefixo>.json', '<prefixo>.trace.json' e '<prefixo>.pilhas.txt'. Retorna os caminhos.
+    """
+    caminhos = [f"{prefixo}.json", f"{prefixo}.trace.json", f"{prefixo}.pilhas.txt"]
+    for funcao, caminho in zip((salvar_json, salvar_trace, salvar_pilhas), caminhos):
+        funcao(caminho)
+    return caminhos
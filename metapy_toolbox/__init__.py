@@ -1,6 +1,8 @@
 """imports"""
 from .meta import *
+from .executor import *
 from .common_library import *
+from .selection import *
 from .functions_metrics import *
 from .benchmark import *
 from .simulated_annealing import *
@@ -4,6 +4,67 @@ import pandas as pd
 from sklearn.model_selection import ParameterGrid
 from copy import deepcopy
 
+
+_GLOBAL_RNG = None
+
+
+def _global_generator():
+    """
+    This function returns the module-level Generator that shares the bit generator of the legacy global NumPy state (numpy.random.get_bit_generator), so it is created once and numpy.random.seed reseeds it.
+
+    Returns:
+        rng (Generator): Global random generator
+    """
+
+    global _GLOBAL_RNG
+    bit_generator = np.random.get_bit_generator()
+    if _GLOBAL_RNG is None or _GLOBAL_RNG.bit_generator is not bit_generator:
+        _GLOBAL_RNG = np.random.Generator(bit_generator)
+
+    return _GLOBAL_RNG
+
+
+def random_generator(seed=None):
+    """
+    This function returns the NumPy random generator (numpy.random.Generator) used by the algorithms and operators.
+
+    Args:
+        seed (None, Integer, SeedSequence or Generator): Random seed. A Generator is returned as is. Default is None (global generator, seeded with numpy.random.seed)
+
+    Returns:
+        rng (Generator): Random generator
+    """
+
+    if isinstance(seed, np.random.Generator):
+        return seed
+    if seed is None:
+        return _global_generator()
+
+    return np.random.default_rng(seed)
+
+
+def repetition_seeds(seeds):
+    """
+    This function spawns the random streams of each repetition from general_setup['initial pop. seed'] with numpy.random.SeedSequence. Each repetition gets one stream for the initial population and another one for the algorithm, so repetitions running at the same time never share random state and a seeded repetition gives the same result with any backend.
+
+    Args:
+        seeds (List): Random seed of each repetition. Use None in list for random seed
+
+    Returns:
+        pop_seeds (List): SeedSequence of the initial population of each repetition
+        algorithm_seeds (List): SeedSequence of the algorithm of each repetition
+    """
+
+    pop_seeds = []
+    algorithm_seeds = []
+    for seed in seeds:
+        pop_seed, algorithm_seed = np.random.SeedSequence(seed).spawn(2)
+        pop_seeds.append(pop_seed)
+        algorithm_seeds.append(algorithm_seed)
+
+    return pop_seeds, algorithm_seeds
+
+
 def initial_population_01(n_population, n_dimensions, x_lower, x_upper, seed=None):
     """  
     Generates a random population with defined limits. Continuum variables generator.
@@ -13,29 +74,19 @@ def initial_population_01(n_population, n_dimensions, x_lower, x_upper, seed=Non
         n_dimensions (Integer): Problem dimension
         x_lower (List): Lower limit of the design variables
         x_upper (List): Upper limit of the design variables
-        seed (Integer or None): Random seed. Default is None. Use None for random seed
+        seed (None, Integer, SeedSequence or Generator): Random seed (see random_generator). Default is None. Use None for random seed
     
     Returns:
         x_pop (List): Population design variables
     """
 
-    # Set random seed
-    if seed is None:
-        pass
-    else:
-        np.random.seed(seed)
-
     # Random variable generator
-    x_pop = []
-    for _ in range(n_population):
-        aux = []
-        for j in range(n_dimensions):
-            random_number = np.random.random()
-            value_i_dimension = x_lower[j] + (x_upper[j] - x_lower[j]) * random_number
-            aux.append(value_i_dimension)
-        x_pop.append(aux)
+    rng = random_generator(seed)
+    x_lower = np.asarray(x_lower, dtype=float)
+    x_upper = np.asarray(x_upper, dtype=float)
+    x_pop = x_lower + (x_upper - x_lower) * rng.random((n_population, n_dimensions))
 
-    return x_pop
+    return x_pop.tolist()
 
 
 def initial_population_02(n_population, n_dimensions, seed=None):
@@ -45,21 +96,16 @@ def initial_population_02(n_population, n_dimensions, seed=None):
     Args:
         n_population (Integer): Number of population
         n_dimensions (Integer): Problem dimension
-        seed (Integer or None): Random seed. Default is None
+        seed (None, Integer, SeedSequence or Generator): Random seed (see random_generator). Default is None
     
     Returns:
         x_pop (List): Population design variables
     """
 
-    # Set random seed
-    if seed is None:
-        pass
-    else:
-        np.random.seed(seed)
-
     # Random variable generator
+    rng = random_generator(seed)
     nodes = list(range(n_dimensions))
-    x_pop = [list(np.random.permutation(nodes)) for _ in range(n_population)]
+    x_pop = [list(rng.permutation(nodes)) for _ in range(n_population)]
 
     return x_pop
 
@@ -75,31 +121,23 @@ def initial_pops(n_repetitions, n_population, n_dimensions, x_lower, x_upper, ty
         x_lower (List or None): Lower limit of the design variables. Use None for combinatorial variables
         x_upper (List or None): Upper limit of the design variables. Use None for combinatorial variables
         type_pop (String): Type of population. Options: 'real code' or 'combinatorial code'. 'real code' call function initial_population_01 and 'combinatorial code' call function initial_population_02
-        seeds (List or None): Random seed. Use None for random seed
+        seeds (List): Random seed of each repetition (None, Integer, SeedSequence or Generator, see random_generator). Use None for random seed
     
     Returns:
         population (List): Population design variables. All repetitions
     """
 
-    # Set random seed
-    population = []
     # Random variable generator
+    population = []
     if type_pop.upper() == 'REAL CODE':
         for i in range(n_repetitions):
-            if seeds[i] is None:
-                population.append(initial_population_01(n_population, n_dimensions,
-                                                        x_lower, x_upper))
-            else:
-                population.append(initial_population_01(n_population, n_dimensions,
-                                                        x_lower, x_upper,
-                                                        seed=seeds[i]))
+            population.append(initial_population_01(n_population, n_dimensions,
+                                                    x_lower, x_upper,
+                                                    seed=seeds[i]))
     elif type_pop.upper() == 'COMBINATORIAL CODE':
         for i in range(n_repetitions):
-            if seeds[i] is None:
-                population.append(initial_population_02(n_population, n_dimensions))
-            else:
-                population.append(initial_population_02(n_population, n_dimensions,
-                                                        seed=seeds[i]))
+            population.append(initial_population_02(n_population, n_dimensions,
+                                                    seed=seeds[i]))
 
     return population
 
@@ -125,6 +163,77 @@ def fit_value(of_i_value):
     return fit_i_value
 
 
+def fit_values(of_pop):
+    """
+    This function calculates the fitness of a set of agents (vectorized fit_value).
+
+    Args:
+        of_pop (List or Array): Objective function values of the agents
+
+    Returns:
+        fit_pop (Array): Fitness values of the agents
+    """
+
+    of_pop = np.asarray(of_pop, dtype=float)
+    fit_pop = np.empty_like(of_pop)
+
+    # Positive or zero OF value
+    positive = of_pop >= 0
+    fit_pop[positive] = 1 / (1 + of_pop[positive])
+    # Negative OF value
+    fit_pop[~positive] = 1 + np.abs(of_pop[~positive])
+
+    return fit_pop
+
+
+def evaluate_objective(obj_function, x_pop, none_variable=None, vectorized=False):
+    """
+    This function evaluates the objective function and fitness of a set of agents.
+
+    Args:
+        obj_function (Py function (def)): Objective function. The Metapy user defined this function
+        x_pop (List or Array): Design variables of the agents (n_agents x n_dimensions)
+        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        vectorized (Boolean): True when obj_function receives the (n_agents x n_dimensions) array and returns the n_agents objective function values in a single call. Default is False (one call per agent with a List)
+
+    Returns:
+        of_pop (Array): Objective function values of the agents
+        fit_pop (Array): Fitness values of the agents
+        neof (Integer): Number of evaluations of the objective function
+    """
+
+    x_pop = np.array(x_pop, dtype=float, ndmin=2)
+    if vectorized:
+        of_pop = np.asarray(obj_function(x_pop, none_variable), dtype=float).reshape(-1)
+        if of_pop.shape[0] != x_pop.shape[0]:
+            raise ValueError(f'The vectorized objective function must return one value per agent ({x_pop.shape[0]} values), but returned {of_pop.shape[0]}.')
+    else:
+        of_pop = np.array([obj_function(x_i, none_variable) for x_i in x_pop.tolist()], dtype=float)
+
+    return of_pop, fit_values(of_pop), x_pop.shape[0]
+
+
+def agent_objective(obj_function, vectorized=False):
+    """
+    This function returns the objective function in the one agent format used by the operators (obj_function(x_i, none_variable) -> Float).
+
+    Args:
+        obj_function (Py function (def)): Objective function. The Metapy user defined this function
+        vectorized (Boolean): True when obj_function is vectorized (see evaluate_objective). Default is False
+
+    Returns:
+        of_function (Py function (def)): obj_function itself or, for a vectorized function, a wrapper that evaluates one agent
+    """
+
+    if not vectorized:
+        return obj_function
+
+    def of_function(x_i, none_variable=None):
+        return float(np.asarray(obj_function(np.array(x_i, dtype=float, ndmin=2), none_variable)).reshape(-1)[0])
+
+    return of_function
+
+
 def check_interval_01(x_i_old, x_lower, x_upper):
     """
     This function checks if a design variable is out of the limits established x_ lower and x_ upper and updates the variable if necessary.
@@ -144,14 +253,364 @@ def check_interval_01(x_i_old, x_lower, x_upper):
     return x_i_new
 
 
+def check_interval_02(x, x_lower, x_upper):
+    """
+    This function checks if the design variables are out of the limits established x_lower and x_upper and updates them in place (no list conversion).
+
+    Args:
+        x (Array): Design variables of one agent (n_dimensions) or of a population (n_population x n_dimensions). Float array
+        x_lower (List or Array): Lower limit of the design variables
+        x_upper (List or Array): Upper limit of the design variables
+
+    Returns:
+        x (Array): The same array with updated variables
+    """
+
+    np.clip(x, x_lower, x_upper, out=x)
+
+    return x
+
+
+class Population:
+    """
+    Array-backed population shared by all metaheuristic algorithms. Design variables are stored in a contiguous (n_population x n_dimensions) float64 array and the objective function and fitness values in two vectors. Operators update these arrays in place, so the same allocation is used along the whole optimization process.
+
+    Args:
+        x_pop (List or Array): Population design variables
+        of_pop (List, Array or None): Population objective function values. Default is None (not evaluated)
+        fit_pop (List, Array or None): Population fitness values. Default is None (not evaluated)
+
+    Attributes:
+        x (Array): Population design variables (n_population x n_dimensions)
+        of (Array): Population objective function values (n_population)
+        fit (Array): Population fitness values (n_population)
+    """
+
+    __slots__ = ('x', 'of', 'fit')
+
+    def __init__(self, x_pop, of_pop=None, fit_pop=None):
+        self.x = np.array(x_pop, dtype=float, order='C', ndmin=2)
+        n_population = self.x.shape[0]
+        self.of = np.full(n_population, np.nan) if of_pop is None else np.array(of_pop, dtype=float)
+        self.fit = np.full(n_population, np.nan) if fit_pop is None else np.array(fit_pop, dtype=float)
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    @property
+    def n_population(self):
+        """Number of agents."""
+        return self.x.shape[0]
+
+    @property
+    def n_dimensions(self):
+        """Problem dimension."""
+        return self.x.shape[1]
+
+    def evaluate(self, obj_function, none_variable=None, ids=None, vectorized=False):
+        """
+        Evaluates the objective function and fitness of the agents and stores the values in place.
+
+        Args:
+            obj_function (Py function (def)): Objective function. The Metapy user defined this function
+            none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+            ids (List or None): Agents to evaluate. Default is None (all agents)
+            vectorized (Boolean): Evaluates all agents in a single call (see evaluate_objective). Default is False
+
+        Returns:
+            neof (Integer): Number of evaluations of the objective function
+        """
+
+        ids = slice(None) if ids is None else list(ids)
+        self.of[ids], self.fit[ids], neof = evaluate_objective(obj_function, self.x[ids], none_variable, vectorized)
+
+        return neof
+
+    def update(self, i, x_i_new, of_i_new, fit_i_new):
+        """
+        Replaces the i agent in place.
+
+        Args:
+            i (Integer): Agent id
+            x_i_new (List or Array): New design variables of the i agent
+            of_i_new (Float): New objective function value of the i agent
+            fit_i_new (Float): New fitness value of the i agent
+        """
+
+        self.x[i] = x_i_new
+        self.of[i] = of_i_new
+        self.fit[i] = fit_i_new
+
+    def update_where(self, mask, x_new, of_new, fit_new):
+        """
+        Replaces in place the agents where mask is True (greedy replacement of a whole offspring population).
+
+        Args:
+            mask (Array): Boolean array (n_population)
+            x_new (Array): New design variables (n_population x n_dimensions)
+            of_new (Array): New objective function values (n_population)
+            fit_new (Array): New fitness values (n_population)
+        """
+
+        np.copyto(self.x, x_new, where=mask[:, None])
+        np.copyto(self.of, of_new, where=mask)
+        np.copyto(self.fit, fit_new, where=mask)
+
+    def copy_from(self, other):
+        """
+        Copies the values of another population with the same shape into this one, without new allocations.
+
+        Args:
+            other (Population): Source population
+        """
+
+        np.copyto(self.x, other.x)
+        np.copyto(self.of, other.of)
+        np.copyto(self.fit, other.fit)
+
+    def copy(self):
+        """
+        Returns an independent copy of the population.
+        """
+
+        return Population(self.x, self.of, self.fit)
+
+    def best_values(self):
+        """
+        Same values of best_values function, computed on the population arrays.
+        """
+
+        return best_values(self.x, self.of, self.fit)
+
+    def tolist(self):
+        """
+        Population design variables as list of lists (legacy format).
+        """
+
+        return self.x.tolist()
+
+
+class History:
+    """
+    Preallocated record of the optimization process, used instead of the one row DataFrames of resume_all_data_in_dataframe and resume_best_data_in_dataframe. The values are written in NumPy buffers along the iterations and converted to DataFrames only once, when dataframes is called.
+
+    Args:
+        n_iterations (Integer): Number of iterations
+        n_agents (Integer): Number of agents recorded in each iteration
+        n_dimensions (Integer): Problem dimension
+        level (String): Recording level. Options: 'full' (all agents and best, worst and average values of each iteration), 'best' (best, worst and average values of each iteration) or 'none' (best, worst and average values of the last iteration). Default is 'full'
+
+    Attributes:
+        all_data (Array): Agents data (n_iterations + 1 x n_agents x n_dimensions + 3): design variables, OF, FIT and iteration
+        best_data (Array): Best, worst and average data (n_iterations + 1 x 2 * n_dimensions + 10), one row per iteration
+    """
+
+    __slots__ = ('level', 'n_dimensions', 'all_data', 'best_data', 'n_best')
+
+    def __init__(self, n_iterations, n_agents, n_dimensions, level='full'):
+        if level not in ('full', 'best', 'none'):
+            raise ValueError("The history level must be 'full', 'best' or 'none'.")
+        self.level = level
+        self.n_dimensions = n_dimensions
+        n_records = n_iterations + 1 if level == 'full' else 0
+        self.all_data = np.full((n_records, n_agents, n_dimensions + 3), np.nan)
+        self.all_data[:, :, -1] = np.arange(n_records)[:, None]
+        self.best_data = np.full((1 if level == 'none' else n_iterations + 1, 2 * n_dimensions + 10), np.nan)
+        self.n_best = 0
+
+    def record_agents(self, iteration, x_pop, of_pop, fit_pop, start=0):
+        """
+        Records a block of agents of the iteration (only at 'full' level).
+
+        Args:
+            iteration (Integer): Current iteration number
+            x_pop (List or Array): Design variables of the agents
+            of_pop (List or Array): Objective function values of the agents
+            fit_pop (List or Array): Fitness values of the agents
+            start (Integer): Position of the first agent in the iteration. Default is 0
+        """
+
+        if self.level != 'full':
+            return
+        rows = self.all_data[iteration, start:start + len(of_pop)]
+        rows[:, :self.n_dimensions] = x_pop
+        rows[:, self.n_dimensions] = of_pop
+        rows[:, self.n_dimensions + 1] = fit_pop
+
+    def record_agent(self, iteration, i, x_i, of_i, fit_i):
+        """
+        Records the i agent of the iteration (only at 'full' level).
+
+        Args:
+            iteration (Integer): Current iteration number
+            i (Integer): Position of the agent in the iteration
+            x_i (List or Array): Design variables of the i agent
+            of_i (Float): Objective function value of the i agent
+            fit_i (Float): Fitness value of the i agent
+        """
+
+        if self.level != 'full':
+            return
+        row = self.all_data[iteration, i]
+        row[:self.n_dimensions] = x_i
+        row[self.n_dimensions] = of_i
+        row[self.n_dimensions + 1] = fit_i
+
+    def record_best(self, iteration, x_pop, of_pop, fit_pop, neof_count):
+        """
+        Records the best, worst and average values of the population in the iteration.
+
+        Args:
+            iteration (Integer): Current iteration number
+            x_pop (List or Array): Population design variables
+            of_pop (List or Array): Population objective function values
+            fit_pop (List or Array): Population fitness values
+            neof_count (Integer): Number of evaluations of the objective function
+
+        Returns:
+            best_id (Integer): Best id in population
+        """
+
+        best_id, worst_id, x_best, x_worst, of_best, of_worst, fit_best,\
+        fit_worst, of_avg, fit_avg = best_values(x_pop, of_pop, fit_pop)
+        d = self.n_dimensions
+        if self.level == 'none':
+            row = self.best_data[0]
+            self.n_best = 1
+        else:
+            row = self.best_data[iteration]
+            self.n_best = iteration + 1
+        row[:d] = x_best
+        row[d:d + 3] = of_best, fit_best, best_id
+        row[d + 3:2*d + 3] = x_worst
+        row[2*d + 3:] = of_worst, fit_worst, worst_id, of_avg, fit_avg, iteration, neof_count
+
+        return best_id
+
+    def dataframes(self):
+        """
+        Converts the records to DataFrames (same columns of resume_all_data_in_dataframe and resume_best_data_in_dataframe).
+
+        Returns:
+            df_all (Dataframe): All data of the population (empty if level is not 'full')
+            df_best (Dataframe): Best, worst and average data of the population
+        """
+
+        d = self.n_dimensions
+        columns_all_data = ['X_' + str(i) for i in range(d)] + ['OF', 'FIT', 'ITERATION']
+        columns_best_data = ['X_' + str(i) + '_BEST' for i in range(d)] + ['OF BEST', 'FIT BET', 'ID BEST']
+        columns_best_data += ['X_' + str(i) + '_WORST' for i in range(d)] + ['OF WORST', 'FIT WORST', 'ID WORST']
+        columns_best_data += ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
+        df_all = pd.DataFrame(self.all_data.reshape(-1, d + 3), columns=columns_all_data)
+        df_all['ITERATION'] = df_all['ITERATION'].astype(np.int64)
+        df_best = pd.DataFrame(self.best_data[:self.n_best], columns=columns_best_data)
+        df_best = df_best.astype({'ID BEST': np.int64, 'ID WORST': np.int64, 'ITERATION': np.int64, 'neof': np.int64})
+
+        return df_all, df_best
+
+
+class Report:
+    """
+    Structured event log of the algorithm execution. The events are stored as a template and its arguments and the text is formatted only when it is requested (str(report)).
+
+    Args:
+        title (String): First line of the report
+        mode (String): Report mode. Options: 'off' (no events are stored), 'summary' (iteration headers and best solution of each iteration) or 'full' (all events, including the movement of each agent). Default is 'full'
+
+    Attributes:
+        verbose (Boolean): True in 'full' mode. The algorithms pass it to the operators, which skip the formatting of their own reports when it is False
+        events (List): Recorded events (template, arguments)
+    """
+
+    __slots__ = ('mode', 'verbose', 'events')
+
+    def __init__(self, title, mode='full'):
+        if mode not in ('off', 'summary', 'full'):
+            raise ValueError("The report mode must be 'off', 'summary' or 'full'.")
+        self.mode = mode
+        self.verbose = mode == 'full'
+        self.events = []
+        self.summary(title)
+
+    def summary(self, template, *args):
+        """
+        Records an event kept in 'summary' and 'full' modes.
+
+        Args:
+            template (String): Event text. When args are informed, the text is a str.format template
+            args (Any): Template arguments (immutable values or copies)
+        """
+
+        if self.mode != 'off':
+            self.events.append((template, args))
+
+    def detail(self, template, *args):
+        """
+        Records an event kept only in 'full' mode.
+
+        Args:
+            template (String): Event text. When args are informed, the text is a str.format template
+            args (Any): Template arguments (immutable values or copies)
+        """
+
+        if self.verbose:
+            self.events.append((template, args))
+
+    def population(self, x_pop, of_pop, best_id, fit_pop=None, labels=None):
+        """
+        Records the population state. All agents are listed in 'full' mode and only the best agent in 'summary' mode.
+
+        Args:
+            x_pop (List or Array): Population design variables
+            of_pop (List or Array): Population objective function values
+            best_id (Integer): Best id in population
+            fit_pop (List or Array): Population fitness values. Default is None (fitness is not listed)
+            labels (List): Prefix of each agent line. Default is None
+        """
+
+        if self.mode == 'off':
+            return
+        ids = list(range(len(of_pop))) if self.verbose else [best_id]
+        x_rows = np.array(x_pop, dtype=float)[ids]
+        of_rows = np.array(of_pop, dtype=float)[ids]
+        fit_rows = None if fit_pop is None else np.array(fit_pop, dtype=float)[ids]
+        labels = None if labels is None else [labels[i] for i in ids]
+        self.events.append((_population_lines, (ids, x_rows, of_rows, fit_rows, labels, best_id)))
+
+    def __str__(self):
+        text = []
+        for template, args in self.events:
+            if callable(template):
+                text.append(template(*args))
+            elif args:
+                text.append(template.format(*args))
+            else:
+                text.append(template)
+
+        return ''.join(text)
+
+
+def _population_lines(ids, x_rows, of_rows, fit_rows, labels, best_id):
+    """Formats the population events of Report.population."""
+
+    lines = []
+    for k, i in enumerate(ids):
+        prefix = '' if labels is None else f'{labels[k]} '
+        fit = '' if fit_rows is None else f', fit {fit_rows[k]}'
+        end = ' - best solution' if i == best_id else ' '
+        lines.append(f'{prefix}x{i} = {x_rows[k].tolist()}, of_pop {of_rows[k]}{fit}{end}\n')
+
+    return ''.join(lines)
+
+
 def best_values(x_pop, of_pop, fit_pop):
     """ 
     This function determines the best, best id, worst particle and worst id. It also determines the average value (OF and FIT) of the population.
 
     Args:
-        x_pop (List): Population design variables
-        of_pop (List): Population objective function values
-        fit_pop (List): Population fitness values
+        x_pop (List or Array): Population design variables
+        of_pop (List or Array): Population objective function values
+        fit_pop (List or Array): Population fitness values
 
     Returns:
         best_id (Integer): Best id in population
@@ -166,9 +625,9 @@ def best_values(x_pop, of_pop, fit_pop):
         fit_avg (Float): Average fitness value
     """
 
-    # Best and worst ID in population
-    best_id = of_pop.index(min(of_pop))
-    worst_id = of_pop.index(max(of_pop))
+    # Best and worst ID in population (first occurrence)
+    best_id = int(np.argmin(of_pop))
+    worst_id = int(np.argmax(of_pop))
 
     # Global best values
     x_best = x_pop[best_id].copy()
@@ -188,7 +647,7 @@ def best_values(x_pop, of_pop, fit_pop):
             fit_best, fit_worst, of_avg, fit_avg
 
 
-def id_selection(n_dimensions, n, k_dimension=False):
+def id_selection(n_dimensions, n, k_dimension=False, rng=None):
     """
     This function selects a k dimension from the all dimensions (uniform selection).
     
@@ -196,12 +655,14 @@ def id_selection(n_dimensions, n, k_dimension=False):
         n_dimensions (Integer): Problem dimension
         n (Integer): Number of dimensions to select
         k_dimension (Integer or Boolean): Default is False (Selects n dimensions among all dimensions). k_dimension=Integer Selects n dimensions among all dimensions, excluding k dimension
+        rng (Generator or None): Random generator (see random_generator). Default is None
 
     Returns:
         selected (List): selected dimensions
         report (String): Report about the selection process
     """
 
+    rng = random_generator(rng)
     if k_dimension > 0:
         # Sum of the fitness values
         report_move = "    Selection dimension operator\n"
@@ -218,7 +679,7 @@ def id_selection(n_dimensions, n, k_dimension=False):
 
         # Selection
         report_move += f"    probs = {selection_probs}\n"
-        selected = np.random.choice(pos, n, replace = False, p = selection_probs)
+        selected = rng.choice(pos, n, replace = False, p = selection_probs)
         report_move += f"    the selected dimensions = {selected}\n"
     else:
         # Sum of the fitness values
@@ -232,13 +693,13 @@ def id_selection(n_dimensions, n, k_dimension=False):
 
         # Selection
         report_move += f"    probs = {selection_probs}\n"
-        selected = np.random.choice(pos, n, replace = False, p = selection_probs)
+        selected = rng.choice(pos, n, replace = False, p = selection_probs)
         report_move += f"    the selected dimensions = {selected}\n"
 
     return selected, report_move
 
 
-def agent_selection(n_population, n, i_pop=False):
+def agent_selection(n_population, n, i_pop=False, verbose=True, rng=None):
     """
     This function selects a n agents from all population (uniform selection).
     
@@ -246,12 +707,15 @@ def agent_selection(n_population, n, i_pop=False):
         n_population (Integer): Number of population
         n (Integer): Number of agents to select
         i_pop (Integer or Boolean): Default is False (Selects n agents among all population). i_pop=Integer Selects n agents among all population, excluding i_pop agent
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see random_generator). Default is None
 
     Returns:
         selected (List): Selected agents.
         report (String): Report about the selection process.
     """
 
+    rng = random_generator(rng)
     if i_pop > 0:
         # Sum of the fitness values
         report_move = "    Selection population operator\n"
@@ -267,9 +731,11 @@ def agent_selection(n_population, n, i_pop=False):
                 selection_probs.append(100/tam/100)
 
         # Selection
-        report_move += f"    probs = {selection_probs}\n"
-        selected = np.random.choice(pos, n, replace = False, p = selection_probs)
-        report_move += f"    the selected agents = {selected}\n"
+        if verbose:
+            report_move += f"    probs = {selection_probs}\n"
+        selected = rng.choice(pos, n, replace = False, p = selection_probs)
+        if verbose:
+            report_move += f"    the selected agents = {selected}\n"
     else:
         # Sum of the fitness values
         report_move = "    Selection population operator\n"
@@ -281,9 +747,11 @@ def agent_selection(n_population, n, i_pop=False):
             selection_probs.append(100/n_population/100)
 
         # Selection
-        report_move += f"    probs = {selection_probs}\n"
-        selected = np.random.choice(pos, n, replace = False, p = selection_probs)
-        report_move += f"    the selected agents = {selected}\n"
+        if verbose:
+            report_move += f"    probs = {selection_probs}\n"
+        selected = rng.choice(pos, n, replace = False, p = selection_probs)
+        if verbose:
+            report_move += f"    the selected agents = {selected}\n"
 
     return selected, report_move
 
@@ -313,58 +781,90 @@ def convert_continuous_discrete(x, discrete_dataset):
     return x_converted
 
 
-def mutation_01_hill_movement(obj_function, x_i_old, x_lower, x_upper, n_dimensions, pdf, cov, none_variable=None):
+def mutation_01_hill_candidate(x_i_old, x_lower, x_upper, n_dimensions, pdf, cov, verbose=True, rng=None):
     """ 
-    This function mutates a solution using a Gaussian or Uniform distribution. Hill Climbing movement.
+    This function generates the Hill Climbing movement of mutation_01_hill_movement without evaluating it (the objective function is evaluated later for the whole population).
 
     Args:
-        obj_function (Py function (def)): Objective function. The Metapy user defined this function
         x_i_old (List): Current design variables of the i agent
         x_lower (List): Lower limit of the design variables
         x_upper (List): Upper limit of the design variables
         n_dimensions (Integer): Problem dimension
         pdf (String): Probability density function. Options: 'gaussian' or 'uniform'
         cov (Float): Coefficient of variation in percentage
-        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see random_generator). Default is None
 
     Returns:
         x_i_new (List): Update variables of the i agent
-        of_i_new (Float): Update objective function value of the i agent
-        fit_i_new (Float): Update fitness value of the i agent
-        neof (Integer): Number of evaluations of the objective function.
         report_move (String): Report about the mutation process
     """
 
     # Start internal variables
+    rng = random_generator(rng)
     x_i_new = []
 
-    # Particle movement - Gaussian distribution or Uniform distribution
+    # Particle movement - Gaussian distribution or Uniform distribution (all dimensions drawn at once)
+    sigma_values = [abs(x_i_old[i] * cov / 100) for i in range(n_dimensions)]
+    if pdf.upper() == 'GAUSSIAN' or pdf.upper() == 'NORMAL':
+        s = rng.normal(0, sigma_values)
+    elif pdf.upper() == 'UNIFORM':
+        s = rng.uniform(-np.array(sigma_values), np.array(sigma_values))
     report_move = ""
-    report_move += f"    current x = {x_i_old}\n"
+    if verbose:
+        report_move += f"    current x = {x_i_old}\n"
     for i in range(n_dimensions):
         mean_value = x_i_old[i]
-        sigma_value = abs(mean_value * cov / 100)
-        if pdf.upper() == 'GAUSSIAN' or pdf.upper() == 'NORMAL':
-            s = np.random.normal(0, sigma_value, 1)
-        elif pdf.upper() == 'UNIFORM':
-            s = np.random.uniform(0 - sigma_value, 0 + sigma_value, 1)
-        neighbor = x_i_old[i] + s[0]
+        sigma_value = sigma_values[i]
+        neighbor = x_i_old[i] + s[i]
         x_i_new.append(neighbor)
-        report_move += f"    Dimension {i}: mean = {mean_value}, sigma = {sigma_value}, neighbor = {neighbor}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: mean = {mean_value}, sigma = {sigma_value}, neighbor = {neighbor}\n"
 
     # Check bounds
     x_i_new = check_interval_01(x_i_new, x_lower, x_upper)
 
+    return x_i_new, report_move
+
+
+def mutation_01_hill_movement(obj_function, x_i_old, x_lower, x_upper, n_dimensions, pdf, cov, none_variable=None, verbose=True, rng=None):
+    """ 
+    This function mutates a solution using a Gaussian or Uniform distribution. Hill Climbing movement.
+
+    Args:
+        obj_function (Py function (def)): Objective function. The Metapy user defined this function
+        x_i_old (List): Current design variables of the i agent
+        x_lower (List): Lower limit of the design variables
+        x_upper (List): Upper limit of the design variables
+        n_dimensions (Integer): Problem dimension
+        pdf (String): Probability density function. Options: 'gaussian' or 'uniform'
+        cov (Float): Coefficient of variation in percentage
+        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see random_generator). Default is None
+
+    Returns:
+        x_i_new (List): Update variables of the i agent
+        of_i_new (Float): Update objective function value of the i agent
+        fit_i_new (Float): Update fitness value of the i agent
+        neof (Integer): Number of evaluations of the objective function.
+        report_move (String): Report about the mutation process
+    """
+
+    # Particle movement - Gaussian distribution or Uniform distribution
+    x_i_new, report_move = mutation_01_hill_candidate(x_i_old, x_lower, x_upper, n_dimensions, pdf, cov, verbose=verbose, rng=rng)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(x_i_new, none_variable)
     fit_i_new = fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return x_i_new, of_i_new, fit_i_new, neof, report_move
 
 
-def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_lower, x_upper, n_dimensions, alpha, n_tries, iteration, n_iter, none_variable=None):
+def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_lower, x_upper, n_dimensions, alpha, n_tries, iteration, n_iter, none_variable=None, verbose=True, rng=None):
     """ 
     This function mutates a solution using a chaotic maps.
     
@@ -381,6 +881,8 @@ def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_low
         iteration (Integer): Current iteration number
         n_iter (Integer): Total number of iterations
         none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function   
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see random_generator). Default is None
 
     Returns:
         x_i_new (List): Update variables of the i agent
@@ -395,7 +897,7 @@ def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_low
     report_move = ""
 
     # Particle movement - Chaotic map
-    ch = np.random.uniform(low=0, high=1)
+    ch = random_generator(rng).random()
     for j in range(n_tries):
         if j == 0:
             fit_best = fit_i_old
@@ -404,13 +906,15 @@ def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_low
         else:
             fit_best = fit_i_new
         x_i_temp = []
-        report_move += f"    Try {j} -> current x = {x_i_new}, fit best = {fit_best}\n"
+        if verbose:
+            report_move += f"    Try {j} -> current x = {x_i_new}, fit best = {fit_best}\n"
         for i in range(n_dimensions):
             chaos_value = x_lower[i] + (x_upper[i] - x_lower[i]) * ch
             epsilon = (n_iter-iteration+1) / n_iter
             g_best = (1-epsilon)*x_i_old[i] + epsilon*chaos_value
             x_i_temp.append(g_best)
-            report_move += f"    Dimension {i}: epsilon = {epsilon}, ch = {ch}, chaos value = {chaos_value}, neighbor = {g_best}\n"
+            if verbose:
+                report_move += f"    Dimension {i}: epsilon = {epsilon}, ch = {ch}, chaos value = {chaos_value}, neighbor = {g_best}\n"
 
         # Check bounds
         x_i_temp = check_interval_01(x_i_temp, x_lower, x_upper)
@@ -418,18 +922,22 @@ def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_low
         # Evaluation of the objective function and fitness
         of_i_temp = obj_function(x_i_temp, none_variable)
         fit_i_temp = fit_value(of_i_temp)
-        report_move += f"    temporary move x = {x_i_temp}, of = {of_i_temp}, fit = {fit_i_temp}\n"
+        if verbose:
+            report_move += f"    temporary move x = {x_i_temp}, of = {of_i_temp}, fit = {fit_i_temp}\n"
 
         # New design variables
         if fit_i_temp > fit_best:
-            report_move += f"    fit_i_temp {fit_i_temp} > fit_pop[pop] {fit_best} - accept this solution\n"
+            if verbose:
+                report_move += f"    fit_i_temp {fit_i_temp} > fit_pop[pop] {fit_best} - accept this solution\n"
             x_i_new = x_i_temp.copy()
             of_i_new = of_i_temp
             fit_i_new = fit_i_temp
-            report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+            if verbose:
+                report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
         else:
-            report_move += f"    fit_i_temp {fit_i_temp} < fit_pop[pop] {fit_best} - not accept this solution\n"
-            report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+            if verbose:
+                report_move += f"    fit_i_temp {fit_i_temp} < fit_pop[pop] {fit_best} - not accept this solution\n"
+                report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
 
         # Update chaos map
         ch = alpha*ch*(1-ch)
@@ -440,13 +948,11 @@ def mutation_02_chaos_movement(obj_function, x_i_old, of_i_old, fit_i_old, x_low
     return x_i_new, of_i_new, fit_i_new, neof, report_move
 
 
-def mutation_03_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_lower, x_upper, n_dimensions, f, none_variable=None):
+def mutation_03_de_candidate(x_r0_old, x_r1_old, x_r2_old, x_lower, x_upper, n_dimensions, f, verbose=True):
     """ 
-    This function mutates a solution using a differential evolution mutation (rand/1).
-    https://sci-hub.se/https://doi.org/10.1007/978-3-319-07173-2_32
-    
+    This function generates the differential evolution mutant (rand/1) of mutation_03_de_movement without evaluating it.
+
     Args:
-        obj_function (Py function (def)): Objective function. The Metapy user defined this function
         x_r0_old (List): Current design variables of the random r0 agent
         x_r1_old (List): Current design variables of the random r1 agent
         x_r2_old (List): Current design variables of the random r2 agent
@@ -454,13 +960,10 @@ def mutation_03_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_lower,
         x_upper (List): Upper limit of the design variables
         n_dimensions (Integer): Problem dimension
         f (Float): Scaling factor
-        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
-    
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+
     Returns:
-        x_i_new (List): Update variables of the i agent
-        of_i_new (Float): Update objective function value of the i agent
-        fit_i_new (Float): Update fitness value of the i agent
-        neof (Integer): Number of evaluations of the objective function
+        x_i_new (List): Mutant design variables
         report_move (String): Report about the mutation process
     """
 
@@ -469,33 +972,66 @@ def mutation_03_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_lower,
 
     # Particle movement - DE mutation movement (rand/1)
     report_move = ""
-    report_move += f"    current xr0 = {x_r0_old}\n"
-    report_move += f"    current xr1 = {x_r1_old}\n"
-    report_move += f"    current xr2 = {x_r2_old}\n"
+    if verbose:
+        report_move += f"    current xr0 = {x_r0_old}\n"
+        report_move += f"    current xr1 = {x_r1_old}\n"
+        report_move += f"    current xr2 = {x_r2_old}\n"
     for i in range(n_dimensions):
         r_ij = x_r1_old[i]-x_r2_old[i]
         v = x_r0_old[i] + f*r_ij
         x_i_new.append(v)
-        report_move += f"    Dimension {i}: rij = {r_ij}, neighbor = {v}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: rij = {r_ij}, neighbor = {v}\n"
 
     # Check bounds
     x_i_new = check_interval_01(x_i_new, x_lower, x_upper)
 
+    return x_i_new, report_move
+
+
+def mutation_03_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_lower, x_upper, n_dimensions, f, none_variable=None, verbose=True):
+    """ 
+    This function mutates a solution using a differential evolution mutation (rand/1).
+    https://sci-hub.se/https://doi.org/10.1007/978-3-319-07173-2_32
+    
+    Args:
+        obj_function (Py function (def)): Objective function. The Metapy user defined this function
+        x_r0_old (List): Current design variables of the random r0 agent
+        x_r1_old (List): Current design variables of the random r1 agent
+        x_r2_old (List): Current design variables of the random r2 agent
+        x_lower (List): Lower limit of the design variables
+        x_upper (List): Upper limit of the design variables
+        n_dimensions (Integer): Problem dimension
+        f (Float): Scaling factor
+        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+    
+    Returns:
+        x_i_new (List): Update variables of the i agent
+        of_i_new (Float): Update objective function value of the i agent
+        fit_i_new (Float): Update fitness value of the i agent
+        neof (Integer): Number of evaluations of the objective function
+        report_move (String): Report about the mutation process
+    """
+
+    # Particle movement - DE mutation movement (rand/1)
+    x_i_new, report_move = mutation_03_de_candidate(x_r0_old, x_r1_old, x_r2_old, x_lower, x_upper, n_dimensions, f, verbose=verbose)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(x_i_new, none_variable)
     fit_i_new = fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return x_i_new, of_i_new, fit_i_new, neof, report_move    
 
 
-def mutation_04_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_r3_old, x_r4_old, x_lower, x_upper, n_dimensions, f, none_variable=None):
+def mutation_04_de_candidate(x_r0_old, x_r1_old, x_r2_old, x_r3_old, x_r4_old, x_lower, x_upper, n_dimensions, f, verbose=True):
     """ 
-    This function mutates a solution using a differential evolution mutation (rand/2).
-    
+    This function generates the differential evolution mutant (rand/2) of mutation_04_de_movement without evaluating it.
+
     Args:
-        obj_function (Py function (def)): Objective function. The Metapy user defined this function
         x_r0_old (List): Current design variables of the random r0 agent
         x_r1_old (List): Current design variables of the random r1 agent
         x_r2_old (List): Current design variables of the random r2 agent
@@ -505,13 +1041,10 @@ def mutation_04_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_r3_old
         x_upper (List): Upper limit of the design variables
         n_dimensions (Integer): Problem dimension
         f (Float): Scaling factor
-        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
 
     Returns:
-        x_i_new (List): Update variables of the i agent
-        of_i_new (Float): Update objective function value of the i agent
-        fit_i_new (Float): Update fitness value of the i agent
-        neof (Integer): Number of evaluations of the objective function
+        x_i_new (List): Mutant design variables
         report_move (String): Report about the mutation process
     """
 
@@ -520,25 +1053,60 @@ def mutation_04_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_r3_old
 
     # Particle movement - DE mutation movement (rand/2)
     report_move = ""
-    report_move += f"    current xr0 = {x_r0_old}\n"
-    report_move += f"    current xr1 = {x_r1_old}\n"
-    report_move += f"    current xr2 = {x_r2_old}\n"
-    report_move += f"    current xr3 = {x_r3_old}\n"
-    report_move += f"    current xr4 = {x_r4_old}\n"
+    if verbose:
+        report_move += f"    current xr0 = {x_r0_old}\n"
+        report_move += f"    current xr1 = {x_r1_old}\n"
+        report_move += f"    current xr2 = {x_r2_old}\n"
+        report_move += f"    current xr3 = {x_r3_old}\n"
+        report_move += f"    current xr4 = {x_r4_old}\n"
     for i in range(n_dimensions):
         r_ij_1 = x_r1_old[i] - x_r2_old[i]
         r_ij_2 = x_r3_old[i] - x_r4_old[i]
         v = x_r0_old[i] + f*r_ij_1 + f*r_ij_2
         x_i_new.append(v)
-        report_move += f"    Dimension {i}: rij_1 = {r_ij_1}, rij_2 = {r_ij_2}, neighbor = {v}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: rij_1 = {r_ij_1}, rij_2 = {r_ij_2}, neighbor = {v}\n"
 
     # Check bounds
     x_i_new = check_interval_01(x_i_new, x_lower, x_upper)
 
+    return x_i_new, report_move
+
+
+def mutation_04_de_movement(obj_function, x_r0_old, x_r1_old, x_r2_old, x_r3_old, x_r4_old, x_lower, x_upper, n_dimensions, f, none_variable=None, verbose=True):
+    """ 
+    This function mutates a solution using a differential evolution mutation (rand/2).
+    
+    Args:
+        obj_function (Py function (def)): Objective function. The Metapy user defined this function
+        x_r0_old (List): Current design variables of the random r0 agent
+        x_r1_old (List): Current design variables of the random r1 agent
+        x_r2_old (List): Current design variables of the random r2 agent
+        x_r3_old (List): Current design variables of the random r3 agent
+        x_r4_old (List): Current design variables of the random r4 agent
+        x_lower (List): Lower limit of the design variables
+        x_upper (List): Upper limit of the design variables
+        n_dimensions (Integer): Problem dimension
+        f (Float): Scaling factor
+        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+
+    Returns:
+        x_i_new (List): Update variables of the i agent
+        of_i_new (Float): Update objective function value of the i agent
+        fit_i_new (Float): Update fitness value of the i agent
+        neof (Integer): Number of evaluations of the objective function
+        report_move (String): Report about the mutation process
+    """
+
+    # Particle movement - DE mutation movement (rand/2)
+    x_i_new, report_move = mutation_04_de_candidate(x_r0_old, x_r1_old, x_r2_old, x_r3_old, x_r4_old, x_lower, x_upper, n_dimensions, f, verbose=verbose)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(x_i_new, none_variable)
     fit_i_new = fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return x_i_new, of_i_new, fit_i_new, neof, report_move
@@ -708,19 +1276,21 @@ def parametrizer_grid(param_grid, algorithm_setup):
     algorithm_setups_with_params = []
     
     for params in param_combinations:
-        setup_copy = deepcopy(algorithm_setup)
+        # The none variable and the objective function are shared by all setups (not copied)
+        shared = {id(algorithm_setup[key]): algorithm_setup[key] for key in ('none variable', 'objective function') if key in algorithm_setup}
+        setup_copy = deepcopy(algorithm_setup, shared)
         
         # Function to replace 'parametrizer' by the actual value
         def replace_parametrizer(obj, params):
             if isinstance(obj, dict):
                 for k, v in obj.items():
-                    if v == 'parametrizer' and k in params:
+                    if isinstance(v, str) and v == 'parametrizer' and k in params:
                         obj[k] = params[k] # Replace 'parametrizer' by the actual value
                     elif isinstance(v, (dict, list)):
                         replace_parametrizer(v, params)
             elif isinstance(obj, list):
                 for i, item in enumerate(obj):
-                    if item == 'parametrizer' and i in params:
+                    if isinstance(item, str) and item == 'parametrizer' and i in params:
                         obj[i] = params[i]
                     elif isinstance(item, (dict, list)):
                         replace_parametrizer(item, params)
@@ -739,7 +1309,7 @@ def resume_all_data_in_dataframe(x_i_pop, of_i_pop, fit_i_pop, columns, iteratio
     This function creates a dataframme with all values of the population.
     
     Args:
-        x_i_pop (List): Design variables of the i agent
+        x_i_pop (List or Array): Design variables of the i agent
         of_i_pop (Float): Objective function value of the i agent
         fit_i_pop (Float): Fitness value of the i agent
         columns (List): Columns names about dataset results
@@ -750,11 +1320,7 @@ def resume_all_data_in_dataframe(x_i_pop, of_i_pop, fit_i_pop, columns, iteratio
     """
 
     # Dataframe creation
-    aux = x_i_pop.copy()
-    aux.append(of_i_pop)
-    aux.append(fit_i_pop)
-    aux.append(iteration)
-    solution_list = [aux]
+    solution_list = [[*x_i_pop, of_i_pop, fit_i_pop, iteration]]
     i_pop_data = pd.DataFrame(solution_list, columns=columns)
 
     return i_pop_data
@@ -765,7 +1331,7 @@ def resume_best_data_in_dataframe(x_pop, of_pop, fit_pop, column_best, column_wo
     This function creates a dataframe with the best, worst and average values of the population.
     
     Args:
-        x_pop (List): Population design variables
+        x_pop (List or Array): Population design variables
         of_pop (List): Population objective function values
         fit_pop (List): Population fitness values
         column_best (List): Columns names about dataset results
@@ -784,16 +1350,8 @@ def resume_best_data_in_dataframe(x_pop, of_pop, fit_pop, column_best, column_wo
     fit_worst, of_avg, fit_avg = best_values(x_pop, of_pop, fit_pop)
 
     # Dataframe creation
-    aux = x_best.copy()
-    aux.append(of_best)
-    aux.append(fit_best)
-    aux.append(best_id)
-    best_solution = pd.DataFrame([aux], columns = column_best)
-    aux = x_worst.copy()
-    aux.append(of_worst)
-    aux.append(fit_worst)
-    aux.append(worst_id)
-    worst_solution = pd.DataFrame([aux], columns = column_worst)
+    best_solution = pd.DataFrame([[*x_best, of_best, fit_best, best_id]], columns = column_best)
+    worst_solution = pd.DataFrame([[*x_worst, of_worst, fit_worst, worst_id]], columns = column_worst)
     avg_solution = pd.DataFrame([[of_avg, fit_avg, iteration, neof_count]], columns = other_columns)
     data_resume = pd.concat([best_solution, worst_solution, avg_solution], axis = 1)
 
@@ -823,7 +1381,7 @@ def summary_analysis(df_best_results):
     return id_min_of
 
 
-def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimension, initial_pop,  x_lower, x_upper, none_variable = None):
+def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimension, initial_pop,  x_lower, x_upper, none_variable = None, vectorized=False, rng=None):
     """
     This function creates a diverse and balanced starting population.
 
@@ -834,13 +1392,17 @@ def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimensio
         initial_pop: initial population
         x_lower: lower limit
         x_upper: upper limit
+        none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        vectorized (Boolean): Evaluates the combined population in a single call (see evaluate_objective). Default is False
+        rng (Generator or None): Random generator (see random_generator). Default is None
 
     Returns:
         of_quasi_oppositional (Float): Update objective function value
         
     """
     quasi_oppositional = np.zeros((n_pop,n_dimension))
-    
+    random_values = random_generator(rng).random((n_pop, n_dimension))
+
 
     for i in range(n_pop):
         for j in range(n_dimension):
@@ -848,10 +1410,10 @@ def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimensio
             m_ij = (x_lower[j] + x_upper[j])/2
             
             if initial_pop[i][j] < m_ij:
-                quasi_oppositional[i][j] = m_ij + (opo_ij - m_ij) * np.random.rand()
+                quasi_oppositional[i][j] = m_ij + (opo_ij - m_ij) * random_values[i][j]
             
             else:
-                quasi_oppositional[i][j] = opo_ij + (m_ij - opo_ij) * np.random.rand()
+                quasi_oppositional[i][j] = opo_ij + (m_ij - opo_ij) * random_values[i][j]
     
     # Check bounds
     quasi_oppositional = check_interval_01(quasi_oppositional, x_lower, x_upper)
@@ -860,10 +1422,8 @@ def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimensio
     combined_population = np.concatenate((initial_pop, quasi_oppositional))
 
     # Evaluates the objective function for all individuals in the combined population    
-    obj_values = obj_function(combined_population, none_variable)
-
-    # Calculate fitness values ​​for all individuals in the combined population
-    fit_new_pop = fit_value(obj_values)
+    # and calculate fitness values ​​for all individuals in the combined population
+    _, fit_new_pop, _ = evaluate_objective(obj_function, combined_population, none_variable, vectorized)
 
     # Sorts the indices of individuals in the combined population based on fitness values ​​(in descending order)
     sorted_indices = np.argsort(fit_new_pop)[::-1]
@@ -879,3 +1439,107 @@ def quasi_oppositional_population_initialization(obj_function, n_pop, n_dimensio
 
 
 
+
+
+class AlgorithmSpec:
+    """
+    Registry entry of a metaheuristic algorithm (see register_algorithm).
+
+    Args:
+        name (String): Algorithm name used in general_setup['algorithm']
+        function (Py function (def)): Entry point. It receives settings ([0] setup, [1] initial population, [2] seed) and returns df_all, df_best, delta_time and report
+        parameters (Dictionary): Parameter schema. Keys of setup['algorithm parameters'] and the list of required keys inside each one
+        vectorized (Boolean): The algorithm supports the 'vectorized objective' setup key
+        parallel_safe (Boolean): The repetitions can run at the same time in separate worker processes
+        type_parameters (Dictionary): Type-dependent schema. For each key of setup['algorithm parameters'], the extra required keys of each 'type' value
+    """
+
+    __slots__ = ('name', 'function', 'parameters', 'vectorized', 'parallel_safe', 'type_parameters')
+
+    def __init__(self, name, function, parameters, vectorized, parallel_safe, type_parameters=None):
+        self.name = name
+        self.function = function
+        self.parameters = parameters
+        self.vectorized = vectorized
+        self.parallel_safe = parallel_safe
+        self.type_parameters = type_parameters or {}
+
+    def check_parameters(self, algorithm_parameters):
+        """
+        Checks the algorithm parameters against the parameter schema.
+
+        Args:
+            algorithm_parameters (Dictionary): setup['algorithm parameters']
+        """
+
+        missing = []
+        for key, sub_keys in self.parameters.items():
+            if key not in algorithm_parameters:
+                missing.append(key)
+                continue
+            missing += [f'{key} -> {sub_key}' for sub_key in sub_keys if sub_key not in algorithm_parameters[key]]
+        for key, types in self.type_parameters.items():
+            type_value = algorithm_parameters.get(key, {}).get('type')
+            missing += [f"{key} -> {sub_key} (required by the '{type_value}' type)"
+                        for sub_key in types.get(type_value, []) if sub_key not in algorithm_parameters[key]]
+        if missing:
+            raise ValueError(f"The {self.name} algorithm parameters must have the following keys:\n- " + '\n- '.join(missing))
+
+
+ALGORITHMS = {}
+
+
+def register_algorithm(name, function, parameters=None, vectorized=False, parallel_safe=True, type_parameters=None):
+    """
+    This function registers an algorithm in metaheuristic_optimizer. A registration with an existing name replaces the previous one.
+
+    Args:
+        name (String): Algorithm name used in general_setup['algorithm']
+        function (Py function (def)): Entry point. It receives settings ([0] setup, [1] initial population, [2] seed) and returns df_all, df_best, delta_time and report
+        parameters (Dictionary): Parameter schema. Keys of setup['algorithm parameters'] and the list of required keys inside each one. Default is None (no check)
+        vectorized (Boolean): The algorithm supports the 'vectorized objective' setup key. Default is False
+        parallel_safe (Boolean): The repetitions can run at the same time in separate worker processes. Default is True
+        type_parameters (Dictionary): Extra required keys that depend on the 'type' value of a parameter group, e.g. {'mutation': {'hill climbing': ['cov (%)', 'pdf']}}. Default is None (no check)
+
+    Returns:
+        spec (AlgorithmSpec): Registry entry
+    """
+
+    spec = AlgorithmSpec(name, function, parameters or {}, vectorized, parallel_safe, type_parameters)
+    ALGORITHMS[name] = spec
+
+    return spec
+
+
+def get_algorithm(name):
+    """
+    This function returns the registry entry of an algorithm.
+
+    Args:
+        name (String): Algorithm name used in general_setup['algorithm']
+
+    Returns:
+        spec (AlgorithmSpec): Registry entry
+    """
+
+    if name not in ALGORITHMS:
+        raise ValueError(f"The algorithm {name} is not available. Options: {', '.join(ALGORITHMS)}")
+
+    return ALGORITHMS[name]
+
+
+def available_algorithms(vectorized=None, parallel_safe=None):
+    """
+    This function lists the registered algorithms, optionally filtered by capability.
+
+    Args:
+        vectorized (Boolean or None): Filter by the vectorized capability. Default is None (no filter)
+        parallel_safe (Boolean or None): Filter by the parallel_safe capability. Default is None (no filter)
+
+    Returns:
+        names (List): Algorithm names
+    """
+
+    return [name for name, spec in ALGORITHMS.items()
+            if (vectorized is None or spec.vectorized == vectorized)
+            and (parallel_safe is None or spec.parallel_safe == parallel_safe)]
@@ -1,60 +1,89 @@
 """differential evolution functions"""
 import time
 
-import numpy as np
-import pandas as pd
 from tqdm import tqdm
 
 import metapy_toolbox.common_library as metapyco
 
 
-def de_movement_01(obj_function, p_c, x_i_old, x_i_mutation, n_dimensions, x_lower, x_upper, none_variable=None):
+def de_movement_01_candidate(p_c, x_i_old, x_i_mutation, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
     """
-    This function performs the differential evolution movement (binomial crossover).
+    This function generates the trial agent of de_movement_01 (binomial crossover) without evaluating it.
 
     Args:
-        of_function (Py function (def)): Objective function. The Metapy user defined this function.
         p_c (Float): Crossover rate.
         x_i_old (List): Current design variables of the i agent.
         x_i_mutation (List): Current design variables of the mutation agent.
         n_dimensions (Integer): Problem dimension.
         x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None.
 
     Returns:
-        x_i_new (List): Update variables of the i agent.
-        of_i_new (Float): Update objective function value of the i agent.
-        fit_i_new (Float): Update fitness value of the i agent.
-        neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.
+        x_i_new (List): Trial design variables of the i agent.
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
     report_move = "    Crossover movement - Binomial DE\n"
-    report_move += f"    current x_current = {x_i_old}\n"
-    report_move += f"    current x mutation = {x_i_mutation}\n"
+    if verbose:
+        report_move += f"    current x_current = {x_i_old}\n"
+        report_move += f"    current x mutation = {x_i_mutation}\n"
     x_i_new = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = metapyco.random_generator(rng).random(n_dimensions)
     for i in range(n_dimensions):
-        lambda_paras = np.random.uniform(low=0, high=1)
+        lambda_paras = random_values[i]
         if lambda_paras <= p_c:
             neighbor = x_i_mutation[i]
-            type_move = f'random_number {lambda_paras} <= p_c {p_c} (copy mutation)'
+            type_move = '<= p_c {} (copy mutation)'
         else:
             neighbor = x_i_old[i]
-            type_move = f'random_number {lambda_paras} > p_c {p_c} (dont copy mutation)'
+            type_move = '> p_c {} (dont copy mutation)'
         x_i_new.append(neighbor)
-        report_move += f"    Dimension {i}: {type_move}, neighbor = {neighbor}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: random_number {lambda_paras} {type_move.format(p_c)}, neighbor = {neighbor}\n"
 
     # Check bounds
     x_i_new = metapyco.check_interval_01(x_i_new, x_lower, x_upper)
 
+    return x_i_new, report_move
+
+
+def de_movement_01(obj_function, p_c, x_i_old, x_i_mutation, n_dimensions, x_lower, x_upper, none_variable=None, verbose=True, rng=None):
+    """
+    This function performs the differential evolution movement (binomial crossover).
+
+    Args:
+        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+        p_c (Float): Crossover rate.
+        x_i_old (List): Current design variables of the i agent.
+        x_i_mutation (List): Current design variables of the mutation agent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None.
+
+    Returns:
+        x_i_new (List): Update variables of the i agent.
+        of_i_new (Float): Update objective function value of the i agent.
+        fit_i_new (Float): Update fitness value of the i agent.
+        neof (Integer): Number of evaluations of the objective function.
+        report (String): Report about the male movement process.
+    """
+
+    # Movement
+    x_i_new, report_move = de_movement_01_candidate(p_c, x_i_old, x_i_mutation, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(x_i_new, none_variable)
     fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return x_i_new, of_i_new, fit_i_new, neof, report_move
@@ -73,17 +102,20 @@ def differential_evolution_01(settings):
             'x pop upper limit' (List): Upper limit of the design variables.
             'none_variable' (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function.
             'objective function' (Py function (def)): Objective function. The Metapy user defined this function.                                                
+            'vectorized objective' (Boolean): Optional. True when the objective function receives the (n_population x n_dimensions) array and returns the n_population values; the trial population is then evaluated in a single call per iteration. Default is False.
+            'history' (String): Optional. 'full', 'best' or 'none'. Controls how much iteration data is stored in df_all and df_best. Default is 'full'.
+            'report' (String): Optional. 'off', 'summary' or 'full'. Controls how much of the execution is recorded in the report. Default is 'full'.
             'algorithm parameters' (Dictionary): Algorithm parameters. See documentation.
                 'mutation'  (Dictionary): Mutation parameters.
                 'crossover' (Dictionary): Crossover parameters.
         initial population (List or METApy function): Initial population.
-        seed (None or integer): Random seed. Use None for random seed.
+        seed (None, Integer, SeedSequence or Generator): Random seed (see metapyco.random_generator). Use None for random seed.
     
     Returns:
         df_all (Dataframe): All data of the population.
         df_best (Dataframe): Best data of the population.
         delta_time (Float): Time of the algorithm execution in seconds.
-        report (String): Report of the algorithm execution.
+        report (Report): Report of the algorithm execution (metapyco.Report). Use str(report) to get the text.
     """
 
     # Setup config
@@ -95,11 +127,8 @@ def differential_evolution_01(settings):
     x_upper = setup['x pop upper limit']
     none_variable = setup['none variable']
     obj_function = setup['objective function']
-    seeds = settings[2]
-    if seeds is None:
-        pass
-    else:
-        np.random.seed(seeds)
+    vectorized = setup.get('vectorized objective', False)
+    rng = metapyco.random_generator(settings[2])
 
     # Algorithm_parameters
     algorithm_parameters = setup['algorithm parameters']
@@ -118,162 +147,118 @@ def differential_evolution_01(settings):
         pass
 
     # Creating variables in the iteration procedure
-    of_pop = []
-    fit_pop = []
     neof_count = 0
 
-    # Storage values: columns names about dataset results
-    columns_all_data = ['X_' + str(i) for i in range(n_dimensions)]
-    columns_all_data.append('OF')
-    columns_all_data.append('FIT')
-    columns_all_data.append('ITERATION')
-    columns_repetition_data = ['X_' + str(i) + '_BEST' for i in range(n_dimensions)]
-    columns_repetition_data.append('OF BEST')
-    columns_repetition_data.append('FIT BET')
-    columns_repetition_data.append('ID BEST')
-    columns_worst_data  = ['X_' + str(i)  + '_WORST' for i in range(n_dimensions)]
-    columns_worst_data.append('OF WORST')
-    columns_worst_data.append('FIT WORST')
-    columns_worst_data.append('ID WORST')
-    columns_other_data = ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
-    report = "Genetic Algorithm 01- report \n\n"
-    all_data_pop = []
-    resume_result = []
+    report = metapyco.Report("Genetic Algorithm 01- report \n\n", setup.get('report', 'full'))
+    history = metapyco.History(n_iterations, n_population, n_dimensions, setup.get('history', 'full'))
 
     # Initial population and evaluation solutions
-    report += "Initial population\n"
-    x_pop = settings[1].copy()
-    for i_pop in range(n_population):
-        of_pop.append(obj_function(x_pop[i_pop], none_variable))
-        fit_pop.append(metapyco.fit_value(of_pop[i_pop]))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(x_pop[i_pop], of_pop[i_pop],
-                                                               fit_pop[i_pop], columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    report.summary("Initial population\n")
+    population = metapyco.Population(settings[1])
+    neof_count += population.evaluate(obj_function, none_variable, vectorized=vectorized)
+    history.record_agents(0, population.x, population.of, population.fit)
 
     # Best, average and worst values and storage
-    repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                             columns_repetition_data,
-                                                             columns_worst_data,
-                                                             columns_other_data,
-                                                             neof_count, iteration=0)
-    resume_result.append(repetition_data)
-    for i_pop in range(n_population):
-        if i_pop == best_id:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-        else:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+    best_id = history.record_best(0, population.x, population.of, population.fit, neof_count)
+    report.population(population.x, population.of, best_id)
 
     # Iteration procedure
+    offspring = population.copy()
     progress_bar = tqdm(total=n_iterations, desc='Progress')
-    report += "\nIterations\n"
+    report.summary("\nIterations\n")
     for iter in range(n_iterations):
-        report += f"\nIteration: {iter+1}\n"
+        report.summary("\nIteration: {}\n", iter+1)
 
         # Time markup
         initial_time = time.time()
 
-        # Copy results
-        x_temp = x_pop.copy()
-
-        # Population movement
+        # Population movement (trial agents are generated agent by agent and evaluated in a single step)
+        reports_pop = []
+        random_values = rng.random(n_population)
         for pop in range(n_population):
-            report += f"Pop id: {pop} - particle movement\n"
-            report += f"    current x = {x_temp[pop]}\n"
+            report_pop = ""
+            if report.verbose:
+                report_pop += f"Pop id: {pop} - particle movement\n"
+                report_pop += f"    current x = {population.x[pop].tolist()}\n"
 
             # Selection and Mutation
-            random_value = np.random.uniform(low=0, high=1)
+            random_value = random_values[pop]
             if random_value <= p_m:
                 if mut_type == 'de/rand/1':
                     # Selection
-                    selected, report_mov = metapyco.agent_selection(n_population, 3, pop)
-                    report += report_mov
-                    report += "    Mutation operator - de/rand/1\n"
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = metapyco.mutation_03_de_movement(obj_function,
-                                                                        x_temp[selected[0]],
-                                                                        x_temp[selected[1]],
-                                                                        x_temp[selected[2]],
-                                                                        x_lower,
-                                                                        x_upper,
-                                                                        n_dimensions,
-                                                                        f_scale,
-                                                                        none_variable)
+                    selected, report_mov = metapyco.agent_selection(n_population, 3, pop, verbose=report.verbose, rng=rng)
+                    report_pop += report_mov
+                    report_pop += "    Mutation operator - de/rand/1\n"
+                    x_i_temp, report_mov = metapyco.mutation_03_de_candidate(population.x[selected[0]].tolist(),
+                                                                             population.x[selected[1]].tolist(),
+                                                                             population.x[selected[2]].tolist(),
+                                                                             x_lower,
+                                                                             x_upper,
+                                                                             n_dimensions,
+                                                                             f_scale,
+                                                                             verbose=report.verbose)
                 elif mut_type == 'de/rand/2':
                     # Selection
-                    selected, report_mov = metapyco.agent_selection(n_population, 4, pop)
-                    report += report_mov
-                    report += "    Mutation operator - de/rand/2\n"
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = metapyco.mutation_04_de_movement(obj_function,
-                                                                        x_temp[selected[0]],
-                                                                        x_temp[selected[1]],
-                                                                        x_temp[selected[2]],
-                                                                        x_temp[selected[3]],
-                                                                        x_lower,
-                                                                        x_upper,
-                                                                        n_dimensions,
-                                                                        f_scale,
-                                                                        none_variable)
-                report += report_mov
+                    selected, report_mov = metapyco.agent_selection(n_population, 5, pop, verbose=report.verbose, rng=rng)
+                    report_pop += report_mov
+                    report_pop += "    Mutation operator - de/rand/2\n"
+                    x_i_temp, report_mov = metapyco.mutation_04_de_candidate(population.x[selected[0]].tolist(),
+                                                                             population.x[selected[1]].tolist(),
+                                                                             population.x[selected[2]].tolist(),
+                                                                             population.x[selected[3]].tolist(),
+                                                                             population.x[selected[4]].tolist(),
+                                                                             x_lower,
+                                                                             x_upper,
+                                                                             n_dimensions,
+                                                                             f_scale,
+                                                                             verbose=report.verbose)
+                report_pop += report_mov
 
             # Crossover
-            x_i_temp, of_i_temp,\
-                fit_i_temp, neof,\
-                report_mov = de_movement_01(obj_function,
-                                            p_c,
-                                            x_pop[pop],
-                                            x_i_temp,
-                                            n_dimensions,
-                                            x_lower,
-                                            x_upper,
-                                            none_variable)
-            report += report_mov
-
-            # Update neof (Number of Objective Function Evaluations)
-            neof_count += neof
+            x_i_temp, report_mov = de_movement_01_candidate(p_c,
+                                                            population.x[pop].tolist(),
+                                                            x_i_temp,
+                                                            n_dimensions,
+                                                            x_lower,
+                                                            x_upper,
+                                                            verbose=report.verbose,
+                                                            rng=rng)
+            offspring.x[pop] = x_i_temp
+            reports_pop.append(report_pop + report_mov)
+
+        # Update neof (Number of Objective Function Evaluations)
+        neof_count += offspring.evaluate(obj_function, none_variable, vectorized=vectorized)
+        history.record_agents(iter+1, offspring.x, offspring.of, offspring.fit)
+
+        for pop in range(n_population):
+            x_i_temp, of_i_temp, fit_i_temp = offspring.x[pop].tolist(), offspring.of[pop], offspring.fit[pop]
+            report.detail(reports_pop[pop])
+            report.detail("    update x = {}, of = {}, fit = {}\n", x_i_temp, of_i_temp, fit_i_temp)
 
             # New design variables
-            if fit_i_temp > fit_pop[pop]:
-                report += "    fit_i_temp > fit_pop[pop] - accept this solution\n"
-                x_pop[pop] = x_i_temp.copy()
-                of_pop[pop] = of_i_temp
-                fit_pop[pop] = fit_i_temp
+            if fit_i_temp > population.fit[pop]:
+                report.detail("    fit_i_temp > fit_pop[pop] - accept this solution\n")
+                population.update(pop, x_i_temp, of_i_temp, fit_i_temp)
             else:
-                report += "    fit_i_temp < fit_pop[pop] - not accept this solution\n"              
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(x_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+                report.detail("    fit_i_temp < fit_pop[pop] - not accept this solution\n")
 
         # Best, average and worst values and storage
-        repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                                columns_repetition_data,
-                                                                columns_worst_data,
-                                                                columns_other_data,
-                                                                neof_count,
-                                                                iteration=iter+1)
-        resume_result.append(repetition_data)
-        report += "update solutions\n"
-        for i_pop in range(n_population):
-            if i_pop == best_id:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-            else:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+        best_id = history.record_best(iter+1, population.x, population.of, population.fit, neof_count)
+        report.summary("update solutions\n")
+        report.population(population.x, population.of, best_id)
         progress_bar.update()        
 
     # Time markup
     end_time = time.time()
     delta_time = end_time - initial_time
 
-    # Storage all values in DataFrame
-    df_all = pd.concat(all_data_pop, ignore_index=True)
-
-    # Storage best values in DataFrame
-    df_best = pd.concat(resume_result, ignore_index=True)
+    # Storage all values and best values in DataFrame
+    df_all, df_best = history.dataframes()
 
     return df_all, df_best, delta_time, report
+
+
+metapyco.register_algorithm('differential_evolution_01', differential_evolution_01,
+                            parameters={'mutation': ['mutation rate (%)', 'type', 'scale factor (F)'],
+                                        'crossover': ['crossover rate (%)', 'type']},
+                            vectorized=True, parallel_safe=True)
@@ -0,0 +1,128 @@
+"""Repetition executor functions"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+
+_WORKER_NONE_VARIABLE = None
+
+
+def _init_worker(none_variable):
+    """
+    This function stores the none variable in the worker process. It is called once per worker by the process pool.
+
+    Args:
+        none_variable (None, list, float, dictionary, str or any): None variable of the algorithm setup
+    """
+
+    global _WORKER_NONE_VARIABLE
+    _WORKER_NONE_VARIABLE = none_variable
+
+
+def _run_repetition(algorithm, settings):
+    """
+    This function runs one repetition in a worker process, restoring the none variable sent by the pool initializer.
+
+    Args:
+        algorithm (Py function (def)): Algorithm function
+        settings (List): [0] setup without none variable, [1] initial population, [2] seed
+
+    Returns:
+        results (Tuple): Algorithm results (df_all, df_best, delta_time, report)
+    """
+
+    setup = dict(settings[0])
+    setup['none variable'] = _WORKER_NONE_VARIABLE
+
+    return algorithm([setup, settings[1], settings[2]])
+
+
+class RepetitionExecutor:
+    """
+    Persistent executor of the optimization repetitions. The worker pool is created on the first run and reused by the next ones until close is called (or the with block ends).
+
+    Args:
+        backend (String): Execution backend. Options: 'process' (process pool, the none variable is sent once per worker), 'thread' (thread pool) or 'serial' (repetitions run one after the other in the current process). Default is 'process'
+        n_workers (Integer or None): Number of workers. Default is None (number of processors)
+
+    Note:
+        Each repetition draws from its own random generator (settings[2], see metapyco.repetition_seeds), so seeded runs give the same results with any backend.
+    """
+
+    __slots__ = ('backend', 'n_workers', '_pool', '_none_variable')
+
+    def __init__(self, backend='process', n_workers=None):
+        if backend not in ('process', 'thread', 'serial'):
+            raise ValueError("The backend parameter must be 'process', 'thread' or 'serial'.")
+        if n_workers is not None and (not isinstance(n_workers, int) or n_workers < 1):
+            raise ValueError('The number of workers parameter must be a positive integer or None.')
+        self.backend = backend
+        self.n_workers = n_workers
+        self._pool = None
+        self._none_variable = None
+
+    def _process_pool(self, none_variable):
+        """
+        Returns the process pool, creating it when the none variable is not the one already sent to the workers.
+
+        Args:
+            none_variable (None, list, float, dictionary, str or any): None variable of the algorithm setup
+
+        Returns:
+            pool (ProcessPoolExecutor): Process pool
+        """
+
+        if self._pool is None or self._none_variable is not none_variable:
+            self.close()
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers,
+                                             initializer=_init_worker,
+                                             initargs=(none_variable,))
+            self._none_variable = none_variable
+
+        return self._pool
+
+    def run(self, algorithm, settings):
+        """
+        Runs the repetitions and yields the results as the repetitions finish.
+
+        Args:
+            algorithm (Py function (def)): Algorithm function (e.g. metapysa.hill_climbing_01)
+            settings (List): One [setup, initial population, seed] list per repetition. All repetitions share the none variable of the setup
+
+        Returns:
+            results (Generator): (repetition id, algorithm results) tuples in completion order
+        """
+
+        if self.backend == 'serial':
+            for i, setting in enumerate(settings):
+                yield i, algorithm(setting)
+            return
+
+        if self.backend == 'thread':
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.n_workers)
+            futures = {self._pool.submit(algorithm, setting): i for i, setting in enumerate(settings)}
+        else:
+            pool = self._process_pool(settings[0][0]['none variable'] if settings else None)
+            futures = {}
+            for i, setting in enumerate(settings):
+                setup = dict(setting[0])
+                setup['none variable'] = None
+                futures[pool.submit(_run_repetition, algorithm, [setup, setting[1], setting[2]])] = i
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def close(self):
+        """
+        Shuts down the worker pool.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._none_variable = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,9 +1,7 @@
 """firefly algorithm functions"""
 import time
-import random
 
 import numpy as np
-import pandas as pd
 from tqdm import tqdm
 
 import metapy_toolbox.common_library as metapyco
@@ -83,12 +81,11 @@ def attractiveness_parameter(beta_0, gamma, x_i, x_j, n_dimensions):
     return beta, r_ij
 
 
-def male_movement(obj_function, beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_j_old, y_k_old, fit_k_old, n_dimensions, x_lower, x_upper, none_variable=None):
+def male_movement_candidate(beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_j_old, y_k_old, fit_k_old, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
     """
-    This function movement an male firefly.
+    This function generates the male firefly movement of male_movement without evaluating it.
 
     Args:
-        of_function (Py function (def)): Objective function. The Metapy user defined this function.
         beta_0 (Float): Attractiveness at r = 0
         gamma (List): Light absorption coefficient  1 / (x_upper - x_lower) ** m
         x_i_old (List): Design variables i (male) Firefly
@@ -100,30 +97,29 @@ def male_movement(obj_function, beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_
         n_dimensions (Integer): Problem dimension
         x_lower (List): Lower limit of the problem
         x_upper (List): Upper limit of the problem
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None
     
     Returns:
         x_i_new (List): Update variables of the i agent.
-        of_i_new (Float): Update objective function value of the i agent.
-        fit_i_new (Float): Update fitness value of the i agent.
-        neof (Integer): Number of evaluations of the objective function.
         report (str): Report about the male movement process.
     """
 
     # Discriminant factor
     d_j = discriminant_factor(fit_i_old, fit_j_old)
     d_k = discriminant_factor(fit_i_old, fit_k_old)
-    report_move = f"    d_j = {d_j}, d_k = {d_k}\n"
+    report_move = f"    d_j = {d_j}, d_k = {d_k}\n" if verbose else ""
 
     # Attractiveness parameter
     beta_j, r_j = attractiveness_parameter(beta_0, gamma, x_i_old, y_j_old, n_dimensions)
     beta_k, r_k = attractiveness_parameter(beta_0, gamma, x_i_old, y_k_old, n_dimensions)
-    report_move += f"    r_j = {r_j} beta_j = {beta_j}, r_k = {r_k} beta_k = {beta_k}\n"
+    if verbose:
+        report_move += f"    r_j = {r_j} beta_j = {beta_j}, r_k = {r_k} beta_k = {beta_k}\n"
 
     # Lambda and mu random parameters
-    lambda_paras = np.random.random()
-    mu_paras = np.random.random()
-    report_move += f"    lambda = {lambda_paras}, mu = {mu_paras}\n"
+    lambda_paras, mu_paras = metapyco.random_generator(rng).random(2)
+    if verbose:
+        report_move += f"    lambda = {lambda_paras}, mu = {mu_paras}\n"
 
     # Movement
     x_i_new = []
@@ -135,44 +131,86 @@ def male_movement(obj_function, beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_
         # Update firefly position
         aux = x_i_old[i] + second_term + third_term
         x_i_new.append(aux)
-        report_move += f"    Dimension {i}: 2nd = {second_term}, 3rd = {third_term}, neighbor = {aux}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: 2nd = {second_term}, 3rd = {third_term}, neighbor = {aux}\n"
 
     # Check bounds
     x_i_new = metapyco.check_interval_01(x_i_new, x_lower, x_upper)
 
+    return x_i_new, report_move
+
+
+def male_movement(obj_function, beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_j_old, y_k_old, fit_k_old, n_dimensions, x_lower, x_upper, none_variable=None, verbose=True, rng=None):
+    """
+    This function movement an male firefly.
+
+    Args:
+        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+        beta_0 (Float): Attractiveness at r = 0
+        gamma (List): Light absorption coefficient  1 / (x_upper - x_lower) ** m
+        x_i_old (List): Design variables i (male) Firefly
+        fit_i_old (Float): Fitness of the i firefly
+        y_j_old (List): Design variables j (female) Firefly
+        fit_j_old (Float): Fitness of the j firefly
+        y_k_old (List): Design variables k (female) Firefly
+        fit_k_old (Float): Fitness of the k firefly
+        n_dimensions (Integer): Problem dimension
+        x_lower (List): Lower limit of the problem
+        x_upper (List): Upper limit of the problem
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None.
+    
+    Returns:
+        x_i_new (List): Update variables of the i agent.
+        of_i_new (Float): Update objective function value of the i agent.
+        fit_i_new (Float): Update fitness value of the i agent.
+        neof (Integer): Number of evaluations of the objective function.
+        report (str): Report about the male movement process.
+    """
+
+    # Movement
+    x_i_new, report_move = male_movement_candidate(beta_0, gamma, x_i_old, fit_i_old, y_j_old, fit_j_old, y_k_old, fit_k_old,
+                                                   n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(x_i_new, none_variable)
     fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return x_i_new, of_i_new, fit_i_new, neof, report_move
 
 
-def female_movement(obj_function, beta_0, gamma, x_i_old_best, y_j_old, n_dimensions, x_lower, x_upper, none_variable=None):
+def female_movement_candidate(beta_0, gamma, x_i_old_best, y_j_old, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
     """
-    This function movement an female firefly.
+    This function generates the female firefly movement of female_movement without evaluating it.
 
     Args:
-        of_function (Py function (def)): Objective function. The Metapy user defined this function.
         beta_0 (Float): Attractiveness at r = 0
         gamma (List): Light absorption coefficient  1 / (x_upper - x_lower) ** m
+        x_i_old_best (List): Design variables of the best male Firefly
+        y_j_old (List): Design variables j (female) Firefly
+        n_dimensions (Integer): Problem dimension
+        x_lower (List): Lower limit of the problem
+        x_upper (List): Upper limit of the problem
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None
          
     Returns:
         y_i_new (List): Update variables of the i agent.
-        of_i_new (Float): Update objective function value of the i agent.
-        fit_i_new (Float): Update fitness value of the i agent.
-        neof (Integer): Number of evaluations of the objective function.
-        report_move (str): Report about the male movement process.
+        report_move (str): Report about the female movement process.
     """
 
     # Attractiveness parameter
     beta_j, r_j = attractiveness_parameter(beta_0, gamma, x_i_old_best, y_j_old, n_dimensions)
-    report_move = f"    r_j = {r_j} beta_j = {beta_j}\n"
+    report_move = f"    r_j = {r_j} beta_j = {beta_j}\n" if verbose else ""
 
     # phi random parameter
-    phi_paras = np.random.random()
-    report_move += f"    phi = {phi_paras}\n"
+    phi_paras = metapyco.random_generator(rng).random()
+    if verbose:
+        report_move += f"    phi = {phi_paras}\n"
 
     # Movement
     y_i_new = []
@@ -181,16 +219,43 @@ def female_movement(obj_function, beta_0, gamma, x_i_old_best, y_j_old, n_dimens
         second_term = beta_j[i] * phi_paras * (x_i_old_best[i] - y_j_old[i])
         # Update firefly position
         aux = y_j_old[i] + second_term
-        report_move += f"    Dimension {i}: 2nd = {second_term}, neighbor = {aux}\n"
-    y_i_new.append(aux)
+        y_i_new.append(aux)
+        if verbose:
+            report_move += f"    Dimension {i}: 2nd = {second_term}, neighbor = {aux}\n"
 
     # Check bounds
     y_i_new = metapyco.check_interval_01(y_i_new, x_lower, x_upper)
 
+    return y_i_new, report_move
+
+
+def female_movement(obj_function, beta_0, gamma, x_i_old_best, y_j_old, n_dimensions, x_lower, x_upper, none_variable=None, verbose=True, rng=None):
+    """
+    This function movement an female firefly.
+
+    Args:
+        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+        beta_0 (Float): Attractiveness at r = 0
+        gamma (List): Light absorption coefficient  1 / (x_upper - x_lower) ** m
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None
+         
+    Returns:
+        y_i_new (List): Update variables of the i agent.
+        of_i_new (Float): Update objective function value of the i agent.
+        fit_i_new (Float): Update fitness value of the i agent.
+        neof (Integer): Number of evaluations of the objective function.
+        report_move (str): Report about the male movement process.
+    """
+
+    # Movement
+    y_i_new, report_move = female_movement_candidate(beta_0, gamma, x_i_old_best, y_j_old, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+
     # Evaluation of the objective function and fitness
     of_i_new = obj_function(y_i_new, none_variable)
     fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update x = {y_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+    if verbose:
+        report_move += f"    update x = {y_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
     neof = 1
 
     return y_i_new, of_i_new, fit_i_new, neof, report_move
@@ -201,7 +266,7 @@ def gender_firefly_01(settings):
     Gender firefly algorithm.
     
     Args:  
-        settings (List): [0] setup (dict), [1] initial population (List), [2] seeds (Integer).
+        settings (List): [0] setup (dict), [1] initial population (List), [2] seeds (None, Integer, SeedSequence or Generator. See metapyco.random_generator).
             'number of population' (Integer): number of population.
             'number of iterations' (Integer): number of iterations.
             'number of dimensions' (Integer): Problem dimension.
@@ -209,6 +274,9 @@ def gender_firefly_01(settings):
             'x pop upper limit' (List): Upper limit of the design variables.
             'none variable' (Object or None): None variable. Default is None. Use in objective function.
             'objective function' (function): Objective function. The Metapy user defined this function.                                                
+            'vectorized objective' (bool): Optional. True when the objective function receives the (n x n_dimensions) array and returns the n values; the male and female movements are then evaluated in a single call each. Default is False.
+            'history' (String): Optional. 'full', 'best' or 'none'. Controls how much iteration data is stored in df_all and df_best. Default is 'full'.
+            'report' (String): Optional. 'off', 'summary' or 'full'. Controls how much of the execution is recorded in the report. Default is 'full'.
             'algorithm parameters' (dict): Algorithm parameters.
                 'beta 0' (Float): Attractiveness at r = 0.
                 gamma (List): Light absorption coefficient  1 / (x_lower - x_upper) ** m.
@@ -217,7 +285,7 @@ def gender_firefly_01(settings):
         df_all (dataframe): All data of the population.
         df_best (dataframe): Best data of the population.
         delta_time (Float): Time of the algorithm execution in seconds.
-        report (str): Report of the algorithm execution.
+        report (Report): Report of the algorithm execution (metapyco.Report). Use str(report) to get the text.
     """
 
     # setup config
@@ -229,14 +297,13 @@ def gender_firefly_01(settings):
     x_upper = setup['x pop upper limit']
     none_variable = setup['none variable']
     obj_function = setup['objective function']
-    seeds = settings[2]
-    if seeds is None:
-        pass
-    else:
-        np.random.seed(seeds)
+    vectorized = setup.get('vectorized objective', False)
+    of_agent = metapyco.agent_objective(obj_function, vectorized)
+    rng = metapyco.random_generator(settings[2])
 
     # algorithm_parameters
     algorithm_parameters = setup['algorithm parameters']
+    metapyco.get_algorithm('gender_firefly_01').check_parameters(algorithm_parameters)
     beta_0 = algorithm_parameters['attractiveness']['beta_0']
     gamma = algorithm_parameters['attractiveness']['gamma']
     n_pop_female = algorithm_parameters['female population']['number of females']
@@ -257,239 +324,195 @@ def gender_firefly_01(settings):
         pdf = algorithm_parameters['mutation']['pdf']
 
     # Creating variables in the iteration procedure
-    of_pop = []
-    fit_pop = []
     neof_count = 0
 
-    # Storage values: columns names about dataset results
-    columns_all_data = ['X_' + str(i) for i in range(n_dimensions)]
-    columns_all_data.append('OF')
-    columns_all_data.append('FIT')
-    columns_all_data.append('ITERATION')
-    columns_repetition_data = ['X_' + str(i) + '_BEST' for i in range(n_dimensions)]
-    columns_repetition_data.append('OF BEST')
-    columns_repetition_data.append('FIT BET')
-    columns_repetition_data.append('ID BEST')
-    columns_worst_data  = ['X_' + str(i)  + '_WORST' for i in range(n_dimensions)]
-    columns_worst_data.append('OF WORST')
-    columns_worst_data.append('FIT WORST')
-    columns_worst_data.append('ID WORST')
-    columns_other_data = ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
-    report = "Firefly Gender Algorithm - report\n\n"
-    all_data_pop = []
-    resume_result = []
+    report = metapyco.Report("Firefly Gender Algorithm - report\n\n", setup.get('report', 'full'))
+    history = metapyco.History(n_iterations, n_population+n_pop_female, n_dimensions, setup.get('history', 'full'))
 
     # Initial population and evaluation solutions
-    report += "Initial population\n"
-    x_pop = settings[1].copy()
-    for i_pop in range(n_population):
-        of_pop.append(obj_function(x_pop[i_pop], none_variable))
-        fit_pop.append(metapyco.fit_value(of_pop[i_pop]))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(x_pop[i_pop], of_pop[i_pop],
-                                                               fit_pop[i_pop], columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    report.summary("Initial population\n")
+    population = metapyco.Population(np.empty((n_population + n_pop_female, n_dimensions)))
+    population.x[:n_population] = settings[1]
+    neof_count += population.evaluate(obj_function, none_variable, ids=range(n_population), vectorized=vectorized)
 
     # Female population and evaluation solutions
-    y_pop = metapyco.initial_population_01(n_pop_female, n_dimensions, x_lower, x_upper)
-    for i_pop in range(n_pop_female):
-        x_pop.append(y_pop[i_pop].copy())
-        y_obj = obj_function(y_pop[i_pop], none_variable)
-        of_pop.append(y_obj)
-        fit_pop.append(metapyco.fit_value(y_obj))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(y_pop[i_pop],
-                                                               of_pop[i_pop+n_population],
-                                                               fit_pop[i_pop+n_population],
-                                                               columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    population.x[n_population:] = metapyco.initial_population_01(n_pop_female, n_dimensions, x_lower, x_upper, seed=rng)
+    neof_count += population.evaluate(obj_function, none_variable,
+                                      ids=range(n_population, n_population+n_pop_female),
+                                      vectorized=vectorized)
+    history.record_agents(0, population.x, population.of, population.fit)
 
     # Best, average and worst values and storage
-    repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                             columns_repetition_data,
-                                                             columns_worst_data,
-                                                             columns_other_data,
-                                                             neof_count, iteration=0)
-    resume_result.append(repetition_data)
-    for i_pop in range(n_population+n_pop_female):
-        if i_pop <= (n_population - 1):
-            id_pop_male_or_female = 'MA'
-        else:
-            id_pop_male_or_female = f'FE (y_{i_pop-n_population})'
-        if i_pop == best_id:
-            report += f'{id_pop_male_or_female} x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-        else:
-            report += f'{id_pop_male_or_female} x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+    best_id = history.record_best(0, population.x, population.of, population.fit, neof_count)
+    labels = ['MA'] * n_population + [f'FE (y_{i_pop})' for i_pop in range(n_pop_female)]
+    report.population(population.x, population.of, best_id, labels=labels)
 
     # Iteration procedure
-    report += "\nIterations\n"
+    offspring = population.copy()
+    report.summary("\nIterations\n")
     for iter in range(n_iterations):
-        report += f"\nIteration: {iter+1}\n"
+        report.summary("\nIteration: {}\n", iter+1)
 
         # Time markup
         initial_time = time.time()
 
-        # Population separation
-        x_male_pop = x_pop[:n_population]
-        y_female_pop = x_pop[n_population:]
-        fit_male_pop = fit_pop[:n_population]
-        fit_female_pop = fit_pop[n_population:]
-        of_male_pop = of_pop[:n_population]
-        of_female_pop = of_pop[n_population:]
+        # Population separation (views: the agents are only replaced after the movement of their group)
+        x_male_pop = population.x[:n_population]
+        y_female_pop = population.x[n_population:]
+        fit_male_pop = population.fit[:n_population]
+        fit_female_pop = population.fit[n_population:]
+        of_male_pop = population.of[:n_population]
+        of_female_pop = population.of[n_population:]
 
         # Best male
         _, _, x_male_best, _, _,\
             _, _, _, _, _ = metapyco.best_values(x_male_pop, of_male_pop, fit_male_pop)
 
-        # Male population movement
+        # Male population movement (evaluated in a single step)
+        reports_pop = []
         for pop in range(n_population):
-            report += f"Pop id: {pop} - particle movement - male procedure\n"
-            report += f"    current x = {x_male_pop[pop]}, of = {of_male_pop[pop]}, fit = {fit_male_pop[pop]}\n"
-            pos = random.sample(range(0, n_pop_female), 2)
+            pos = rng.choice(n_pop_female, 2, replace=False)
             id_y_j, id_y_k = pos[0], pos[1]
-            report += f"    selected female id y_j = {id_y_j} y_j{y_female_pop[id_y_j]}, id y_k = {id_y_k} y_k{y_female_pop[id_y_k]}\n"
-            x_i_temp, of_i_temp,\
-                fit_i_temp, neof,\
-                report_mov = male_movement(obj_function,
-                                            beta_0,
-                                            gamma,
-                                            x_male_pop[pop],
-                                            fit_male_pop[pop],
-                                            y_female_pop[id_y_j],
-                                            fit_female_pop[id_y_j],
-                                            y_female_pop[id_y_k],
-                                            fit_female_pop[id_y_k],
-                                            n_dimensions,
-                                            x_lower,
-                                            x_upper,
-                                            none_variable=none_variable)
-            report += report_mov
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(x_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+            report_pop = ""
+            if report.verbose:
+                report_pop += f"Pop id: {pop} - particle movement - male procedure\n"
+                report_pop += f"    current x = {x_male_pop[pop].tolist()}, of = {of_male_pop[pop]}, fit = {fit_male_pop[pop]}\n"
+                report_pop += f"    selected female id y_j = {id_y_j} y_j{y_female_pop[id_y_j].tolist()}, id y_k = {id_y_k} y_k{y_female_pop[id_y_k].tolist()}\n"
+            x_i_temp, report_mov = male_movement_candidate(beta_0,
+                                                           gamma,
+                                                           x_male_pop[pop].tolist(),
+                                                           fit_male_pop[pop],
+                                                           y_female_pop[id_y_j].tolist(),
+                                                           fit_female_pop[id_y_j],
+                                                           y_female_pop[id_y_k].tolist(),
+                                                           fit_female_pop[id_y_k],
+                                                           n_dimensions,
+                                                           x_lower,
+                                                           x_upper,
+                                                           verbose=report.verbose,
+                                                           rng=rng)
+            offspring.x[pop] = x_i_temp
+            reports_pop.append(report_pop + report_mov)
+
+        # Update neof (Number of Objective Function Evaluations)
+        neof_count += offspring.evaluate(obj_function, none_variable, ids=range(n_population), vectorized=vectorized)
+
+        for pop in range(n_population):
+            x_i_temp, of_i_temp, fit_i_temp = offspring.x[pop].tolist(), offspring.of[pop], offspring.fit[pop]
+            report.detail(reports_pop[pop])
+            report.detail("    update x = {}, of = {}, fit = {}\n", x_i_temp, of_i_temp, fit_i_temp)
 
             # New design variables
-            if fit_i_temp > fit_pop[pop]:
-                report += "    fit_i_temp > fit_pop[pop] - accept this solution\n"
-                x_pop[pop] = x_i_temp.copy()
-                of_pop[pop] = of_i_temp
-                fit_pop[pop] = fit_i_temp
+            if fit_i_temp > population.fit[pop]:
+                report.detail("    fit_i_temp > fit_pop[pop] - accept this solution\n")
+                population.update(pop, x_i_temp, of_i_temp, fit_i_temp)
             else:
-                report += "    fit_i_temp < fit_pop[pop] - not accept this solution\n"
+                report.detail("    fit_i_temp < fit_pop[pop] - not accept this solution\n")
 
-            # Update neof (Number of Objective Function Evaluations)
-            neof_count += neof
+        # Female movement (evaluated in a single step)
+        reports_pop = []
+        for pop in range(n_pop_female):
+            report_pop = ""
+            if report.verbose:
+                report_pop += f"Pop id: {pop} - particle movement - female procedure \n"
+                report_pop += f"    current y = {y_female_pop[pop].tolist()}, of = {of_female_pop[pop]}, fit = {fit_female_pop[pop]}\n"
+                report_pop += f"    best male = {x_male_best.tolist()}\n"
+            y_i_temp, report_mov = female_movement_candidate(beta_0,
+                                                             gamma,
+                                                             x_male_best.tolist(),
+                                                             y_female_pop[pop].tolist(),
+                                                             n_dimensions,
+                                                             x_lower,
+                                                             x_upper,
+                                                             verbose=report.verbose,
+                                                             rng=rng)
+            offspring.x[pop+n_population] = y_i_temp
+            reports_pop.append(report_pop + report_mov)
+
+        # Update neof (Number of Objective Function Evaluations)
+        neof_count += offspring.evaluate(obj_function, none_variable,
+                                         ids=range(n_population, n_population+n_pop_female),
+                                         vectorized=vectorized)
 
-        # Female movement
         for pop in range(n_pop_female):
-            report += f"Pop id: {pop} - particle movement - female procedure \n"
-            report += f"    current y = {y_female_pop[pop]}, of = {of_female_pop[pop]}, fit = {fit_female_pop[pop]}\n"
-            report += f"    best male = {x_male_best}\n"
-            y_i_temp, of_i_temp,\
-                fit_i_temp, neof,\
-                report_mov = female_movement(obj_function,
-                                                beta_0,
-                                                gamma,
-                                                x_male_best,
-                                                y_female_pop[pop],
-                                                n_dimensions,
-                                                x_lower,
-                                                x_upper,
-                                                none_variable)
-            report += report_mov
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(y_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+            y_i_temp, of_i_temp, fit_i_temp = offspring.x[pop+n_population].tolist(), offspring.of[pop+n_population], offspring.fit[pop+n_population]
+            report.detail(reports_pop[pop])
+            report.detail("    update x = {}, of = {}, fit = {}\n", y_i_temp, of_i_temp, fit_i_temp)
 
             # New design variables
-            if fit_i_temp > fit_pop[pop+n_population]:
-                report += "    fit_i_temp > fit_pop[pop] - accept this solution\n"
-                x_pop[pop+n_population] = y_i_temp.copy()
-                of_pop[pop+n_population] = of_i_temp
-                fit_pop[pop+n_population] = fit_i_temp
+            if fit_i_temp > population.fit[pop+n_population]:
+                report.detail("    fit_i_temp > fit_pop[pop] - accept this solution\n")
+                population.update(pop+n_population, y_i_temp, of_i_temp, fit_i_temp)
             else:
-                report += "    fit_i_temp < fit_pop[pop] - not accept this solution\n"
-
-            # Update neof (Number of Objective Function Evaluations)
-            neof_count += neof
+                report.detail("    fit_i_temp < fit_pop[pop] - not accept this solution\n")
+        history.record_agents(iter+1, offspring.x, offspring.of, offspring.fit)
 
         # Best solution
         id_best, _, x_best, _, of_best,\
-            _, fit_best, _, _, _ = metapyco.best_values(x_pop, of_pop, fit_pop)
+            _, fit_best, _, _, _ = population.best_values()
+        x_best = x_best.tolist()
 
         # Mutation movement
-        report += f"Pop id: {id_best} - particle movement - mutation procedure\n"
+        report.detail("Pop id: {} - particle movement - mutation procedure\n", id_best)
         if type_mut == 'chaotic map 01':
-            report += "    Chaotic Map 01\n"
+            report.detail("    Chaotic Map 01\n")
             x_i_temp, of_i_temp,\
                 fit_i_temp, neof,\
-                report_mov = metapyco.mutation_02_chaos_movement(obj_function, x_best, of_best, fit_best,
+                report_mov = metapyco.mutation_02_chaos_movement(of_agent, x_best, of_best, fit_best,
                                                                         x_lower, x_upper, n_dimensions, alpha,
                                                                         n_tries, iter, n_iterations,
-                                                                        none_variable=none_variable)
+                                                                        none_variable=none_variable,
+                                                                        verbose=report.verbose,
+                                                                        rng=rng)
         elif type_mut == 'hill climbing':
-            report += "    Hill Climbing\n"
+            report.detail("    Hill Climbing\n")
             x_i_temp, of_i_temp,\
                 fit_i_temp, neof,\
-                report_mov = metapyco.mutation_01_hill_movement(obj_function,
+                report_mov = metapyco.mutation_01_hill_movement(of_agent,
                                                             x_best,
                                                             x_lower, x_upper,
                                                             n_dimensions,
                                                             pdf, std,
-                                                            none_variable)
-        report += report_mov
+                                                            none_variable,
+                                                            verbose=report.verbose,
+                                                            rng=rng)
+        report.detail(report_mov)
 
         # Update neof (Number of Objective Function Evaluations)
         neof_count += neof
 
         # New design variables
         if fit_i_temp > fit_best:
-            report += "    fit_i_temp > fit_pop[pop] - accept this solution\n"
-            x_pop[id_best] = x_i_temp.copy()
-            of_pop[id_best] = of_i_temp
-            fit_pop[id_best] = fit_i_temp
+            report.detail("    fit_i_temp > fit_pop[pop] - accept this solution\n")
+            population.update(id_best, x_i_temp, of_i_temp, fit_i_temp)
         else:
-            report += "    fit_i_temp < fit_pop[pop] - not accept this solution\n"
+            report.detail("    fit_i_temp < fit_pop[pop] - not accept this solution\n")
         
         # Best, average and worst values and storage
-        repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                                columns_repetition_data,
-                                                                columns_worst_data,
-                                                                columns_other_data,
-                                                                neof_count,
-                                                                iteration=iter+1)
-        resume_result.append(repetition_data)
-        report += "update solutions\n"
-        for i_pop in range(n_population+n_pop_female):
-            if i_pop <= (n_population - 1):
-                id_pop_male_or_female = 'MA'
-            else:
-                id_pop_male_or_female = f'FE (y_{i_pop-n_population})'
-            if i_pop == best_id:
-                report += f'{id_pop_male_or_female} x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-            else:
-                report += f'{id_pop_male_or_female} x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+        best_id = history.record_best(iter+1, population.x, population.of, population.fit, neof_count)
+        report.summary("update solutions\n")
+        report.population(population.x, population.of, best_id, labels=labels)
 
     # Time markup
     end_time = time.time()
     delta_time = end_time - initial_time
 
-    # Storage all values in DataFrame
-    df_all = pd.concat(all_data_pop, ignore_index=True)
-
-    # Storage best values in DataFrame
-    df_best = pd.concat(resume_result, ignore_index=True)
+    # Storage all values and best values in DataFrame
+    df_all, df_best = history.dataframes()
 
     return df_all, df_best, delta_time, report
 
 
-def firefly_movement(of_function, x_t0i, x_j, beta, alpha, scaling, d, x_lower, x_upper, none_variable):
+metapyco.register_algorithm('gender_firefly_01', gender_firefly_01,
+                            parameters={'attractiveness': ['beta_0', 'gamma'],
+                                        'female population': ['number of females'],
+                                        'mutation': ['type']},
+                            type_parameters={'mutation': {'chaotic map 01': ['number of tries', 'alpha'],
+                                                          'hill climbing': ['cov (%)', 'pdf']}},
+                            vectorized=True, parallel_safe=True)
+
+
+def firefly_movement(of_function, x_t0i, x_j, beta, alpha, scaling, d, x_lower, x_upper, none_variable, rng=None):
     """
     This function creates a new solution using the firefly algorithm movement.
 
@@ -504,6 +527,7 @@ def firefly_movement(of_function, x_t0i, x_j, beta, alpha, scaling, d, x_lower,
     x_lower      | Lower limit design variables                             | Py list[D]
     x_upper      | Upper limit design variables                             | Py list[D]
     none_variable| Empty variable for the user to use in the obj. function  | ?
+    rng          | Random generator (see metapyco.random_generator)         | Generator or None
 
     Output:
     x_t1i        | Design variable I particle after movement                | Py list[D]
@@ -516,8 +540,9 @@ def firefly_movement(of_function, x_t0i, x_j, beta, alpha, scaling, d, x_lower,
     x_t1i = []
     of_t1i = 0
     fit_t1i = 0
+    random_values = metapyco.random_generator(rng).random(d)
     for i_count in range(d):
-        epsilon_i = np.random.random() - 0.50
+        epsilon_i = random_values[i_count] - 0.50
         if scaling:
             s_d = x_upper[i_count] - x_lower[i_count]
         else:
@@ -1,20 +1,24 @@
 """Genetic algorithm functions"""
 import time
+from functools import partial
 
-import pandas as pd
 import numpy as np
+import pandas as pd
 from tqdm import tqdm
 
 import metapy_toolbox.common_library as metapyco
+import metapy_toolbox.selection as metapysel
 
 
-def roulette_wheel_selection(fit_pop, i_pop):
+def roulette_wheel_selection(fit_pop, i_pop, verbose=True, rng=None):
     """
     This function selects a position from the population using the roulette wheel selection method.
 
     Args:
         fit_pop (List): Population fitness values.
         i_pop (Integer):  agent id.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
     
     Returns:
         i_selected (Integer): selected agent id.
@@ -27,7 +31,8 @@ def roulette_wheel_selection(fit_pop, i_pop):
     pos = [int(c) for c in range(len(fit_pop))]
     fit_pop_aux.pop(i_pop)
     maximumm = sum(fit_pop_aux)
-    report_move += f"    sum(fit) = {maximumm}\n"
+    if verbose:
+        report_move += f"    sum(fit) = {maximumm}\n"
     selection_probs = []
 
     # Fit probabilities
@@ -38,67 +43,95 @@ def roulette_wheel_selection(fit_pop, i_pop):
             selection_probs.append(value/maximumm)
 
     # Selection
-    report_move += f"    probs(fit) = {selection_probs}\n"
-    selected = np.random.choice(pos, 1, replace=False, p=selection_probs)
+    if verbose:
+        report_move += f"    probs(fit) = {selection_probs}\n"
+    selected = metapyco.random_generator(rng).choice(pos, 1, replace=False, p=selection_probs)
     i_selected = list(selected)[0]
-    report_move += f"    selected agent id = {i_selected}\n"
+    if verbose:
+        report_move += f"    selected agent id = {i_selected}\n"
 
     return i_selected, report_move
 
 
-def tournament_selection(fit, n_pop, i, runs):
+def _best_offspring(of_function, offspring, none_variable=None, verbose=True):
     """
-    This function selects a position from the population using the tournament selection method.
+    This function evaluates the offspring generated by a crossover candidate function and keeps the best one.
+
+    Args:
+        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+        offspring (List): Offspring design variables (one list per offspring).
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
+                                        User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
 
-    Under construction
+    Returns:
+        x_i_new (List): Update variables of the i agent.
+        of_i_new (Float): Update objective function value of the i agent.
+        fit_i_new (Float): Update fitness value of the i agent.
+        neof (Integer): Number of evaluations of the objective function.
+        report (String): Report about the offspring evaluation.
     """
-    fit_new = list(fit.flatten())
-    pos = [int(c) for c in list(np.arange(0, n_pop, 1, dtype=int))]
-    del pos[i]
-    del fit_new[i]
-    points = [0 for c in range(n_pop)]
-    for j in range(runs):
-        selected_pos = np.random.choice(pos, 2, replace=False)
-        selected_fit = [fit[selected_pos[0]], fit[selected_pos[1]]]
-        if selected_fit[0][0] <= selected_fit[1][0]:
-            win = selected_pos[1]
-        elif selected_fit[0][0] > selected_fit[1][0]:
-            win = selected_pos[0]
-        points[win] += 1
-    m = max(points)
-    poss = [k for k in range(len(points)) if points[k] == m]
-    selected = np.random.choice(poss, 1, replace=False)
-    return selected[0]
 
+    # Evaluation of the objective function and fitness
+    of_offspring = [of_function(x, none_variable) for x in offspring]
+    neof = len(offspring)
+
+    # min of the offspring
+    pos_min = of_offspring.index(min(of_offspring))
+    x_i_new = list(offspring[pos_min])
+    of_i_new = of_offspring[pos_min]
+    fit_i_new = metapyco.fit_value(of_i_new)
+    report_move = _offspring_report(offspring, of_offspring, x_i_new, of_i_new, fit_i_new) if verbose else ""
 
-def linear_crossover(of_function, parent_0, parent_1,\
-                     n_dimensions, x_lower, x_upper, none_variable=None):
+    return x_i_new, of_i_new, fit_i_new, neof, report_move
+
+
+def _offspring_report(offspring, of_offspring, x_i_new, of_i_new, fit_i_new):
     """
-    This function performs the linear crossover operator. 
-    Three new points are generated from the two parent points (offspring).
+    This function formats the report lines of the offspring evaluation.
 
-    Args: 
-        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+    Args:
+        offspring (List or Array): Offspring design variables (one row per offspring).
+        of_offspring (List or Array): Objective function values of the offspring.
+        x_i_new (List): Design variables of the best offspring.
+        of_i_new (Float): Objective function value of the best offspring.
+        fit_i_new (Float): Fitness value of the best offspring.
+
+    Returns:
+        report (String): Report about the offspring evaluation.
+    """
+
+    report_move = ""
+    for label, x, of in zip('abc', offspring, of_offspring):
+        report_move += f"    offspring {label} = {x}, of_{label} = {of}\n"
+    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
+
+    return report_move
+
+
+def linear_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of linear_crossover without evaluating them.
+
+    Args:
         parent_0 (List): First parent (Current design variables).
         parent_1 (List): Second parent (Current design variables).
         n_dimensions (Integer): Problem dimension.
         x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
-                                        User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Not used (deterministic operator). Kept for the uniform signature of CROSSOVER_OPERATORS. Default is None.
 
     Returns:
-        x_i_new (List): Update variables of the i agent.
-        of_i_new (Float): Update objective function value of the i agent.
-        fit_i_new (Float): Update fitness value of the i agent.
-        neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        offspring (List): Offspring design variables (three lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
     report_move = "    Crossover operator - Linear crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
     offspring_c = []
@@ -107,15 +140,18 @@ def linear_crossover(of_function, parent_0, parent_1,\
     for i in range(n_dimensions):
         alpha_a = 0.5*parent_0[i]
         beta_a = 0.5*parent_1[i]
-        report_move += f"    Dimension {i}: alpha_a = {alpha_a}, beta_a = {beta_a}, neighbor_a = {alpha_a + beta_a}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: alpha_a = {alpha_a}, beta_a = {beta_a}, neighbor_a = {alpha_a + beta_a}\n"
         offspring_a.append(alpha_a + beta_a)
         alpha_b = 1.5*parent_0[i]
         beta_b = 0.5*parent_1[i]
-        report_move += f"    Dimension {i}: alpha_b = {alpha_b}, beta_b = {beta_b}, neighbor_b = {alpha_b - beta_b}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: alpha_b = {alpha_b}, beta_b = {beta_b}, neighbor_b = {alpha_b - beta_b}\n"
         offspring_b.append(alpha_b - beta_b)
         alpha_c = 0.5*parent_0[i]
         beta_c = 1.5*parent_1[i]
-        report_move += f"    Dimension {i}: alpha_c = {alpha_c}, beta_c = {beta_c}, neighbor_c = {-alpha_c + beta_c}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: alpha_c = {alpha_c}, beta_c = {beta_c}, neighbor_c = {-alpha_c + beta_c}\n"
         offspring_c.append(-alpha_c + beta_c)
 
     # Check bounds
@@ -123,73 +159,78 @@ def linear_crossover(of_function, parent_0, parent_1,\
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
     offspring_c = metapyco.check_interval_01(offspring_c, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    of_offspring_c = of_function(offspring_c, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b {of_offspring_b}\n"
-    report_move += f"    offspring c = {offspring_c}, of_c {of_offspring_c}\n"
-    neof = 3
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b, of_offspring_c]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    elif pos_min == 1:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    else:
-        x_i_new = offspring_c.copy()
-        of_i_new = of_offspring_c
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b, offspring_c], report_move
 
 
-def blxalpha_crossover(of_function, parent_0, parent_1,\
-                       n_dimensions, x_lower, x_upper, none_variable=None):
+def linear_crossover(of_function, parent_0, parent_1,\
+                     n_dimensions, x_lower, x_upper, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the blx-alpha crossover operator. 
-    Two new points are generated from the two parent points (offspring).
+    This function performs the linear crossover operator.
+    Three new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
-        parent_0 (List): Current design variables of the first parent.
-        parent_1 (List): Current design variables of the second parent.
+        parent_0 (List): First parent (Current design variables).
+        parent_1 (List): Second parent (Current design variables).
         n_dimensions (Integer): Problem dimension.
         x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = linear_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def blxalpha_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of blxalpha_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - BLX-alpha\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        alpha = np.random.uniform(low=0, high=1)
+        alpha = random_values[i]
         max_val = max(parent_0[i], parent_1[i])
         min_val = min(parent_0[i], parent_1[i])
         r_ij = np.abs(parent_0[i] - parent_1[i])
-        report_move += f"    Dimension {i}: min_val = {min_val}, max_val = {max_val}, r_ij = {r_ij}\n"
-        report_move += f"    neighbor_a = {min_val - alpha*r_ij}, neighbor_b = {max_val + alpha*r_ij}\n"
+        if verbose:
+            report_move += f"    Dimension {i}: min_val = {min_val}, max_val = {max_val}, r_ij = {r_ij}\n"
+            report_move += f"    neighbor_a = {min_val - alpha*r_ij}, neighbor_b = {max_val + alpha*r_ij}\n"
         offspring_a.append(min_val - alpha*r_ij)
         offspring_b.append(max_val + alpha*r_ij)
 
@@ -197,44 +238,26 @@ def blxalpha_crossover(of_function, parent_0, parent_1,\
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b {of_offspring_b}\n"
-    neof = 2
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    elif pos_min == 1:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update x = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def heuristic_crossover(of_function, parent_0, parent_1,\
-                        n_dimensions, x_upper, x_lower, none_variable=None):
+def blxalpha_crossover(of_function, parent_0, parent_1,\
+                       n_dimensions, x_lower, x_upper, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the heuristic crossover operator. 
+    This function performs the blx-alpha crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
         n_dimensions (Integer): Problem dimension.
         x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
@@ -244,555 +267,1131 @@ def heuristic_crossover(of_function, parent_0, parent_1,\
         report (String): Report about the male movement process.
     """
 
+    offspring, report_move = blxalpha_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def heuristic_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of heuristic_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
+    """
+
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - Heuristic crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"    
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        r = np.random.uniform(low=0, high=1)
+        r = random_values[i]
         offspring_a.append(parent_0[i] + r*(parent_0[i] - parent_1[i]))
         offspring_b.append(parent_1[i] + r*(parent_1[i] - parent_0[i]))
-        report_move += f"    random number = {r}\n"
-        report_move += f"    neighbor_a = {parent_0[i] + r*(parent_0[i] - parent_1[i])}, neighbor_b = {parent_1[i] + r*(parent_1[i] - parent_0[i])}\n"
+        if verbose:
+            report_move += f"    random number = {r}\n"
+            report_move += f"    neighbor_a = {parent_0[i] + r*(parent_0[i] - parent_1[i])}, neighbor_b = {parent_1[i] + r*(parent_1[i] - parent_0[i])}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def simulated_binary_crossover(of_function, parent_0, parent_1,\
-                                eta_c, n_dimensions, x_upper, x_lower, none_variable=None):
+def heuristic_crossover(of_function, parent_0, parent_1,\
+                        n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the simulated binary crossover operator. 
+    This function performs the heuristic crossover operator.
     Two new points are generated from the two parent points (offspring).
-        
-    Args: 
+
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
-        eta_c (Float): Distribution index.
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = heuristic_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def simulated_binary_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, eta_c, verbose=True, rng=None):
+    """
+    This function generates the offspring of simulated_binary_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        eta_c (Float): Distribution index.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - simulated binary crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"    
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        r = np.random.uniform(low=0, high=1)
+        r = random_values[i]
         if r <= 0.5:
-            beta = (2*r)**(1/(eta_c+1))
-            report_move += f"    random number = {r} <= 0.50, beta = {beta}\n"
+            beta = np.power(2*r, 1/(eta_c+1))
+            if verbose:
+                report_move += f"    random number = {r} <= 0.50, beta = {beta}\n"
         else:
-            beta = (1/(2*(1-r)))**(1/(eta_c+1))
-            report_move += f"    random number = {r} > 0.50, beta = {beta}\n"
+            beta = np.power(1/(2*(1-r)), 1/(eta_c+1))
+            if verbose:
+                report_move += f"    random number = {r} > 0.50, beta = {beta}\n"
         neighbor_a = 0.5*((1+beta)*parent_0[i] + (1-beta)*parent_1[i])
         neighbor_b = 0.5*((1-beta)*parent_1[i] + (1+beta)*parent_0[i])
         offspring_a.append(neighbor_a)
         offspring_b.append(neighbor_b)
-        report_move += f"    neighbor_a {neighbor_a}\n"
-        report_move += f"    neighbor_b {neighbor_b}\n"
+        if verbose:
+            report_move += f"    neighbor_a {neighbor_a}\n"
+            report_move += f"    neighbor_b {neighbor_b}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def arithmetic_crossover(of_function, parent_0, parent_1,\
-                          n_dimensions, x_upper, x_lower, none_variable=None):
+def simulated_binary_crossover(of_function, parent_0, parent_1,\
+                                eta_c, n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the arithmetic crossover operator. 
+    This function performs the simulated binary crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
+        eta_c (Float): Distribution index.
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = simulated_binary_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, eta_c, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def arithmetic_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of arithmetic_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - Arithmetic crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"    
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        alpha = np.random.uniform(low=0, high=1)
+        alpha = random_values[i]
         offspring_a.append(parent_0[i]*alpha + parent_1[i]*(1-alpha))
         offspring_b.append(parent_1[i]*alpha + parent_0[i]*(1-alpha))
-        report_move += f"    neighbor_a = {parent_0[i]*alpha + parent_1[i]*(1-alpha)}, neighbor_b = {parent_1[i]*alpha + parent_0[i]*(1-alpha)}\n"
+        if verbose:
+            report_move += f"    neighbor_a = {parent_0[i]*alpha + parent_1[i]*(1-alpha)}, neighbor_b = {parent_1[i]*alpha + parent_0[i]*(1-alpha)}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def laplace_crossover(of_function, parent_0, parent_1,\
-                      mu, sigma, n_dimensions, x_upper,\
-                      x_lower, none_variable=None):
+def arithmetic_crossover(of_function, parent_0, parent_1,\
+                          n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the laplace crossover operator. 
+    This function performs the arithmetic crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
-        mu (Float): location parameter.
-        sigma (Float): scale parameter.
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = arithmetic_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def laplace_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, mu, sigma, verbose=True, rng=None):
+    """
+    This function generates the offspring of laplace_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        mu (Float): location parameter.
+        sigma (Float): scale parameter.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - laplace crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"    
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        r = np.random.uniform(low=0, high=1)
+        r = random_values[i]
         if r <= 0.5:
             beta = mu - sigma*np.log(r)
-            report_move += f"    random number = {r} <= 0.50, beta = {beta}\n"
+            if verbose:
+                report_move += f"    random number = {r} <= 0.50, beta = {beta}\n"
         else:
             beta = mu + sigma*np.log(r)
-            report_move += f"    random number = {r} > 0.50, beta = {beta}\n"
+            if verbose:
+                report_move += f"    random number = {r} > 0.50, beta = {beta}\n"
         rij = np.abs(parent_0[i] - parent_1[i])
         neighbor_a = parent_0[i] + beta*rij
         neighbor_b = parent_1[i] + beta*rij
         offspring_a.append(neighbor_a)
         offspring_b.append(neighbor_b)
-        report_move += f"    rij = {rij}, neighbor_a {neighbor_a}\n"
-        report_move += f"    rij = {rij}, neighbor_b {neighbor_b}\n"
+        if verbose:
+            report_move += f"    rij = {rij}, neighbor_a {neighbor_a}\n"
+            report_move += f"    rij = {rij}, neighbor_b {neighbor_b}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def uniform_crossover(of_function, parent_0, parent_1,\
-                       n_dimensions, x_upper, x_lower, none_variable=None):
+def laplace_crossover(of_function, parent_0, parent_1,\
+                      mu, sigma, n_dimensions, x_upper,\
+                      x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the uniform crossover operator. 
+    This function performs the laplace crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
+        mu (Float): location parameter.
+        sigma (Float): scale parameter.
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = laplace_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, mu, sigma, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def uniform_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of uniform_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - uniform crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"    
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        r = np.random.uniform(low=0, high=1)
+        r = random_values[i]
         if r < 0.5:
             offspring_a.append(parent_0[i])
             offspring_b.append(parent_1[i])
-            report_move += f"    random number = {r} < 0.50\n"
-            report_move += f"    cut parent_0 -> of_a {parent_0[i]}\n"
-            report_move += f"    cut parent_1 -> of_b {parent_1[i]}\n"
+            if verbose:
+                report_move += f"    random number = {r} < 0.50\n"
+                report_move += f"    cut parent_0 -> of_a {parent_0[i]}\n"
+                report_move += f"    cut parent_1 -> of_b {parent_1[i]}\n"
         else:
             offspring_a.append(parent_1[i])
             offspring_b.append(parent_0[i])
-            report_move += f"    random number = {r} >= 0.50\n"
-            report_move += f"    cut parent_1 -> of_a {parent_1[i]}\n"
-            report_move += f"    cut parent_0 -> of_b {parent_0[i]}\n"
+            if verbose:
+                report_move += f"    random number = {r} >= 0.50\n"
+                report_move += f"    cut parent_1 -> of_a {parent_1[i]}\n"
+                report_move += f"    cut parent_0 -> of_b {parent_0[i]}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
+    return [offspring_a, offspring_b], report_move
 
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
 
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
-
-
-def binomial_crossover(of_function, parent_0, parent_1,\
-                       p_c, n_dimensions, x_upper, x_lower, none_variable=None):
+def uniform_crossover(of_function, parent_0, parent_1,\
+                       n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the uniform crossover operator. 
+    This function performs the uniform crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
-        p_c (Float): Crossover probability rate (% * 0.01).
         n_dimensions (Integer): Problem dimension.
         x_upper (List): Upper limit of the design variables.
         x_lower (List): Lower limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = uniform_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def binomial_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, p_c, verbose=True, rng=None):
+    """
+    This function generates the offspring of binomial_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        p_c (Float): Crossover probability rate (% * 0.01).
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
-    report_move = "    Crossover operator - uniform crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"
+    rng = metapyco.random_generator(rng)
+    report_move = "    Crossover operator - binomial crossover\n"
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
-    # Movement
+    # Movement (one random number per dimension drawn at once)
+    random_values = rng.random(n_dimensions)
     for i in range(n_dimensions):
-        r = np.random.uniform(low=0, high=1)
+        r = random_values[i]
         if r <= p_c:
             offspring_a.append(parent_0[i])
             offspring_b.append(parent_1[i])
-            report_move += f"    random number = {r} < p_c = {p_c}\n"
-            report_move += f"    cut parent_0 -> of_a {parent_0[i]}\n"
-            report_move += f"    cut parent_1 -> of_b {parent_1[i]}\n"
+            if verbose:
+                report_move += f"    random number = {r} <= p_c = {p_c}\n"
+                report_move += f"    cut parent_0 -> of_a {parent_0[i]}\n"
+                report_move += f"    cut parent_1 -> of_b {parent_1[i]}\n"
         else:
             offspring_a.append(parent_1[i])
             offspring_b.append(parent_0[i])
-            report_move += f"    random number = {r} >= 0.50\n"
-            report_move += f"    cut parent_1 -> of_a {parent_1[i]}\n"
-            report_move += f"    cut parent_0 -> of_b {parent_0[i]}\n"
+            if verbose:
+                report_move += f"    random number = {r} > p_c = {p_c}\n"
+                report_move += f"    cut parent_1 -> of_a {parent_1[i]}\n"
+                report_move += f"    cut parent_0 -> of_b {parent_0[i]}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
+    return [offspring_a, offspring_b], report_move
 
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
 
-
-def single_point_crossover(of_function, parent_0, parent_1, \
-                            n_dimensions, x_upper, x_lower, none_variable=None):
+def binomial_crossover(of_function, parent_0, parent_1,\
+                       p_c, n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the single point crossover operator. 
+    This function performs the binomial crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
+        p_c (Float): Crossover probability rate (% * 0.01).
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about movement process.
+    """
+
+    offspring, report_move = binomial_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, p_c, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def single_point_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of single_point_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - Single point\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
 
     # Movement
-    pos = np.random.randint(1, n_dimensions)
-    report_move += f"    cut position {pos}\n"
-    offspring_a = np.append(parent_0[:pos], parent_1[pos:])
-    report_move += f"    cut parent_0 -> of_a {parent_0[:pos]}\n"
-    report_move += f"    cut parent_1 -> of_a {parent_1[pos:]}\n"
-    offspring_b = np.append(parent_1[:pos], parent_0[pos:])
-    report_move += f"    cut parent_1 -> of_b {parent_1[:pos]}\n"
-    report_move += f"    cut parent_0 -> of_b {parent_0[pos:]}\n" 
-    offspring_a = offspring_a.tolist()
-    offspring_b = offspring_b.tolist()
+    pos = rng.integers(1, n_dimensions)
+    offspring_a = list(parent_0[:pos]) + list(parent_1[pos:])
+    offspring_b = list(parent_1[:pos]) + list(parent_0[pos:])
+    if verbose:
+        report_move += f"    cut position {pos}\n"
+        report_move += f"    cut parent_0 -> of_a {parent_0[:pos]}\n"
+        report_move += f"    cut parent_1 -> of_a {parent_1[pos:]}\n"
+        report_move += f"    cut parent_1 -> of_b {parent_1[:pos]}\n"
+        report_move += f"    cut parent_0 -> of_b {parent_0[pos:]}\n"
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
-
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update n_dimensions = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
-
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+    return [offspring_a, offspring_b], report_move
 
 
-def multi_point_crossover(of_function, parent_0, parent_1,\
-                           n_dimensions, x_upper, x_lower, none_variable=None):
+def single_point_crossover(of_function, parent_0, parent_1, \
+                            n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
     """
-    This function performs the multi point crossover operator. 
+    This function performs the single point crossover operator.
     Two new points are generated from the two parent points (offspring).
 
-    Args: 
+    Args:
         of_function (Py function (def)): Objective function. The Metapy user defined this function.
         parent_0 (List): Current design variables of the first parent.
         parent_1 (List): Current design variables of the second parent.
         n_dimensions (Integer): Problem dimension.
-        x_lower (List): Lower limit of the design variables.
         x_upper (List): Upper limit of the design variables.
-        none_variable (None, list, float, dictionary, str or any): None variable. Default is None. 
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
                                         User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
 
     Returns:
         x_i_new (List): Update variables of the i agent.
         of_i_new (Float): Update objective function value of the i agent.
         fit_i_new (Float): Update fitness value of the i agent.
         neof (Integer): Number of evaluations of the objective function.
-        report (String): Report about the male movement process.    
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = single_point_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def multi_point_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of multi_point_crossover without evaluating them.
+
+    Args:
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (List): Offspring design variables (two lists).
+        report (String): Report about the crossover process.
     """
 
     # Start internal variables
+    rng = metapyco.random_generator(rng)
     report_move = "    Crossover operator - multi point crossover\n"
-    report_move += f"    current p0 = {parent_0}\n"
-    report_move += f"    current p1 = {parent_1}\n"
+    if verbose:
+        report_move += f"    current p0 = {parent_0}\n"
+        report_move += f"    current p1 = {parent_1}\n"
     offspring_a = []
     offspring_b = []
 
     # Movement
-    pos = [int(c+1) for c in range(n_dimensions)]
-    probs = [100/n_dimensions/100 for c in range(n_dimensions)]
-    number_cuts = np.random.choice(pos, 1, replace=False, p=probs)[0]
-    point_cuts = np.random.choice(n_dimensions, size=number_cuts, replace=False)
+    number_cuts = rng.integers(1, n_dimensions, endpoint=True)
+    point_cuts = rng.choice(n_dimensions, size=number_cuts, replace=False)
     mask = [0 for _ in range(n_dimensions)]
     for p in point_cuts:
         mask[p] = 1
-    report_move += f"    cut mask = {mask}\n"
-    for j in mask:
+    if verbose:
+        report_move += f"    cut mask = {mask}\n"
+    for i, j in enumerate(mask):
         if j == 0:
-            offspring_a.append(parent_0[j])
-            offspring_b.append(parent_1[j])
+            offspring_a.append(parent_0[i])
+            offspring_b.append(parent_1[i])
         else:
-            offspring_a.append(parent_1[j])
-            offspring_b.append(parent_0[j])
+            offspring_a.append(parent_1[i])
+            offspring_b.append(parent_0[i])
 
     # Check bounds
     offspring_a = metapyco.check_interval_01(offspring_a, x_lower, x_upper)
     offspring_b = metapyco.check_interval_01(offspring_b, x_lower, x_upper)
 
-    # Evaluation of the objective function and fitness
-    of_offspring_a = of_function(offspring_a, none_variable)
-    of_offspring_b = of_function(offspring_b, none_variable)
-    report_move += f"    offspring a = {offspring_a}, of_a = {of_offspring_a}\n"
-    report_move += f"    offspring b = {offspring_b}, of_b = {of_offspring_b}\n"
-    neof = 2
+    return [offspring_a, offspring_b], report_move
 
-    # min of the offspring
-    list_of = [of_offspring_a, of_offspring_b]
-    min_value = min(list_of)
-    pos_min = list_of.index(min_value)
-    if pos_min == 0:
-        x_i_new = offspring_a.copy()
-        of_i_new = of_offspring_a
-    else:
-        x_i_new = offspring_b.copy()
-        of_i_new = of_offspring_b
-    fit_i_new = metapyco.fit_value(of_i_new)
-    report_move += f"    update pos = {x_i_new}, of = {of_i_new}, fit = {fit_i_new}\n"
 
-    return x_i_new, of_i_new, fit_i_new, neof, report_move
+def multi_point_crossover(of_function, parent_0, parent_1,\
+                           n_dimensions, x_upper, x_lower, none_variable=None, verbose=True, rng=None):
+    """
+    This function performs the multi point crossover operator.
+    Two new points are generated from the two parent points (offspring).
+
+    Args:
+        of_function (Py function (def)): Objective function. The Metapy user defined this function.
+        parent_0 (List): Current design variables of the first parent.
+        parent_1 (List): Current design variables of the second parent.
+        n_dimensions (Integer): Problem dimension.
+        x_upper (List): Upper limit of the design variables.
+        x_lower (List): Lower limit of the design variables.
+        none_variable (None, list, float, dictionary, str or any): None variable. Default is None.
+                                        User can use this variable in objective function.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        x_i_new (List): Update variables of the i agent.
+        of_i_new (Float): Update objective function value of the i agent.
+        fit_i_new (Float): Update fitness value of the i agent.
+        neof (Integer): Number of evaluations of the objective function.
+        report (String): Report about the male movement process.
+    """
+
+    offspring, report_move = multi_point_crossover_candidate(parent_0, parent_1, n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+    x_i_new, of_i_new, fit_i_new, neof, report_eval = _best_offspring(of_function, offspring, none_variable, verbose=verbose)
+
+    return x_i_new, of_i_new, fit_i_new, neof, report_move + report_eval
+
+
+def _parents(x_pop, id_0, id_1):
+    """
+    This function gathers the parents of several pairs from the population matrix.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+
+    Returns:
+        parent_0 (Array): First parents (n_pairs x n_dimensions).
+        parent_1 (Array): Second parents (n_pairs x n_dimensions).
+    """
+
+    x_pop = np.asarray(x_pop, dtype=float)
+
+    return x_pop[np.asarray(id_0, dtype=int)], x_pop[np.asarray(id_1, dtype=int)]
+
+
+def linear_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of linear_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Not used (deterministic operator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 3 x n_dimensions).
+    """
+
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    offspring = np.stack((0.5*parent_0 + 0.5*parent_1,
+                          1.5*parent_0 - 0.5*parent_1,
+                          -(0.5*parent_0) + 1.5*parent_1), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def blxalpha_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of blxalpha_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    alpha = rng.random(parent_0.shape)
+    r_ij = np.abs(parent_0 - parent_1)
+    offspring = np.stack((np.minimum(parent_0, parent_1) - alpha*r_ij,
+                          np.maximum(parent_0, parent_1) + alpha*r_ij), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def heuristic_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of heuristic_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    r = rng.random(parent_0.shape)
+    offspring = np.stack((parent_0 + r*(parent_0 - parent_1),
+                          parent_1 + r*(parent_1 - parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def simulated_binary_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, eta_c, rng=None):
+    """
+    Batched form of simulated_binary_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        eta_c (Float): Distribution index.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    r = rng.random(parent_0.shape)
+    beta = np.where(r <= 0.5, np.power(2*r, 1/(eta_c+1)), np.power(1/(2*(1-r)), 1/(eta_c+1)))
+    offspring = np.stack((0.5*((1+beta)*parent_0 + (1-beta)*parent_1),
+                          0.5*((1-beta)*parent_1 + (1+beta)*parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def arithmetic_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of arithmetic_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    alpha = rng.random(parent_0.shape)
+    offspring = np.stack((parent_0*alpha + parent_1*(1-alpha),
+                          parent_1*alpha + parent_0*(1-alpha)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def laplace_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, mu, sigma, rng=None):
+    """
+    Batched form of laplace_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        mu (Float): location parameter.
+        sigma (Float): scale parameter.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    r = rng.random(parent_0.shape)
+    log_r = np.log(r)
+    beta = np.where(r <= 0.5, mu - sigma*log_r, mu + sigma*log_r)
+    rij = np.abs(parent_0 - parent_1)
+    offspring = np.stack((parent_0 + beta*rij,
+                          parent_1 + beta*rij), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def uniform_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of uniform_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    keep = rng.random(parent_0.shape) < 0.5
+    offspring = np.stack((np.where(keep, parent_0, parent_1),
+                          np.where(keep, parent_1, parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def binomial_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, p_c, rng=None):
+    """
+    Batched form of binomial_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        p_c (Float): Crossover probability rate (% * 0.01).
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    keep = rng.random(parent_0.shape) <= p_c
+    offspring = np.stack((np.where(keep, parent_0, parent_1),
+                          np.where(keep, parent_1, parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def single_point_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of single_point_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    n_pairs, n_dimensions = parent_0.shape
+    pos = rng.integers(1, n_dimensions, size=n_pairs)
+    keep = np.arange(n_dimensions) < pos[:, None]
+    offspring = np.stack((np.where(keep, parent_0, parent_1),
+                          np.where(keep, parent_1, parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+def multi_point_crossover_batch(x_pop, id_0, id_1, x_lower, x_upper, rng=None):
+    """
+    Batched form of multi_point_crossover_candidate. Generates the offspring of several pairs of parents with array operations.
+    The cut points are drawn pair by pair (Generator.choice without replacement has no batched form with the same random numbers).
+
+    Args:
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x 2 x n_dimensions).
+    """
+
+    rng = metapyco.random_generator(rng)
+    parent_0, parent_1 = _parents(x_pop, id_0, id_1)
+    n_pairs, n_dimensions = parent_0.shape
+    keep = np.ones((n_pairs, n_dimensions), dtype=bool)
+    for k in range(n_pairs):
+        number_cuts = rng.integers(1, n_dimensions, endpoint=True)
+        keep[k, rng.choice(n_dimensions, size=number_cuts, replace=False)] = False
+    offspring = np.stack((np.where(keep, parent_0, parent_1),
+                          np.where(keep, parent_1, parent_0)), axis=1)
+
+    return metapyco.check_interval_02(offspring, x_lower, x_upper)
+
+
+CROSSOVER_OPERATORS = {'linear': linear_crossover_candidate,
+                       'blx-alpha': blxalpha_crossover_candidate,
+                       'single point': single_point_crossover_candidate,
+                       'multi point': multi_point_crossover_candidate,
+                       'uniform': uniform_crossover_candidate,
+                       'heuristic': heuristic_crossover_candidate,
+                       'arithmetic': arithmetic_crossover_candidate,
+                       'binomial': binomial_crossover_candidate,
+                       'sbc': simulated_binary_crossover_candidate,
+                       'laplace': laplace_crossover_candidate}
+
+CROSSOVER_BATCH_OPERATORS = {'linear': linear_crossover_batch,
+                             'blx-alpha': blxalpha_crossover_batch,
+                             'single point': single_point_crossover_batch,
+                             'multi point': multi_point_crossover_batch,
+                             'uniform': uniform_crossover_batch,
+                             'heuristic': heuristic_crossover_batch,
+                             'arithmetic': arithmetic_crossover_batch,
+                             'binomial': binomial_crossover_batch,
+                             'sbc': simulated_binary_crossover_batch,
+                             'laplace': laplace_crossover_batch}
+
+
+def crossover_offspring(candidate, x_pop, id_0, id_1, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring of several pairs of parents calling a crossover candidate function pair by pair. Same result of the batched forms (CROSSOVER_BATCH_OPERATORS) with the same random generator state, plus the report text of each pair.
+
+    Args:
+        candidate (Py function (def)): Crossover candidate function (see CROSSOVER_OPERATORS) with the operator parameters already set.
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x n_offspring x n_dimensions).
+        reports (List): Report about the crossover process of each pair.
+    """
+
+    rng = metapyco.random_generator(rng)
+    n_dimensions = x_pop.shape[1]
+    offspring = []
+    reports = []
+    for i, j in zip(id_0, id_1):
+        children, report_move = candidate(x_pop[i].tolist(), x_pop[j].tolist(), n_dimensions, x_lower, x_upper, verbose=verbose, rng=rng)
+        offspring.append(children)
+        reports.append(report_move)
+    if not offspring:
+        return np.empty((0, 0, n_dimensions)), reports
+
+    return np.array(offspring, dtype=float), reports
+
+
+def _crossover_dispatch(candidate, batch, x_pop, id_0, id_1, x_lower, x_upper, verbose=True, rng=None):
+    """
+    This function generates the offspring with the batched form of the operator, or pair by pair with the candidate function when the report text is needed.
+
+    Args:
+        candidate (Py function (def)): Crossover candidate function with the operator parameters already set.
+        batch (Py function (def)): Batched form of the same operator with the operator parameters already set.
+        x_pop (Array): Population design variables (n_population x n_dimensions).
+        id_0 (List or Array): First parent id of each pair.
+        id_1 (List or Array): Second parent id of each pair.
+        x_lower (List): Lower limit of the design variables.
+        x_upper (List): Upper limit of the design variables.
+        verbose (Boolean): Builds the report text. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        offspring (Array): Offspring design variables (n_pairs x n_offspring x n_dimensions).
+        reports (List): Report about the crossover process of each pair (empty when verbose is False).
+    """
+
+    if verbose:
+        return crossover_offspring(candidate, x_pop, id_0, id_1, x_lower, x_upper, verbose=True, rng=rng)
+
+    return batch(x_pop, id_0, id_1, x_lower, x_upper, rng=rng), []
+
+
+def _crossover_functions(crossover_parameters):
+    """
+    This function resolves the crossover type to the candidate function and the batched form, both with the operator parameters already set.
+
+    Args:
+        crossover_parameters (Dictionary): Crossover parameters (setup['algorithm parameters']['crossover']).
+
+    Returns:
+        candidate (Py function (def)): Crossover candidate function (see CROSSOVER_OPERATORS).
+        batch (Py function (def)): Batched form of the operator (see CROSSOVER_BATCH_OPERATORS).
+        gated (Boolean): True when the crossover rate decides if each agent is crossed. False for 'binomial', which uses the rate in each dimension.
+    """
+
+    crosso_type = crossover_parameters['type']
+    if crosso_type not in CROSSOVER_OPERATORS:
+        raise ValueError(f"The crossover type {crosso_type} is not available. Options: {', '.join(CROSSOVER_OPERATORS)}")
+    parameters = {}
+    gated = True
+    if crosso_type == 'sbc':
+        parameters = {'eta_c': crossover_parameters['eta_c']}
+    elif crosso_type == 'laplace':
+        parameters = {'mu': crossover_parameters['loc'], 'sigma': crossover_parameters['scale']}
+    elif crosso_type == 'binomial':
+        parameters = {'p_c': crossover_parameters['crossover rate (%)']/100}
+        gated = False
+
+    return partial(CROSSOVER_OPERATORS[crosso_type], **parameters), partial(CROSSOVER_BATCH_OPERATORS[crosso_type], **parameters), gated
+
+
+def crossover_operator(crossover_parameters):
+    """
+    This function resolves the crossover type of the algorithm parameters to an operator with a uniform signature. Call it once before the iterations.
+
+    Args:
+        crossover_parameters (Dictionary): Crossover parameters (setup['algorithm parameters']['crossover']).
+
+    Returns:
+        operator (Py function (def)): operator(x_pop, id_0, id_1, x_lower, x_upper, verbose, rng) -> offspring, reports. The batched form is used when verbose is False.
+        gated (Boolean): True when the crossover rate decides if each agent is crossed. False for 'binomial', which uses the rate in each dimension.
+    """
+
+    candidate, batch, gated = _crossover_functions(crossover_parameters)
+
+    return partial(_crossover_dispatch, candidate, batch), gated
+
+
+def crossover_benchmark(crossover_parameters=None, n_pairs=100, n_dimensions=30, n_repetitions=20, seed=0):
+    """
+    This function compares the batched crossover operators with the candidate functions called pair by pair (scalar versions).
+    Both versions run from a random generator with the same seed, so the offspring must be identical.
+
+    Args:
+        crossover_parameters (Dictionary or None): Parameters of the 'sbc', 'laplace' and 'binomial' types. Default is None ({'eta_c': 2, 'loc': 0, 'scale': 0.5, 'crossover rate (%)': 90})
+        n_pairs (Integer): Number of pairs of parents. Default is 100
+        n_dimensions (Integer): Problem dimension. Default is 30
+        n_repetitions (Integer): Number of timed calls of each version. Default is 20
+        seed (Integer): Random seed. Default is 0
+
+    Returns:
+        df_benchmark (Dataframe): Best time of each version (s), speedup and equality of the offspring by crossover type.
+    """
+
+    if crossover_parameters is None:
+        crossover_parameters = {'eta_c': 2, 'loc': 0, 'scale': 0.5, 'crossover rate (%)': 90}
+    rng = np.random.default_rng(seed)
+    x_lower = [-5.0] * n_dimensions
+    x_upper = [5.0] * n_dimensions
+    x_pop = rng.uniform(-5.0, 5.0, size=(n_pairs, n_dimensions))
+    id_0 = np.arange(n_pairs)
+    id_1 = rng.permutation(n_pairs)
+    rows = []
+    for crosso_type in CROSSOVER_OPERATORS:
+        candidate, batch, _ = _crossover_functions(dict(crossover_parameters, type=crosso_type))
+        versions = [lambda rng: crossover_offspring(candidate, x_pop, id_0, id_1, x_lower, x_upper, verbose=False, rng=rng)[0],
+                    lambda rng: batch(x_pop, id_0, id_1, x_lower, x_upper, rng=rng)]
+        times = []
+        results = []
+        for version in versions:
+            best_time = np.inf
+            for _ in range(n_repetitions):
+                version_rng = np.random.default_rng(seed)
+                initial_time = time.perf_counter()
+                offspring = version(version_rng)
+                best_time = min(best_time, time.perf_counter() - initial_time)
+            times.append(best_time)
+            results.append(offspring)
+        rows.append({'crossover': crosso_type,
+                     'scalar time (s)': times[0],
+                     'batch time (s)': times[1],
+                     'speedup': times[0]/times[1],
+                     'identical': bool(np.array_equal(results[0], results[1]))})
+
+    return pd.DataFrame(rows)
 
 
 def mp_crossover(chromosome_a, chromosome_b, seed, of_function, none_variable):
@@ -897,18 +1496,22 @@ def genetic_algorithm_01(settings):
                                         User can use this variable in objective function.
             'objective function' (Py function (def)): Objective function. 
                                                 The Metapy user defined this function.                                                
+            'vectorized objective' (Boolean): Optional. True when the objective function receives the (n x n_dimensions) array 
+                                        and returns the n values. Default is False.
+            'history' (String): Optional. 'full', 'best' or 'none'. Controls how much iteration data is stored in df_all and df_best. Default is 'full'.
+            'report' (String): Optional. 'off', 'summary' or 'full'. Controls how much of the execution is recorded in the report. Default is 'full'.
             'algorithm parameters' (Dictionary): Algorithm parameters. See documentation.
-                'selection' (Dictionary): Selection parameters.
+                'selection' (Dictionary): Selection parameters ('type': 'roulette', 'tournament' or 'rank').
                 'crossover' (Dictionary): Crossover parameters.
                 'mutation'  (Dictionary): Mutation parameters.
         initial population (List or METApy function): Initial population.
-        seed (None or integer): Random seed. Use None for random seed.
+        seed (None, Integer, SeedSequence or Generator): Random seed (see metapyco.random_generator). Use None for random seed.
     
     Returns:
         df_all (Dataframe): All data of the population.
         df_best (Dataframe): Best data of the population.
         delta_time (Float): Time of the algorithm execution in seconds.
-        report (String): Report of the algorithm execution.
+        report (Report): Report of the algorithm execution (metapyco.Report). Use str(report) to get the text.
     """
 
     # Setup config
@@ -920,16 +1523,12 @@ def genetic_algorithm_01(settings):
     x_upper = setup['x pop upper limit']
     none_variable = setup['none variable']
     obj_function = setup['objective function']
-    seeds = settings[2]
-    if seeds is None:
-        pass
-    else:
-        np.random.seed(seeds)
+    vectorized = setup.get('vectorized objective', False)
+    rng = metapyco.random_generator(settings[2])
 
     # Algorithm_parameters
     algorithm_parameters = setup['algorithm parameters']
-    select_type = algorithm_parameters['selection']['type']
-    crosso_type = algorithm_parameters['crossover']['type']
+    metapyco.get_algorithm('genetic_algorithm_01').check_parameters(algorithm_parameters)
     mutati_type = algorithm_parameters['mutation']['type']
     p_c = algorithm_parameters['crossover']['crossover rate (%)']/100
     p_m = algorithm_parameters['mutation']['mutation rate (%)']/100
@@ -940,345 +1539,134 @@ def genetic_algorithm_01(settings):
         pdf = algorithm_parameters['mutation']['pdf']
 
     # Crossover control
-    if crosso_type == 'linear':
-        pass
-    elif crosso_type == 'blx-alpha':
-        pass
-    elif crosso_type == 'single point':
-        pass
-    elif crosso_type == 'multi point':
-        pass
-    elif crosso_type == 'uniform':
-        pass
-    elif crosso_type == 'heuristic':
-        pass
-    elif crosso_type == 'arithmetic':
-        pass
-    elif crosso_type == 'binomial':
-        pass
-    elif crosso_type == 'sbc':
-        eta_c = algorithm_parameters['crossover']['eta_c']
-    elif crosso_type == 'laplace':
-        mu = algorithm_parameters['crossover']['loc']
-        sigma = algorithm_parameters['crossover']['scale']
+    crossover, crossover_gated = crossover_operator(algorithm_parameters['crossover'])
 
     # Selection control
-    if select_type == 'roulette':
-        pass
+    selection = metapysel.selection_operator(algorithm_parameters['selection'])
 
 
     # Creating variables in the iteration procedure
-    of_pop = []
-    fit_pop = []
     neof_count = 0
 
-    # Storage values: columns names about dataset results
-    columns_all_data = ['X_' + str(i) for i in range(n_dimensions)]
-    columns_all_data.append('OF')
-    columns_all_data.append('FIT')
-    columns_all_data.append('ITERATION')
-    columns_repetition_data = ['X_' + str(i) + '_BEST' for i in range(n_dimensions)]
-    columns_repetition_data.append('OF BEST')
-    columns_repetition_data.append('FIT BET')
-    columns_repetition_data.append('ID BEST')
-    columns_worst_data  = ['X_' + str(i)  + '_WORST' for i in range(n_dimensions)]
-    columns_worst_data.append('OF WORST')
-    columns_worst_data.append('FIT WORST')
-    columns_worst_data.append('ID WORST')
-    columns_other_data = ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
-    report = "Genetic Algorithm 01- report \n\n"
-    all_data_pop = []
-    resume_result = []
+    report = metapyco.Report("Genetic Algorithm 01- report \n\n", setup.get('report', 'full'))
+    history = metapyco.History(n_iterations, n_population, n_dimensions, setup.get('history', 'full'))
 
     # Initial population and evaluation solutions
-    report += "Initial population\n"
-    x_pop = settings[1].copy()
-    for i_pop in range(n_population):
-        of_pop.append(obj_function(x_pop[i_pop], none_variable))
-        fit_pop.append(metapyco.fit_value(of_pop[i_pop]))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(x_pop[i_pop], of_pop[i_pop],
-                                                               fit_pop[i_pop], columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    report.summary("Initial population\n")
+    population = metapyco.Population(settings[1])
+    neof_count += population.evaluate(obj_function, none_variable, vectorized=vectorized)
+    history.record_agents(0, population.x, population.of, population.fit)
 
     # Best, average and worst values and storage
-    repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                             columns_repetition_data,
-                                                             columns_worst_data,
-                                                             columns_other_data,
-                                                             neof_count, iteration=0)
-    resume_result.append(repetition_data)
-    for i_pop in range(n_population):
-        if i_pop == best_id:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]}, fit {fit_pop[i_pop]} - best solution\n'
-        else:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]}, fit {fit_pop[i_pop]} \n'
+    best_id = history.record_best(0, population.x, population.of, population.fit, neof_count)
+    report.population(population.x, population.of, best_id, population.fit)
 
     # Iteration procedure
-    report += "\nIterations\n"
+    parents = population.copy()
+    offspring = population.copy()
+    report.summary("\nIterations\n")
     progress_bar = tqdm(total=n_iterations, desc='Progress')
     for iter in range(n_iterations):
-        report += f"\nIteration: {iter+1}\n"
+        report.summary("\nIteration: {}\n", iter+1)
 
         # Time markup
         initial_time = time.time()
 
         # Copy results
-        x_temp = x_pop.copy()
-        of_temp = of_pop.copy()
-        fit_temp = fit_pop.copy()
-
-        # Population movement
-        for pop in range(n_population):
-            report += f"Pop id: {pop} - particle movement\n"
-            report += f"    current x = {x_temp[pop]}\n"
-
-            # Selection
-            if select_type == 'roulette':
-                id_parent, report_mov = roulette_wheel_selection(fit_temp, pop)
-            report += report_mov
-
-            # Crossover
-            if crosso_type == 'linear':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = linear_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'blx-alpha':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = blxalpha_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'single point':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = single_point_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'multi point':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = multi_point_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'uniform':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = uniform_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'heuristic':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = heuristic_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'binomial':
-                x_i_temp, of_i_temp,\
-                    fit_i_temp, neof,\
-                    report_mov = binomial_crossover(obj_function,
-                                                    x_temp[pop],
-                                                    x_temp[id_parent],
-                                                    p_c,
-                                                    n_dimensions,
-                                                    x_lower,
-                                                    x_upper,
-                                                    none_variable)
-            elif crosso_type == 'arithmetic':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = arithmetic_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'sbc':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = simulated_binary_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        eta_c,
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            elif crosso_type == 'laplace':
-                random_value = np.random.uniform(low=0, high=1)
-                if random_value <= p_c:
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = laplace_crossover(obj_function,
-                                                        x_temp[pop],
-                                                        x_temp[id_parent],
-                                                        mu,
-                                                        sigma,
-                                                        n_dimensions,
-                                                        x_lower,
-                                                        x_upper,
-                                                        none_variable)
-                else:
-                    x_i_temp = x_temp[pop].copy()
-                    of_i_temp = of_temp[pop]
-                    fit_i_temp = fit_temp[pop]
-                    neof = 0
-                    report += f"    No crossover r={random_value} > p_c={p_c} \n"
-            report += report_mov
+        parents.copy_from(population)
+        offspring.copy_from(population)
+        reports_pop = []
+        if report.verbose:
+            reports_pop = [[f"Pop id: {pop} - particle movement\n", f"    current x = {parents.x[pop].tolist()}\n"] for pop in range(n_population)]
+
+        # Selection (the parents of the whole population are drawn at once)
+        id_parents, reports_mov = selection(parents.fit, verbose=report.verbose, rng=rng)
+        for pop, report_mov in enumerate(reports_mov):
+            reports_pop[pop].append(report_mov)
+
+        # Crossover (one random number per agent for the whole population and the offspring evaluated in a single step)
+        if crossover_gated:
+            random_values = rng.random(n_population)
+            crossover_mask = random_values <= p_c
+        else:
+            crossover_mask = np.ones(n_population, dtype=bool)
+        ids = np.flatnonzero(crossover_mask)
+        children, reports_mov = crossover(parents.x, ids, id_parents[ids], x_lower, x_upper, verbose=report.verbose, rng=rng)
+        if ids.size > 0:
+            n_children = children.shape[1]
+            of_children, fit_children, neof = metapyco.evaluate_objective(obj_function, children.reshape(-1, n_dimensions), none_variable, vectorized)
+            of_children = of_children.reshape(-1, n_children)
+            fit_children = fit_children.reshape(-1, n_children)
+            best_children = np.argmin(of_children, axis=1)
+            rows = np.arange(ids.size)
+            offspring.x[ids] = children[rows, best_children]
+            offspring.of[ids] = of_children[rows, best_children]
+            offspring.fit[ids] = fit_children[rows, best_children]
+
             # Update neof (Number of Objective Function Evaluations)
             neof_count += neof
-
-            # Mutation
-            random_value = np.random.uniform(low=0, high=1)
-            if random_value <= p_m:
-                report += "    Mutation operator\n"
-                if mutati_type == 'hill climbing':
-                    x_i_temp, of_i_temp,\
-                        fit_i_temp, neof,\
-                        report_mov = metapyco.mutation_01_hill_movement(obj_function,
-                                                                        x_i_temp,
-                                                                        x_lower, x_upper,
-                                                                        n_dimensions,
-                                                                        pdf, std,
-                                                                        none_variable)
-                report += report_mov
-                
-                # Update neof (Number of Objective Function Evaluations)
-                neof_count += neof
-            else:
-                report += f"    No mutation r={random_value} > p_m={p_m} \n"
-
-            # New design variables
-            if fit_i_temp > fit_pop[pop]:
-                report += f"    fit_i_temp={fit_i_temp} > fit_pop[pop]={fit_pop[pop]} - accept this solution\n"
-                x_pop[pop] = x_i_temp.copy()
-                of_pop[pop] = of_i_temp
-                fit_pop[pop] = fit_i_temp
-            else:
-                report += f"    fit_i_temp={fit_i_temp} < fit_pop[pop]={fit_pop[pop]} - not accept this solution\n"             
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(x_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+        if report.verbose:
+            for k, pop in enumerate(ids):
+                reports_pop[pop].append(reports_mov[k] + _offspring_report(children[k].tolist(), of_children[k].tolist(),
+                                                                           offspring.x[pop].tolist(), offspring.of[pop], offspring.fit[pop]))
+            for pop in np.flatnonzero(~crossover_mask):
+                reports_pop[pop].append(f"    No crossover r={random_values[pop]} > p_c={p_c} \n")
+
+        # Mutation (one random number per agent for the whole population and the mutants evaluated in a single step)
+        random_values = rng.random(n_population)
+        mutation_mask = random_values <= p_m
+        ids = np.flatnonzero(mutation_mask)
+        for pop in ids:
+            if mutati_type == 'hill climbing':
+                offspring.x[pop], report_mov = metapyco.mutation_01_hill_candidate(offspring.x[pop].tolist(),
+                                                                                   x_lower, x_upper,
+                                                                                   n_dimensions,
+                                                                                   pdf, std,
+                                                                                   verbose=report.verbose, rng=rng)
+            if report.verbose:
+                reports_pop[pop].append("    Mutation operator\n" + report_mov)
+        if ids.size > 0:
+            # Update neof (Number of Objective Function Evaluations)
+            neof_count += offspring.evaluate(obj_function, none_variable, ids=ids, vectorized=vectorized)
+        if report.verbose:
+            for pop in ids:
+                reports_pop[pop].append(f"    update x = {offspring.x[pop].tolist()}, of = {offspring.of[pop]}, fit = {offspring.fit[pop]}\n")
+            for pop in np.flatnonzero(~mutation_mask):
+                reports_pop[pop].append(f"    No mutation r={random_values[pop]} > p_m={p_m} \n")
+
+        # New design variables
+        accept = offspring.fit > population.fit
+        if report.verbose:
+            for pop in range(n_population):
+                report.detail(''.join(reports_pop[pop]))
+                if accept[pop]:
+                    report.detail("    fit_i_temp={} > fit_pop[pop]={} - accept this solution\n", offspring.fit[pop], population.fit[pop])
+                else:
+                    report.detail("    fit_i_temp={} < fit_pop[pop]={} - not accept this solution\n", offspring.fit[pop], population.fit[pop])
+        population.update_where(accept, offspring.x, offspring.of, offspring.fit)
+        history.record_agents(iter+1, offspring.x, offspring.of, offspring.fit)
 
         # Best, average and worst values and storage
-        repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                                columns_repetition_data,
-                                                                columns_worst_data,
-                                                                columns_other_data,
-                                                                neof_count,
-                                                                iteration=iter+1)
-        resume_result.append(repetition_data)
-        report += "update solutions\n"
-        for i_pop in range(n_population):
-            if i_pop == best_id:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]}, fit {fit_pop[i_pop]} - best solution\n'
-            else:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]}, fit {fit_pop[i_pop]} \n'
+        best_id = history.record_best(iter+1, population.x, population.of, population.fit, neof_count)
+        report.summary("update solutions\n")
+        report.population(population.x, population.of, best_id, population.fit)
         progress_bar.update()
 
     # Time markup
     end_time = time.time()
     delta_time = end_time - initial_time
 
-    # Storage all values in DataFrame
-    df_all = pd.concat(all_data_pop, ignore_index=True)
-
-    # Storage best values in DataFrame
-    df_best = pd.concat(resume_result, ignore_index=True)
+    # Storage all values and best values in DataFrame
+    df_all, df_best = history.dataframes()
     progress_bar.close()
 
     return df_all, df_best, delta_time, report
+
+
+metapyco.register_algorithm('genetic_algorithm_01', genetic_algorithm_01,
+                            parameters={'selection': ['type'],
+                                        'crossover': ['crossover rate (%)', 'type'],
+                                        'mutation': ['mutation rate (%)', 'type']},
+                            type_parameters={'crossover': {'sbc': ['eta_c'], 'laplace': ['loc', 'scale']},
+                                             'mutation': {'hill climbing': ['cov (%)', 'pdf']}},
+                            vectorized=True, parallel_safe=True)
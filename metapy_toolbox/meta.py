@@ -1,17 +1,18 @@
 """Algorithms module"""
 import time
-from multiprocessing import Pool
 
 import pandas as pd
 
 import metapy_toolbox.common_library as metapyco
+# The algorithm modules register their algorithms in metapyco.ALGORITHMS when imported
 import metapy_toolbox.simulated_annealing as metapysa
 import metapy_toolbox.firefly_algorithm as metapyfa
 import metapy_toolbox.genetic_algorithm as metapyga
 import metapy_toolbox.differential_evolution as metapyde
+from metapy_toolbox.executor import RepetitionExecutor
 
 
-def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict):
+def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict, executor=None):
     """
     This function is responsible for the metaheuristic optimization process. It is a general function that calls the specific algorithm functions.
 
@@ -24,25 +25,31 @@ def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict):
             'x pop upper limit' (List): The upper limit for the population variables.
             'none variable' (Any): Placeholder for variable that can be None.
             'objective function' (Callable): The objective function to be optimized, defined by the user.
+            'vectorized objective' (Boolean): Optional. True when the objective function receives an (n x n_dimensions) array and returns the n objective function values, so whole populations are evaluated in a single call. Default is False.
+            'history' (String): Optional. Amount of history stored in the results: 'full' (all agents and best values per iteration), 'best' (only best values per iteration) or 'none' (only the final best values). Default is 'full'.
+            'report' (String): Optional. Report mode: 'off' (no report), 'summary' (best solution of each iteration) or 'full' (movement of each agent). Default is 'full'.
             'algorithm parameters' (Dictionary): Specific parameters for the optimization algorithm.
         general_setup (Dictionary): Optimization process setup.
             'number of repetitions' (Integer): Number of repetitions for the optimization process.
             'type code' (String): Type of population. Options: 'real code' or 'combinatorial code'.
-            'initial pop. seed' (List): Random seed. Use None in list for random seed.
-            'algorithm' (String): Optimization algorithm. See the available metaheuristic algorithms.
+            'initial pop. seed' (List): Random seed of each repetition. Use None in list for random seed. Each seed spawns independent random streams for the initial population and the algorithm (see metapyco.repetition_seeds), so seeded repetitions are reproducible with any backend.
+            'algorithm' (String): Optimization algorithm. See metapyco.available_algorithms() (algorithms registered with metapyco.register_algorithm).
+            'backend' (String): Optional. Repetitions executor: 'process', 'thread' or 'serial'. Default is 'process'.
+            'number of workers' (Integer): Optional. Number of workers of the executor. Default is None (number of processors).
+        executor (RepetitionExecutor): Persistent executor reused between calls (e.g. grid search). Default is None (an executor is created from general_setup and closed at the end).
 
     Returns:
         all_results_per_rep (list): All results for each repetition.
         best_population_per_rep (list): Best population for each repetition.
-        reports (list): Reports for each repetition.
+        reports (list): Reports for each repetition (metapyco.Report, use str(report) to get the text).
         status_procedure (int): Best repetition id.
     """
 
     try:
         # Check algorithms parameters
         for key in algorithm_setup.keys():
-            if key not in ['number of iterations', 'number of population', 'number of dimensions', 'x pop lower limit', 'x pop upper limit', 'none variable', 'objective function', 'algorithm parameters']:
-                raise ValueError(f"The setup parameter must have the following keys:\n- number of iterations\n- number of population\n- number of dimensions\n- x pop lower limit\n- x pop upper limit\n- none variable\n- objective function\n- algorithm parameters")
+            if key not in ['number of iterations', 'number of population', 'number of dimensions', 'x pop lower limit', 'x pop upper limit', 'none variable', 'objective function', 'vectorized objective', 'history', 'report', 'algorithm parameters']:
+                raise ValueError(f"The setup parameter must have the following keys:\n- number of iterations\n- number of population\n- number of dimensions\n- x pop lower limit\n- x pop upper limit\n- none variable\n- objective function\n- algorithm parameters\nand optionally:\n- vectorized objective\n- history\n- report")
                 
         if not isinstance(algorithm_setup['number of iterations'], int):
             raise TypeError('The number of iterations parameter must be an integer.')
@@ -68,6 +75,15 @@ def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict):
         if not callable(algorithm_setup['objective function']):
             raise TypeError('The objective function parameter must be a py function (def).')
         
+        if not isinstance(algorithm_setup.get('vectorized objective', False), bool):
+            raise TypeError('The vectorized objective parameter must be a boolean.')
+
+        if algorithm_setup.get('history', 'full') not in ['full', 'best', 'none']:
+            raise ValueError("The history parameter must be 'full', 'best' or 'none'.")
+
+        if algorithm_setup.get('report', 'full') not in ['off', 'summary', 'full']:
+            raise ValueError("The report parameter must be 'off', 'summary' or 'full'.")
+
         if not isinstance(algorithm_setup['algorithm parameters'], dict):
             raise TypeError('The algorithm parameters parameter must be a dictionary.')
         
@@ -76,8 +92,8 @@ def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict):
             raise TypeError('The general_setup parameter must be a dictionary.')
 
         for key in general_setup.keys():
-            if key not in ['number of repetitions', 'type code', 'initial pop. seed', 'algorithm']:
-                raise ValueError('The setup parameter must have the following keys:\n- "number of repetitions";\n- "type code";\n- "initial pop. seed";\n- "algorithm";')
+            if key not in ['number of repetitions', 'type code', 'initial pop. seed', 'algorithm', 'backend', 'number of workers']:
+                raise ValueError('The setup parameter must have the following keys:\n- "number of repetitions";\n- "type code";\n- "initial pop. seed";\n- "algorithm";\nand optionally:\n- "backend";\n- "number of workers";')
 
         if not isinstance(general_setup['number of repetitions'], int):
             raise TypeError('The number of repetitions parameter must be an integer.')
@@ -91,73 +107,45 @@ def metaheuristic_optimizer(algorithm_setup: dict, general_setup: dict):
         if not isinstance(general_setup['algorithm'], str):
             raise TypeError('The algorithm parameter must be a string.')
 
+        # Algorithm resolution and parameter schema
+        algorithm = metapyco.get_algorithm(general_setup['algorithm'])
+        algorithm.check_parameters(algorithm_setup['algorithm parameters'])
+        if algorithm_setup.get('vectorized objective', False) and not algorithm.vectorized:
+            raise ValueError(f"The {algorithm.name} algorithm does not support the vectorized objective parameter.")
+
         # Start variables
         initial_time = time.time()
-        all_results_per_rep = []
-        best_population_per_rep = []
-        times_procedure = []
-        reports = []
 
-        # Initial population for each repetition
+        # Random streams and initial population for each repetition
+        pop_seeds, algorithm_seeds = metapyco.repetition_seeds(general_setup['initial pop. seed'][:general_setup['number of repetitions']])
         population = metapyco.initial_pops(general_setup['number of repetitions'],
                                             algorithm_setup['number of population'],
                                             algorithm_setup['number of dimensions'],
                                             algorithm_setup['x pop lower limit'],
                                             algorithm_setup['x pop upper limit'],
                                             general_setup['type code'],
-                                            general_setup['initial pop. seed'])
-
-        # Algorithm selection and general results
-        if general_setup['algorithm']=='hill_climbing_01':
-            # Multiprocess
-            with Pool() as p:
-                settings = [[algorithm_setup, init_population, general_setup['initial pop. seed'][i]] for i, init_population in enumerate(population)]
-                results = p.map_async(func=metapysa.hill_climbing_01, iterable=settings)
-                for result in results.get():
-                    all_results_per_rep.append(result[0])
-                    best_population_per_rep.append(result[1])
-                    times_procedure.append(result[2])
-                    reports.append(result[3])
-        elif general_setup['algorithm']=='simulated_annealing_01':
-            # Multiprocess
-            with Pool() as p:
-                settings = [[algorithm_setup, init_population, general_setup['initial pop. seed'][i]] for i, init_population in enumerate(population)]
-                results = p.map_async(func=metapysa.simulated_annealing_01, iterable=settings)
-                for result in results.get():
-                    all_results_per_rep.append(result[0])
-                    best_population_per_rep.append(result[1])
-                    times_procedure.append(result[2])
-                    reports.append(result[3])
-        elif general_setup['algorithm']=='gender_firefly_01':
-            # Multiprocess
-            with Pool() as p:
-                settings = [[algorithm_setup, init_population, general_setup['initial pop. seed'][i]] for i, init_population in enumerate(population)]
-                results = p.map_async(func=metapyfa.gender_firefly_01, iterable=settings)
-                for result in results.get():
-                    all_results_per_rep.append(result[0])
-                    best_population_per_rep.append(result[1])
-                    times_procedure.append(result[2])
-                    reports.append(result[3])
-        elif general_setup['algorithm']=='genetic_algorithm_01':
-            # Multiprocess
-            with Pool() as p:
-                settings = [[algorithm_setup, init_population, general_setup['initial pop. seed'][i]] for i, init_population in enumerate(population)]
-                results = p.map_async(func=metapyga.genetic_algorithm_01, iterable=settings)
-                for result in results.get():
-                    all_results_per_rep.append(result[0])
-                    best_population_per_rep.append(result[1])
-                    times_procedure.append(result[2])
-                    reports.append(result[3])
-        elif general_setup['algorithm']=='differential_evolution_01':
-            # Multiprocess
-            with Pool() as p:
-                settings = [[algorithm_setup, init_population, general_setup['initial pop. seed'][i]] for i, init_population in enumerate(population)]
-                results = p.map_async(func=metapyde.differential_evolution_01, iterable=settings)
-                for result in results.get():
-                    all_results_per_rep.append(result[0])
-                    best_population_per_rep.append(result[1])
-                    times_procedure.append(result[2])
-                    reports.append(result[3])
+                                            pop_seeds)
+
+        # Algorithm selection and general results (results are stored by repetition id as the repetitions finish)
+        settings = [[algorithm_setup, init_population, algorithm_seeds[i]] for i, init_population in enumerate(population)]
+        all_results_per_rep = [None] * len(settings)
+        best_population_per_rep = [None] * len(settings)
+        times_procedure = [None] * len(settings)
+        reports = [None] * len(settings)
+        if not algorithm.parallel_safe:
+            local_executor = RepetitionExecutor('serial')
+        else:
+            local_executor = executor or RepetitionExecutor(general_setup.get('backend', 'process'), general_setup.get('number of workers'))
+        try:
+            for i, result in local_executor.run(algorithm.function, settings):
+                all_results_per_rep[i] = result[0]
+                best_population_per_rep[i] = result[1]
+                times_procedure[i] = result[2]
+                reports[i] = result[3]
+        finally:
+            if local_executor is not executor:
+                local_executor.close()
+
         # Best results
         status_procedure = metapyco.summary_analysis(best_population_per_rep)
         best_result = best_population_per_rep[status_procedure]
@@ -187,13 +175,15 @@ def grid_params_metaheuristic(param_grid, algorithm_setup, general_setup):
         results = []
         # Generate all possible combinations of parameters
         param_combinations = metapyco.parametrizer_grid(param_grid, algorithm_setup)
-        for params in param_combinations:
-                _, df_resume_all_reps, _, status = metaheuristic_optimizer(params, general_setup)
-                # Save results
-                results.append({
-                'params': params,
-                'OF BEST': df_resume_all_reps[status].iloc[-1]['OF BEST']
-        })
+        # Same worker pool for all combinations (the none variable is shared by the setups)
+        with RepetitionExecutor(general_setup.get('backend', 'process'), general_setup.get('number of workers')) as executor:
+                for params in param_combinations:
+                        _, df_resume_all_reps, _, status = metaheuristic_optimizer(params, general_setup, executor)
+                        # Save results
+                        results.append({
+                        'params': params,
+                        'OF BEST': df_resume_all_reps[status].iloc[-1]['OF BEST']
+                })
         results = pd.DataFrame(results)
         best_parameter = results.loc[results['OF BEST'].idxmin()]
 
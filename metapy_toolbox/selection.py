@@ -0,0 +1,149 @@
+"""Selection functions"""
+from functools import partial
+
+import numpy as np
+
+import metapy_toolbox.common_library as metapyco
+
+
+def _exclusive_draw(weights, random_values):
+    """
+    This function draws one agent id for each agent with probability proportional to the weights, excluding the agent itself. The cumulative weights are built once and all ids are found in a single searchsorted call.
+
+    Args:
+        weights (Array): Selection weights of the agents (n_population). Positive values.
+        random_values (Array): Uniform random numbers in [0, 1), one per agent (n_population).
+
+    Returns:
+        id_selected (Array): Selected agent id for each agent (n_population).
+    """
+
+    n_population = weights.shape[0]
+    cumulative = np.cumsum(weights)
+    before = np.concatenate(([0.0], cumulative[:-1]))
+    after = cumulative[-1] - cumulative
+
+    # Position in the wheel without the own slice: [0, before) is kept and [before, before + after) is moved past the own slice
+    target = random_values * (before + after)
+    target = np.where(target < before, target, cumulative + (target - before))
+    id_selected = np.searchsorted(cumulative, target, side='right')
+
+    return np.minimum(id_selected, n_population - 1)
+
+
+def roulette_wheel_selection_batch(fit_pop, verbose=True, rng=None):
+    """
+    This function selects one parent for each agent of the population using the roulette wheel selection method (self-selection is excluded).
+
+    Args:
+        fit_pop (List or Array): Population fitness values.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        id_selected (Array): Selected agent id for each agent.
+        reports (List): Report about the roulette wheel selection process of each agent (empty when verbose is False).
+    """
+
+    fit_pop = np.asarray(fit_pop, dtype=float)
+    random_values = metapyco.random_generator(rng).random(fit_pop.shape[0])
+    id_selected = _exclusive_draw(fit_pop, random_values)
+    reports = []
+    if verbose:
+        fit_list = fit_pop.tolist()
+        for i_pop, i_selected in enumerate(id_selected):
+            maximumm = sum(fit_list[:i_pop] + fit_list[i_pop+1:])
+            selection_probs = [0.0 if j == i_pop else value/maximumm for j, value in enumerate(fit_list)]
+            reports.append("    Selection operator\n"
+                           f"    sum(fit) = {maximumm}\n"
+                           f"    probs(fit) = {selection_probs}\n"
+                           f"    selected agent id = {i_selected}\n")
+
+    return id_selected, reports
+
+
+def tournament_selection_batch(fit_pop, size=2, verbose=True, rng=None):
+    """
+    This function selects one parent for each agent of the population using the tournament selection method. The winner is the candidate with the largest fitness (self-selection is excluded).
+
+    Args:
+        fit_pop (List or Array): Population fitness values.
+        size (Integer): Number of candidates of each tournament (drawn with replacement). Default is 2.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        id_selected (Array): Selected agent id for each agent.
+        reports (List): Report about the tournament selection process of each agent (empty when verbose is False).
+    """
+
+    fit_pop = np.asarray(fit_pop, dtype=float)
+    n_population = fit_pop.shape[0]
+    candidates = metapyco.random_generator(rng).integers(0, n_population - 1, size=(n_population, size))
+    candidates += candidates >= np.arange(n_population)[:, None]
+    winners = np.argmax(fit_pop[candidates], axis=1)
+    id_selected = candidates[np.arange(n_population), winners]
+    reports = []
+    if verbose:
+        for i_pop, i_selected in enumerate(id_selected):
+            reports.append("    Selection operator - tournament\n"
+                           f"    candidates = {candidates[i_pop].tolist()}, fit = {fit_pop[candidates[i_pop]].tolist()}\n"
+                           f"    selected agent id = {i_selected}\n")
+
+    return id_selected, reports
+
+
+def rank_selection_batch(fit_pop, verbose=True, rng=None):
+    """
+    This function selects one parent for each agent of the population using the linear rank selection method. The worst agent has rank 1 and the best agent has rank n_population; the probabilities are proportional to the ranks (self-selection is excluded).
+
+    Args:
+        fit_pop (List or Array): Population fitness values.
+        verbose (Boolean): Builds the report text. Use False to skip the report formatting. Default is True.
+        rng (Generator or None): Random generator (see metapy_toolbox.common_library.random_generator). Default is None.
+
+    Returns:
+        id_selected (Array): Selected agent id for each agent.
+        reports (List): Report about the rank selection process of each agent (empty when verbose is False).
+    """
+
+    fit_pop = np.asarray(fit_pop, dtype=float)
+    ranks = np.empty(fit_pop.shape[0])
+    ranks[np.argsort(fit_pop, kind='stable')] = np.arange(1, fit_pop.shape[0] + 1)
+    random_values = metapyco.random_generator(rng).random(fit_pop.shape[0])
+    id_selected = _exclusive_draw(ranks, random_values)
+    reports = []
+    if verbose:
+        for i_selected in id_selected:
+            reports.append("    Selection operator - rank\n"
+                           f"    ranks = {ranks.astype(int).tolist()}\n"
+                           f"    selected agent id = {i_selected}\n")
+
+    return id_selected, reports
+
+
+SELECTION_OPERATORS = {'roulette': roulette_wheel_selection_batch,
+                       'tournament': tournament_selection_batch,
+                       'rank': rank_selection_batch}
+
+
+def selection_operator(selection_parameters):
+    """
+    This function resolves the selection type of the algorithm parameters to an operator with a uniform signature. Call it once before the iterations.
+
+    Args:
+        selection_parameters (Dictionary): Selection parameters (setup['algorithm parameters']['selection']).
+            'type' (String): 'roulette', 'tournament' or 'rank'.
+            'size' (Integer): Optional. Number of candidates of each tournament. Default is 2.
+
+    Returns:
+        operator (Py function (def)): operator(fit_pop, verbose, rng) -> id_selected, reports.
+    """
+
+    select_type = selection_parameters['type']
+    if select_type not in SELECTION_OPERATORS:
+        raise ValueError(f"The selection type {select_type} is not available. Options: {', '.join(SELECTION_OPERATORS)}")
+    if select_type == 'tournament':
+        return partial(tournament_selection_batch, size=selection_parameters.get('size', 2))
+
+    return SELECTION_OPERATORS[select_type]
@@ -2,50 +2,49 @@
 import time
 
 import numpy as np
-import pandas as pd
 from tqdm import tqdm
 
 import metapy_toolbox.common_library as metapyco
 
 
-def start_temperature(n_population, obj_function, x_pop, of_pop, x_lower, x_upper, n_dimensions, pdf, cov, none_variable):
+def start_temperature(n_population, obj_function, x_pop, of_pop, x_lower, x_upper, n_dimensions, pdf, cov, none_variable, vectorized=False, rng=None):
     """ 
     This function calculates the initial temperature with an acceptance rate greater than 80% of the initial solutions. Fixed at 500 attempts.
 
     Args:
         n_population (Integer): Number of population
         obj_function (Py function (def)): Objective function. The Metapy user defined this function
-        x_pop (List): Population design variables
-        of_pop (List): Population objective function values
+        x_pop (List or Array): Population design variables
+        of_pop (List or Array): Population objective function values
         x_lower (List): Lower limit of the design variables
         x_upper (List): Upper limit of the design variables
         n_dimensions (Integer): Problem dimension
         pdf (String): Probability density function. Options: 'gaussian' or 'uniform'
         cov (Float): Coefficient of variation in percentage
         none_variable (None, list, float, dictionary, str or any): None variable. User can use this variable in objective function
+        vectorized (Boolean): Evaluates all trial movements in a single call (see metapyco.evaluate_objective). Default is False
+        rng (Generator or None): Random generator (see metapyco.random_generator). Default is None
     
     Returns:
         t_0mean (Float): Initial temperature.
         report (String): Report of the initial temperature calculation.
     """
 
+    rng = metapyco.random_generator(rng)
     report = "\nAutomotic initial temperature\n"
-    t_0 = []
+    x_temp = np.empty((500 * n_population, n_dimensions))
     for i in range(500):
         # Trial opulation movement
         for pop in range(n_population):
-            _, of_i_temp, _, _, _ = metapyco.mutation_01_hill_movement(obj_function, x_pop[pop],
-                                                                    x_lower, x_upper,
-                                                                    n_dimensions,
-                                                                    pdf, cov,
-                                                                    none_variable)
-
-            # Probability of acceptance of the movement
-            delta_energy = of_i_temp - of_pop[pop]
-            if delta_energy < 0:
-                pass       
-            elif delta_energy >= 0:
-                t_0.append(-delta_energy / np.log(0.8))
+            x_temp[i*n_population + pop], _ = metapyco.mutation_01_hill_candidate(x_pop[pop],
+                                                                                x_lower, x_upper,
+                                                                                n_dimensions,
+                                                                                pdf, cov, verbose=False, rng=rng)
+    of_temp, _, _ = metapyco.evaluate_objective(obj_function, x_temp, none_variable, vectorized)
+
+    # Probability of acceptance of the movement
+    delta_energy = of_temp - np.tile(np.asarray(of_pop, dtype=float), 500)
+    t_0 = (-delta_energy[delta_energy >= 0] / np.log(0.8)).tolist()
     t_0mean = sum(t_0)/len(t_0)
     report += f"    sum_t0 = {sum(t_0)}, number of accepted moves (delta_e > 0) = {len(t_0)}, t_mean = {t_0mean}\n"
 
@@ -57,7 +56,7 @@ def hill_climbing_01(settings):
     Hill Climbing algorithm 01.
     
     Args:  
-        settings (List): [0] setup (Dictionary), [1] initial population (List or METApy function), [2] seeds (None or integer)
+        settings (List): [0] setup (Dictionary), [1] initial population (List or METApy function), [2] seeds (None, Integer, SeedSequence or Generator)
         'number of population' (Integer): number of population (key in setup Dictionary)
         'number of iterations' (Integer): number of iterations (key in setup Dictionary)
         'number of dimensions' (Integer): Problem dimension (key in setup Dictionary)
@@ -65,16 +64,19 @@ def hill_climbing_01(settings):
         'x pop upper limit' (List): Upper limit of the design variables (key in setup Dictionary)
         'none_variable' (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function (key in setup Dictionary)
         'objective function' (Py function [def]): Objective function. The Metapy user defined this function (key in setup Dictionary)                                          
+        'vectorized objective' (Boolean): Optional. True when the objective function receives the (n_population x n_dimensions) array and returns the n_population values; the population is then evaluated in a single call per iteration. Default is False (key in setup Dictionary)
+        'history' (String): Optional. 'full', 'best' or 'none'. Controls how much iteration data is stored in df_all and df_best. Default is 'full' (key in setup Dictionary)
+        'report' (String): Optional. 'off', 'summary' or 'full'. Controls how much of the execution is recorded in the report. Default is 'full' (key in setup Dictionary)
         'algorithm parameters' (Dictionary): Algorithm parameters. See documentation (key in setup Dictionary)
         'mutation' (Dictionary): Mutation parameters (key in algorithm parameters Dictionary)
         initial population (List or METApy function): Users can inform the initial population or use initial population functions
-        seed (None or integer): Random seed. Use None for random seed
+        seed (None, Integer, SeedSequence or Generator): Random seed (see metapyco.random_generator). Use None for random seed
     
     Returns:
         df_all (Dataframe): All data of the population.
         df_best (Dataframe): Best data of the population.
         delta_time (Float): Time of the algorithm execution in seconds.
-        report (String): Report of the algorithm execution.
+        report (Report): Report of the algorithm execution (metapyco.Report). Use str(report) to get the text.
     """
 
     # Setup config
@@ -86,11 +88,8 @@ def hill_climbing_01(settings):
     x_upper = setup['x pop upper limit']
     none_variable = setup['none variable']
     obj_function = setup['objective function']
-    seeds = settings[2]
-    if seeds is None:
-        pass
-    else:
-        np.random.seed(seeds)
+    vectorized = setup.get('vectorized objective', False)
+    rng = metapyco.random_generator(settings[2])
 
     # Algorithm_parameters
     algorithm_parameters = setup['algorithm parameters']
@@ -98,128 +97,85 @@ def hill_climbing_01(settings):
     pdf = algorithm_parameters['mutation']['pdf']
 
     # Creating variables in the iteration procedure
-    of_pop = []
-    fit_pop = []
     neof_count = 0
 
-    # Storage values: columns names about dataset results
-    columns_all_data = ['X_' + str(i) for i in range(n_dimensions)]
-    columns_all_data.append('OF')
-    columns_all_data.append('FIT')
-    columns_all_data.append('ITERATION')
-    columns_repetition_data = ['X_' + str(i) + '_BEST' for i in range(n_dimensions)]
-    columns_repetition_data.append('OF BEST')
-    columns_repetition_data.append('FIT BET')
-    columns_repetition_data.append('ID BEST')
-    columns_worst_data  = ['X_' + str(i)  + '_WORST' for i in range(n_dimensions)]
-    columns_worst_data.append('OF WORST')
-    columns_worst_data.append('FIT WORST')
-    columns_worst_data.append('ID WORST')
-    columns_other_data = ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
-    report = "Hill Climbing 01 - report \n\n"
-    all_data_pop = []
-    resume_result = []
+    report = metapyco.Report("Hill Climbing 01 - report \n\n", setup.get('report', 'full'))
+    history = metapyco.History(n_iterations, n_population, n_dimensions, setup.get('history', 'full'))
 
     # Initial population and evaluation solutions
-    report += "Initial population\n"
-    x_pop = settings[1].copy()
-    for i_pop in range(n_population):
-        of_pop.append(obj_function(x_pop[i_pop], none_variable))
-        fit_pop.append(metapyco.fit_value(of_pop[i_pop]))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(x_pop[i_pop], of_pop[i_pop],
-                                                               fit_pop[i_pop], columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    report.summary("Initial population\n")
+    population = metapyco.Population(settings[1])
+    neof_count += population.evaluate(obj_function, none_variable, vectorized=vectorized)
+    offspring = population.copy()
+    history.record_agents(0, population.x, population.of, population.fit)
 
     # Best, average and worst values and storage
-    repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                            columns_repetition_data,
-                                                            columns_worst_data,
-                                                            columns_other_data,
-                                                            neof_count, iteration=0)
-    resume_result.append(repetition_data)
-    for i_pop in range(n_population):
-        if i_pop == best_id:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-        else:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+    best_id = history.record_best(0, population.x, population.of, population.fit, neof_count)
+    report.population(population.x, population.of, best_id)
 
     # Iteration procedure
-    report += "\nIterations\n"
+    report.summary("\nIterations\n")
     progress_bar = tqdm(total=n_iterations, desc='Progress')
     for iter in range(n_iterations):
-        report += f"\nIteration: {iter+1}\n"
+        report.summary("\nIteration: {}\n", iter+1)
         # Time markup
         initial_time = time.time()
 
-        # Population movement
+        # Population movement (Hill Climbing particle movement), evaluated in a single step
+        reports_mov = []
         for pop in range(n_population):
-            report += f"Pop id: {pop} - particle movement - mutation procedure\n"
-            # Hill Climbing particle movement
-            x_i_temp, of_i_temp, \
-                fit_i_temp, neof, \
-                report_mov = metapyco.mutation_01_hill_movement(obj_function,
-                                                        x_pop[pop],
-                                                        x_lower, x_upper,
-                                                        n_dimensions,
-                                                        pdf, std,
-                                                        none_variable)
-            report += report_mov
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(x_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+            x_i_temp, report_mov = metapyco.mutation_01_hill_candidate(population.x[pop].tolist(),
+                                                                       x_lower, x_upper,
+                                                                       n_dimensions,
+                                                                       pdf, std, verbose=report.verbose, rng=rng)
+            offspring.x[pop] = x_i_temp
+            reports_mov.append(report_mov)
+
+        # Update neof (Number of Objective Function Evaluations)
+        neof_count += offspring.evaluate(obj_function, none_variable, vectorized=vectorized)
+        history.record_agents(iter+1, offspring.x, offspring.of, offspring.fit)
+
+        for pop in range(n_population):
+            report.detail("Pop id: {} - particle movement - mutation procedure\n", pop)
+            x_i_temp, of_i_temp, fit_i_temp = offspring.x[pop].tolist(), offspring.of[pop], offspring.fit[pop]
+            report.detail(reports_mov[pop])
+            report.detail("    update x = {}, of = {}, fit = {}\n", x_i_temp, of_i_temp, fit_i_temp)
 
             # New design variables
-            if fit_i_temp > fit_pop[pop]:
-                report += f"    fit_i_temp={fit_i_temp} > fit_pop[pop]={fit_pop[pop]} - accept this solution\n"
-                x_pop[pop] = x_i_temp.copy()
-                of_pop[pop] = of_i_temp
-                fit_pop[pop] = fit_i_temp
+            if fit_i_temp > population.fit[pop]:
+                report.detail("    fit_i_temp={} > fit_pop[pop]={} - accept this solution\n", fit_i_temp, population.fit[pop])
+                population.update(pop, x_i_temp, of_i_temp, fit_i_temp)
             else:
-                report += f"    fit_i_temp={fit_i_temp} < fit_pop[pop]={fit_pop[pop]} - not accept this solution\n"
-
-            # Update neof (Number of Objective Function Evaluations)
-            neof_count += neof
+                report.detail("    fit_i_temp={} < fit_pop[pop]={} - not accept this solution\n", fit_i_temp, population.fit[pop])
 
         # Best, average and worst values and storage
-        repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                                columns_repetition_data,
-                                                                columns_worst_data,
-                                                                columns_other_data,
-                                                                neof_count,
-                                                                iteration=iter+1)
-        resume_result.append(repetition_data)
-        report += "update solutions\n"
-        for i_pop in range(n_population):
-            if i_pop == best_id:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-            else:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]}  \n'
+        best_id = history.record_best(iter+1, population.x, population.of, population.fit, neof_count)
+        report.summary("update solutions\n")
+        report.population(population.x, population.of, best_id)
         progress_bar.update()
 
     # Time markup
     end_time = time.time()
     delta_time = end_time - initial_time
 
-    # Storage all values in DataFrame
-    df_all = pd.concat(all_data_pop, ignore_index=True)
-
-    # Storage best values in DataFrame
-    df_best = pd.concat(resume_result, ignore_index=True)
+    # Storage all values and best values in DataFrame
+    df_all, df_best = history.dataframes()
     progress_bar.close()
 
     return df_all, df_best, delta_time, report
 
 
+metapyco.register_algorithm('hill_climbing_01', hill_climbing_01,
+                            parameters={'mutation': ['cov (%)', 'pdf']},
+                            vectorized=True, parallel_safe=True)
+
+
 def simulated_annealing_01(settings):
     """
     Simulated Annealing algorithm 01.
     
     Args:  
-        settings (List): [0] setup (Dictionary), [1] initial population (List or METApy function), [2] seeds (None or integer)
+        settings (List): [0] setup (Dictionary), [1] initial population (List or METApy function), [2] seeds (None, Integer, SeedSequence or Generator)
         'number of population' (Integer): number of population (key in setup Dictionary)
         'number of iterations' (Integer): number of iterations (key in setup Dictionary)
         'number of dimensions' (Integer): Problem dimension (key in setup Dictionary)
@@ -227,17 +183,20 @@ def simulated_annealing_01(settings):
         'x pop upper limit' (List): Upper limit of the design variables (key in setup Dictionary)
         'none_variable' (None, list, float, dictionary, str or any): None variable. Default is None. User can use this variable in objective function (key in setup Dictionary)
         'objective function' (Py function [def]): Objective function. The Metapy user defined this function (key in setup Dictionary)                                          
+        'vectorized objective' (Boolean): Optional. True when the objective function receives the (n_population x n_dimensions) array and returns the n_population values; the population is then evaluated in a single call per iteration. Default is False (key in setup Dictionary)
+        'history' (String): Optional. 'full', 'best' or 'none'. Controls how much iteration data is stored in df_all and df_best. Default is 'full' (key in setup Dictionary)
+        'report' (String): Optional. 'off', 'summary' or 'full'. Controls how much of the execution is recorded in the report. Default is 'full' (key in setup Dictionary)
         'algorithm parameters' (Dictionary): Algorithm parameters. See documentation (key in setup Dictionary)
         'temp. control' (Dictionary): Temperature parameters (key in algorithm parameters Dictionary)
         'mutation' (Dictionary): Mutation parameters (key in algorithm parameters Dictionary)
         initial population (List or METApy function): Users can inform the initial population or use initial population functions
-        seed (None or integer): Random seed. Use None for random seed
+        seed (None, Integer, SeedSequence or Generator): Random seed (see metapyco.random_generator). Use None for random seed
     
     Returns:
         df_all (Dataframe): All data of the population.
         df_best (Dataframe): Best data of the population.
         delta_time (Float): Time of the algorithm execution in seconds.
-        report (String): Report of the algorithm execution.
+        report (Report): Report of the algorithm execution (metapyco.Report). Use str(report) to get the text.
     """
 
     # setup config
@@ -249,11 +208,8 @@ def simulated_annealing_01(settings):
     x_upper = setup['x pop upper limit']
     none_variable = setup['none variable']
     obj_function = setup['objective function']
-    seeds = settings[2]
-    if seeds is None:
-        pass
-    else:
-        np.random.seed(seeds)
+    vectorized = setup.get('vectorized objective', False)
+    rng = metapyco.random_generator(settings[2])
 
     # algorithm_parameters
     algorithm_parameters = setup['algorithm parameters']
@@ -264,112 +220,78 @@ def simulated_annealing_01(settings):
     alpha = algorithm_parameters['temp. control']['alpha']
 
     # Creating variables in the iteration procedure
-    of_pop = []
-    fit_pop = []
     neof_count = 0
 
-    # Storage values: columns names about dataset results
-    columns_all_data = ['X_' + str(i) for i in range(n_dimensions)]
-    columns_all_data.append('OF')
-    columns_all_data.append('FIT')
-    columns_all_data.append('ITERATION')
-    columns_repetition_data = ['X_' + str(i) + '_BEST' for i in range(n_dimensions)]
-    columns_repetition_data.append('OF BEST')
-    columns_repetition_data.append('FIT BET')
-    columns_repetition_data.append('ID BEST')
-    columns_worst_data  = ['X_' + str(i)  + '_WORST' for i in range(n_dimensions)]
-    columns_worst_data.append('OF WORST')
-    columns_worst_data.append('FIT WORST')
-    columns_worst_data.append('ID WORST')
-    columns_other_data = ['OF AVG', 'FIT AVG', 'ITERATION', 'neof']
-    report = "Simulated Annealing 01 - report \n\n"
-    all_data_pop = []
-    resume_result = []
+    report = metapyco.Report("Simulated Annealing 01 - report \n\n", setup.get('report', 'full'))
+    history = metapyco.History(n_iterations, n_population, n_dimensions, setup.get('history', 'full'))
 
     # Initial population and evaluation solutions
-    report += "Initial population\n"
-    x_pop = settings[1].copy()
-    for i_pop in range(n_population):
-        of_pop.append(obj_function(x_pop[i_pop], none_variable))
-        fit_pop.append(metapyco.fit_value(of_pop[i_pop]))
-        neof_count += 1
-        i_pop_solution = metapyco.resume_all_data_in_dataframe(x_pop[i_pop], of_pop[i_pop],
-                                                               fit_pop[i_pop], columns_all_data,
-                                                               iteration=0)
-        all_data_pop.append(i_pop_solution)
+    report.summary("Initial population\n")
+    population = metapyco.Population(settings[1])
+    neof_count += population.evaluate(obj_function, none_variable, vectorized=vectorized)
+    offspring = population.copy()
+    history.record_agents(0, population.x, population.of, population.fit)
 
     # Best, average and worst values and storage
-    repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                            columns_repetition_data,
-                                                            columns_worst_data,
-                                                            columns_other_data,
-                                                            neof_count, iteration=0)
-    resume_result.append(repetition_data)
-    for i_pop in range(n_population):
-        if i_pop == best_id:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-        else:
-            report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+    best_id = history.record_best(0, population.x, population.of, population.fit, neof_count)
+    report.population(population.x, population.of, best_id)
 
     # Initial temperature
     if temperature == 'auto':
         temperature, report_move = start_temperature(n_population,
-                                            obj_function, x_pop,
-                                            of_pop, x_lower, x_upper,
+                                            obj_function, population.x,
+                                            population.of, x_lower, x_upper,
                                             n_dimensions, pdf, std,
-                                            none_variable)
-        report += report_move
+                                            none_variable, vectorized, rng)
+        report.summary(report_move)
     else:
         pass
 
     # Iteration procedure
-    report += "\nIterations\n"
+    report.summary("\nIterations\n")
     progress_bar = tqdm(total=n_iterations, desc='Progress')
     for iter in range(n_iterations):
-        report += f"\nIteration: {iter+1}\n"
-        report += f"Temperature: {temperature}\n"
+        report.summary("\nIteration: {}\n", iter+1)
+        report.summary("Temperature: {}\n", temperature)
         # Time markup
         initial_time = time.time()
 
-        # Population movement
+        # Population movement (Hill Climbing particle movement), evaluated in a single step
+        reports_mov = []
+        for pop in range(n_population):
+            x_i_temp, report_mov = metapyco.mutation_01_hill_candidate(population.x[pop].tolist(),
+                                                                       x_lower, x_upper,
+                                                                       n_dimensions,
+                                                                       pdf, std, verbose=report.verbose, rng=rng)
+            offspring.x[pop] = x_i_temp
+            reports_mov.append(report_mov)
+
+        # Update neof (Number of Objective Function Evaluations)
+        neof_count += offspring.evaluate(obj_function, none_variable, vectorized=vectorized)
+        history.record_agents(iter+1, offspring.x, offspring.of, offspring.fit)
+
+        random_values = rng.random(n_population)
         for pop in range(n_population):
-            report += f"Pop id: {pop} - particle movement - mutation procedure\n"
-            # Hill Climbing particle movement
-            x_i_temp, of_i_temp, \
-                fit_i_temp, neof, \
-                report_mov = metapyco.mutation_01_hill_movement(obj_function,
-                                                        x_pop[pop],
-                                                        x_lower, x_upper,
-                                                        n_dimensions,
-                                                        pdf, std,
-                                                        none_variable)
-            report += report_mov
-            i_pop_solution = metapyco.resume_all_data_in_dataframe(x_i_temp, of_i_temp,
-                                                                   fit_i_temp,
-                                                                   columns_all_data,
-                                                                   iteration=iter+1)
-            all_data_pop.append(i_pop_solution)
+            report.detail("Pop id: {} - particle movement - mutation procedure\n", pop)
+            x_i_temp, of_i_temp, fit_i_temp = offspring.x[pop].tolist(), offspring.of[pop], offspring.fit[pop]
+            report.detail(reports_mov[pop])
+            report.detail("    update x = {}, of = {}, fit = {}\n", x_i_temp, of_i_temp, fit_i_temp)
 
             # Probability of acceptance of the movement
-            delta_energy = of_i_temp - of_pop[pop]
+            delta_energy = of_i_temp - population.of[pop]
             if delta_energy < 0:
                 prob_state = 1
             elif delta_energy >= 0:
                 prob_state = np.exp(-delta_energy/temperature)
-            report += f"    energy = {delta_energy}, prob. state = {prob_state}\n"
+            report.detail("    energy = {}, prob. state = {}\n", delta_energy, prob_state)
 
             # New design variables
-            random_number = np.random.random()
+            random_number = random_values[pop]
             if random_number <= prob_state:
-                report += f"    random number={random_number} <= prob. state={prob_state} - accept this solution\n"
-                x_pop[pop] = x_i_temp.copy()
-                of_pop[pop] = of_i_temp
-                fit_pop[pop] = fit_i_temp
+                report.detail("    random number={} <= prob. state={} - accept this solution\n", random_number, prob_state)
+                population.update(pop, x_i_temp, of_i_temp, fit_i_temp)
             else:
-                report += f"    random number={random_number} > prob. state={prob_state} - not accept this solution\n"
-
-            # Update neof (Number of Objective Function Evaluations)
-            neof_count += neof
+                report.detail("    random number={} > prob. state={} - not accept this solution\n", random_number, prob_state)
 
         # Update temperature
         # Geometric cooling scheme
@@ -386,30 +308,23 @@ def simulated_annealing_01(settings):
             temperature = temperature * np.exp(-alpha*(1+iter))
 
         # Best, average and worst values and storage
-        repetition_data, best_id = metapyco.resume_best_data_in_dataframe(x_pop, of_pop, fit_pop,
-                                                                columns_repetition_data,
-                                                                columns_worst_data,
-                                                                columns_other_data,
-                                                                neof_count,
-                                                                iteration=iter+1)
-        resume_result.append(repetition_data)
-        report += "update solutions\n"
-        for i_pop in range(n_population):
-            if i_pop == best_id:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} - best solution\n'
-            else:
-                report += f'x{i_pop} = {x_pop[i_pop]}, of_pop {of_pop[i_pop]} \n'
+        best_id = history.record_best(iter+1, population.x, population.of, population.fit, neof_count)
+        report.summary("update solutions\n")
+        report.population(population.x, population.of, best_id)
         progress_bar.update()
 
     # Time markup
     end_time = time.time()
     delta_time = end_time - initial_time
 
-    # Storage all values in DataFrame
-    df_all = pd.concat(all_data_pop, ignore_index=True)
-
-    # Storage best values in DataFrame
-    df_best = pd.concat(resume_result, ignore_index=True)
+    # Storage all values and best values in DataFrame
+    df_all, df_best = history.dataframes()
     progress_bar.close()
 
     return df_all, df_best, delta_time, report
+
+
+metapyco.register_algorithm('simulated_annealing_01', simulated_annealing_01,
+                            parameters={'mutation': ['cov (%)', 'pdf'],
+                                        'temp. control': ['temperature t_0', 'temperature update', 'alpha']},
+                            vectorized=True, parallel_safe=True)
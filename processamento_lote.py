@@ -0,0 +1,229 @@
+"""
+Processamento em lote (sem interface) da rede de estações BDMEP
+Executa leitura, hmax, desagregação em intensidades, ajuste IDF e SPI para cada arquivo CSV de uma pasta,
+em paralelo, e grava as tabelas consolidadas (equivalente a chuvas_brasil_completo.xlsx) em formato colunar.
+O processamento pode ser reiniciado: estações cujo arquivo de entrada não mudou desde a última execução são puladas.
+Com --perfil, grava também o tempo, a CPU e as linhas de cada etapa por estação (ver instrumentacao.py);
+com --perfil-memoria, também o pico de memória de cada etapa.
+Uso: python processamento_lote.py --pasta BD/dados/wander --saida resultados --workers 4
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from climate_twin import ler_dados, calculo_precipitacoes
+from codigos_hidro import indice_spi, problema_inverso_idf
+from exportacao import FORMATOS_TABELA, escrever_tabela
+import instrumentacao
+from instrumentacao import etapa
+
+# Alterar quando o processamento mudar, para invalidar os resultados já gravados
+VERSAO_PROCESSAMENTO = 1
+
+SAIDAS = {
+    'intensidades': 'chuvas_brasil_completo',
+    'hmax': 'hmax_diaria',
+    'idf': 'parametros_idf',
+    'spi': 'spi_mensal',
+}
+
+
+def assinatura_entrada(caminho_csv, saidas):
+    """
+    Assinatura do arquivo de entrada (conteúdo), das saídas pedidas e da versão do processamento.
+    """
+    h = hashlib.sha1()
+    with open(caminho_csv, 'rb') as f:
+        h.update(f.read())
+    h.update(json.dumps([VERSAO_PROCESSAMENTO, sorted(saidas)]).encode('utf-8'))
+    return h.hexdigest()
+
+
+def codigo_estacao_arquivo(caminho_csv):
+    """
+    Código da estação lido do cabeçalho do CSV ('Codigo Estacao: A001'), sem ler os dados.
+    Usa o nome do arquivo (sem extensão) quando o cabeçalho não tem o código.
+    """
+    with open(caminho_csv, encoding='utf-8', errors='replace') as f:
+        for _, linha in zip(range(9), f):
+            chave, _, valor = linha.partition(':')
+            if chave.strip().lower() == 'codigo estacao' and valor.strip():
+                return valor.strip()
+    return os.path.splitext(os.path.basename(caminho_csv))[0]
+
+
+def processar_estacao(caminho_csv, pasta_estacao, saidas, assinatura):
+    """
+    Processa uma estação e grava cada saída em '<pasta_estacao>/<saida>.parquet' e o manifesto da execução.
+    Função de nível de módulo para poder ser executada em processos auxiliares.
+    Retorna o manifesto (código da estação, assinatura, saídas gravadas, eventual erro e registros de cada etapa).
+    """
+    os.makedirs(pasta_estacao, exist_ok=True)
+    # Remove o manifesto e as saídas da execução anterior, para que uma saída que não é mais gravada
+    # (ou que falhou desta vez) não seja juntada por consolidar
+    for caminho in glob.glob(os.path.join(pasta_estacao, '*.parquet')) + [os.path.join(pasta_estacao, 'manifesto.json')]:
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    manifesto = {'arquivo': os.path.basename(caminho_csv), 'assinatura': assinatura, 'saidas': [], 'erro': None}
+    with etapa('processar_estacao') as medida_estacao:
+        try:
+            _processar_estacao(caminho_csv, pasta_estacao, saidas, manifesto, medida_estacao)
+        except Exception as e:
+            manifesto['erro'] = f"{type(e).__name__}: {e}"
+    manifesto['etapas'] = instrumentacao.coletar()
+
+    # O manifesto é gravado por último: só existe para estações cujo processamento terminou
+    with open(os.path.join(pasta_estacao, 'manifesto.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False)
+    return manifesto
+
+
+def _processar_estacao(caminho_csv, pasta_estacao, saidas, manifesto, medida_estacao):
+    """
+    Etapas de processar_estacao, medidas uma a uma; preenche o manifesto com o código da estação e as saídas gravadas.
+    """
+    with etapa('ler_dados') as medida:
+        metadados, dados = ler_dados(caminho_csv)
+        codigo = metadados.get('codigo_estacao', os.path.basename(caminho_csv))
+        medida.estacao = medida_estacao.estacao = codigo
+        medida.linhas = medida_estacao.linhas = len(dados)
+    manifesto['codigo_estacao'] = codigo
+    tabelas = {}
+
+    with etapa('calculo_precipitacoes', codigo, len(dados)):
+        df_hmax1, matriz_chuva = calculo_precipitacoes(dados.copy(), metadados)
+    matriz_chuva['codigo_estacao'] = codigo
+    if 'intensidades' in saidas:
+        tabelas['intensidades'] = matriz_chuva
+    if 'hmax' in saidas:
+        tabelas['hmax'] = df_hmax1.assign(cidade=metadados['nome'], codigo_estacao=codigo)
+
+    if 'idf' in saidas:
+        df_longo = matriz_chuva.rename(columns={'t_c (min)': 'td (min)', 't_r (anos)': 'tr'})
+        with etapa('problema_inverso_idf', codigo, len(df_longo)):
+            a, b, c, d = problema_inverso_idf(df_longo)
+        y_obs = df_longo['y_obs (mm/h)'].to_numpy(dtype=float)
+        y_pred = (a * df_longo['tr'].to_numpy(dtype=float) ** b) / ((df_longo['td (min)'].to_numpy(dtype=float) + c) ** d)
+        r2 = 1 - np.sum((y_obs - y_pred) ** 2) / np.sum((y_obs - y_obs.mean()) ** 2)
+        tabelas['idf'] = pd.DataFrame([{'codigo_estacao': codigo, 'cidade': metadados['nome'],
+                                        'latitude': metadados['latitude'], 'longitude': metadados['longitude'],
+                                        'altitude': metadados['altitude'], 'a': a, 'b': b, 'c': c, 'd': d, 'r2': r2}])
+
+    if 'spi' in saidas:
+        with etapa('indice_spi', codigo, len(dados)):
+            spi_df, _ = indice_spi(dados[['data medicao', 'precipitacao total diaria (mm)']])
+        spi_df['AnoMes'] = spi_df['AnoMes'].dt.to_timestamp()
+        tabelas['spi'] = spi_df.assign(codigo_estacao=codigo)
+
+    for saida, tabela in tabelas.items():
+        with etapa(f"gravar_{saida}", codigo, len(tabela)):
+            tabela.to_parquet(os.path.join(pasta_estacao, f"{saida}.parquet"), index=False)
+        manifesto['saidas'].append(saida)
+
+
+def estacao_atualizada(pasta_estacao, assinatura):
+    """
+    Verifica se a estação já foi processada, sem erro, com a mesma assinatura de entrada.
+    Estações cujo último processamento falhou são sempre reprocessadas.
+    """
+    try:
+        with open(os.path.join(pasta_estacao, 'manifesto.json'), encoding='utf-8') as f:
+            manifesto = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    return manifesto.get('assinatura') == assinatura and not manifesto.get('erro')
+
+
+def consolidar(pasta_saida, saidas, formato='parquet', estacoes=None):
+    """
+    Junta as saídas das estações processadas em uma tabela por saída. Retorna os caminhos gravados.
+    'estacoes' limita a junção às pastas dessas estações (os códigos da execução atual); None junta todas as pastas.
+    """
+    pasta_estacoes = os.path.join(pasta_saida, 'estacoes')
+    nomes = sorted(os.listdir(pasta_estacoes) if estacoes is None else set(estacoes))
+    caminhos = []
+    for saida in saidas:
+        partes = [os.path.join(pasta_estacoes, nome, f"{saida}.parquet") for nome in nomes]
+        partes = [pd.read_parquet(p) for p in partes if os.path.exists(p)]
+        if not partes:
+            continue
+        caminho = os.path.join(pasta_saida, f"{SAIDAS[saida]}{FORMATOS_TABELA[formato][0]}")
+        with open(caminho, 'wb') as f:
+            f.write(escrever_tabela(pd.concat(partes, ignore_index=True), formato))
+        caminhos.append(caminho)
+    return caminhos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Processamento em lote das estações BDMEP (hmax, IDF, SPI).")
+    parser.add_argument("--pasta", required=True, help="Pasta com os arquivos CSV do BDMEP.")
+    parser.add_argument("--saida", default="resultados_lote", help="Pasta de resultados.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--stations", "--estacoes", dest="estacoes", nargs="*", help="Códigos das estações (padrão: todas).")
+    parser.add_argument("--outputs", "--saidas", dest="saidas", nargs="*", choices=list(SAIDAS), default=list(SAIDAS))
+    parser.add_argument("--formato", choices=list(FORMATOS_TABELA), default="parquet", help="Formato das tabelas consolidadas.")
+    parser.add_argument("--forcar", action="store_true", help="Reprocessa todas as estações, mesmo sem mudanças.")
+    parser.add_argument("--perfil", metavar="PREFIXO", help="Grava <PREFIXO>.json, <PREFIXO>.trace.json e <PREFIXO>.pilhas.txt "
+                                                            "com os tempos de cada etapa por estação.")
+    parser.add_argument("--perfil-memoria", action="store_true", help="Com --perfil, mede também o pico de memória de "
+                                                                      "cada etapa (tracemalloc; mais lento).")
+    args = parser.parse_args(argv)
+    # A instrumentação é desligada por padrão; os processos auxiliares recebem a mesma configuração
+    instrumentacao.ativar(bool(args.perfil), args.perfil_memoria)
+
+    # Uma pasta de resultados por código de estação: o nome do arquivo do BDMEP muda a cada sincronização (data final)
+    # e, com dois arquivos da mesma estação, vale o último em ordem alfabética (o de data final mais recente)
+    arquivos = {}
+    for arquivo in sorted(a for a in os.listdir(args.pasta) if a.endswith('.csv')):
+        arquivos[codigo_estacao_arquivo(os.path.join(args.pasta, arquivo))] = arquivo
+    if args.estacoes:
+        arquivos = {codigo: arquivo for codigo, arquivo in arquivos.items() if codigo in set(args.estacoes)}
+
+    tarefas = []
+    puladas = 0
+    for codigo, arquivo in arquivos.items():
+        caminho = os.path.join(args.pasta, arquivo)
+        pasta_estacao = os.path.join(args.saida, 'estacoes', codigo)
+        assinatura = assinatura_entrada(caminho, args.saidas)
+        if not args.forcar and estacao_atualizada(pasta_estacao, assinatura):
+            puladas += 1
+            continue
+        tarefas.append((caminho, pasta_estacao, args.saidas, assinatura))
+    print(f"{len(arquivos)} estações: {len(tarefas)} a processar, {puladas} sem mudanças")
+
+    inicio = time.time()
+    falhas = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers), initializer=instrumentacao.ativar,
+                             initargs=instrumentacao.estado()) as executor:
+        futuros = [executor.submit(processar_estacao, *tarefa) for tarefa in tarefas]
+        for n, futuro in enumerate(as_completed(futuros), 1):
+            manifesto = futuro.result()
+            instrumentacao.incorporar(manifesto['etapas'])
+            if manifesto['erro']:
+                falhas += 1
+                print(f"[{n}/{len(tarefas)}] {manifesto['arquivo']}: {manifesto['erro']}")
+            else:
+                print(f"[{n}/{len(tarefas)}] {manifesto['arquivo']}", end="\r", flush=True)
+    print(f"\nProcessamento concluído em {time.time() - inicio:.1f} s ({falhas} falhas)")
+
+    with etapa('consolidar'):
+        caminhos = consolidar(args.saida, args.saidas, args.formato, estacoes=list(arquivos))
+    for caminho in caminhos:
+        print(caminho)
+
+    if args.perfil:
+        print(instrumentacao.resumo().to_string())
+        for caminho in instrumentacao.salvar(args.perfil):
+            print(caminho)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,362 @@
+"""
+Serviço HTTP local para consultas de IDF e SPI das estações BDMEP
+Servidor assíncrono (asyncio, sem dependências externas) que mantém em memória os resultados de cada estação
+(hmax, parâmetros IDF e SPI mensal). Estações ainda não calculadas são processadas em um pool de processos,
+uma única vez mesmo com vários clientes pedindo a mesma estação.
+
+Rotas (respostas em JSON):
+    GET  /estacoes
+    GET  /idf?estacao=A001&tr=10,25&td=60         (ou lat=...&lon=... para a estação mais próxima)
+    GET  /spi?estacao=A001&inicio=2020-01&fim=2021-12
+    POST /lote   {"consultas": [{"tipo": "idf", "estacao": "A001", "tr": [10], "td": [60]}, ...]}
+
+Uso: python servico_api.py --pasta BD/dados/wander --porta 8765 --workers 4
+"""
+import argparse
+import asyncio
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from catalogo import carregar_catalogo
+from climate_twin import distancia_haversine
+from codigos_hidro import calculo_precipitacoes, indice_spi, problema_inverso_idf
+
+
+# Maior corpo aceito em uma requisição (bytes); corpos maiores são respondidos com 413
+TAMANHO_MAXIMO_CORPO = 1024 * 1024
+
+
+class ErroConsulta(Exception):
+    """
+    Erro de parâmetros da consulta (respondido com o status HTTP informado).
+    """
+
+    def __init__(self, mensagem, status=HTTPStatus.BAD_REQUEST):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def resultados_estacao(df_estacao):
+    """
+    Calcula hmax, parâmetros IDF e SPI mensal de uma estação a partir dos dados brutos do catálogo.
+    Função de nível de módulo para poder ser executada em processos auxiliares.
+    """
+    col_data = next((col for col in df_estacao.columns if "data" in col.lower()), None)
+    col_prec = next((col for col in df_estacao.columns if "precip" in col.lower()), None)
+    if not col_data or not col_prec:
+        raise ValueError("Coluna de data ou de precipitação não encontrada.")
+
+    hmax_df, _, _, df_longo, media, desvio = calculo_precipitacoes(df_estacao)
+    a, b, c, d = problema_inverso_idf(df_longo)
+
+    df_spi = df_estacao[[col_data, col_prec]].copy()
+    df_spi.columns = ['Data Medição', 'Precipitação Total Diária (mm)']
+    try:
+        spi_df, _ = indice_spi(df_spi)
+        spi = {
+            'ano_mes': [str(p) for p in spi_df['AnoMes']],
+            'precipitacao (mm)': spi_df['PrecipitaçãoMensal'].astype(float).tolist(),
+            'spi': spi_df['SPI'].astype(float).tolist(),
+        }
+    except ValueError:
+        spi = {'ano_mes': [], 'precipitacao (mm)': [], 'spi': []}
+
+    return {
+        'idf': {'a': float(a), 'b': float(b), 'c': float(c), 'd': float(d)},
+        'hmax': {
+            'media (mm)': float(media),
+            'desvio padrao (mm)': float(desvio),
+            'tempo de retorno (anos)': hmax_df['tempo de retorno (anos)'].tolist(),
+            'hmax diaria (mm)': hmax_df['Hmax diria (mm)'].astype(float).tolist(),
+        },
+        'spi': spi,
+    }
+
+
+def _valores(parametro, padrao=None):
+    """
+    Converte um parâmetro numérico (lista, número ou texto separado por vírgulas) em lista de floats.
+    """
+    if parametro is None:
+        if padrao is None:
+            raise ErroConsulta("Parâmetro obrigatório ausente.")
+        return padrao
+    if isinstance(parametro, (int, float)):
+        return [float(parametro)]
+    if isinstance(parametro, str):
+        parametro = parametro.split(',')
+    try:
+        return [float(v) for v in parametro]
+    except (TypeError, ValueError):
+        raise ErroConsulta(f"Valor numérico inválido: {parametro}")
+
+
+def _texto(consulta, chave, padrao=None):
+    """
+    Lê um parâmetro textual da consulta (código da estação, mês 'AAAA-MM'), recusando números, listas e objetos.
+    """
+    valor = consulta.get(chave)
+    if valor is None or valor == '':
+        return padrao
+    if not isinstance(valor, str):
+        raise ErroConsulta(f"O parâmetro '{chave}' deve ser um texto.")
+    return valor
+
+
+def _json_seguro(valor):
+    """
+    Substitui NaN e infinitos por None para gerar JSON válido.
+    """
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    if isinstance(valor, dict):
+        return {k: _json_seguro(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_json_seguro(v) for v in valor]
+    return valor
+
+
+class ServicoIDFSPI:
+    """
+    Estado do serviço: catálogo de estações, resultados em memória e pool de processos para as estações não calculadas.
+    """
+
+    def __init__(self, catalogo, workers=None):
+        self.catalogo = catalogo
+        self.resultados = {}
+        self._em_andamento = {}
+        self._precalculo = None
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        resumo = catalogo.df_resumo
+        self._codigos = resumo['codigo_estacao'].to_numpy()
+        self._latitudes = resumo['latitude'].to_numpy(dtype=float)
+        self._longitudes = resumo['longitude'].to_numpy(dtype=float)
+        self._estacoes = {cod: {'codigo_estacao': cod, 'nome': nome, 'latitude': float(lat), 'longitude': float(lon),
+                                'altitude': float(alt), 'situacao': sit}
+                          for cod, nome, lat, lon, alt, sit in zip(resumo['codigo_estacao'], resumo['nome'],
+                                                                   resumo['latitude'], resumo['longitude'],
+                                                                   resumo['altitude'], resumo['situacao'])}
+
+    def fechar(self):
+        if self._precalculo is not None:
+            self._precalculo.cancel()
+        self._pool.shutdown(cancel_futures=True)
+
+    async def resultado(self, codigo):
+        """
+        Resultados da estação: da memória ou, se ainda não calculados, do pool de processos (uma vez por estação).
+        """
+        if codigo in self.resultados:
+            return self.resultados[codigo]
+        if codigo not in self.catalogo.planilhas_completas:
+            raise ErroConsulta(f"Estação '{codigo}' não encontrada.", HTTPStatus.NOT_FOUND)
+        if codigo not in self._em_andamento:
+            loop = asyncio.get_running_loop()
+            self._em_andamento[codigo] = loop.run_in_executor(self._pool, resultados_estacao,
+                                                              self.catalogo.planilhas_completas[codigo])
+        try:
+            resultado = await asyncio.shield(self._em_andamento[codigo])
+        except Exception as e:
+            self._em_andamento.pop(codigo, None)
+            raise ErroConsulta(f"Falha ao calcular a estação '{codigo}': {e}", HTTPStatus.UNPROCESSABLE_ENTITY)
+        self.resultados[codigo] = resultado
+        self._em_andamento.pop(codigo, None)
+        return resultado
+
+    async def precalcular(self, codigos=None):
+        """
+        Calcula em segundo plano os resultados das estações (todas, por padrão).
+        """
+        codigos = list(self.catalogo.planilhas_completas) if codigos is None else codigos
+        await asyncio.gather(*(self.resultado(cod) for cod in codigos), return_exceptions=True)
+
+    def iniciar_precalculo(self, codigos=None):
+        """
+        Inicia precalcular em uma tarefa guardada no serviço (o asyncio só mantém referências fracas às tarefas)
+        e informa um eventual erro ao terminar.
+        """
+        self._precalculo = asyncio.get_running_loop().create_task(self.precalcular(codigos))
+
+        def ao_terminar(tarefa):
+            if not tarefa.cancelled() and tarefa.exception() is not None:
+                print(f"Falha no pré-cálculo das estações: {tarefa.exception()!r}")
+        self._precalculo.add_done_callback(ao_terminar)
+        return self._precalculo
+
+    def estacao_mais_proxima(self, latitude, longitude):
+        distancias = distancia_haversine(latitude, longitude, self._latitudes, self._longitudes)
+        i = int(np.nanargmin(distancias))
+        return self._codigos[i], float(distancias[i])
+
+    def _codigo(self, consulta):
+        """
+        Código da estação pedida diretamente ('estacao') ou pela posição ('lat' e 'lon'), com a distância em km.
+        """
+        codigo = _texto(consulta, 'estacao')
+        if codigo:
+            return codigo, None
+        if consulta.get('lat') is not None and consulta.get('lon') is not None:
+            return self.estacao_mais_proxima(_valores(consulta['lat'])[0], _valores(consulta['lon'])[0])
+        raise ErroConsulta("Informe 'estacao' ou 'lat' e 'lon'.")
+
+    async def consultar_idf(self, consulta):
+        codigo, distancia = self._codigo(consulta)
+        resultado = await self.resultado(codigo)
+        idf = resultado['idf']
+        tr = np.asarray(_valores(consulta.get('tr'), [2, 5, 10, 25, 50, 100]))
+        td = np.asarray(_valores(consulta.get('td'), [5, 10, 15, 30, 60, 120, 360, 720, 1440]))
+        intensidade = idf['a'] * tr[:, None] ** idf['b'] / (td[None, :] + idf['c']) ** idf['d']
+        return {
+            'estacao': self._estacoes.get(codigo),
+            'distancia (km)': distancia,
+            'parametros': idf,
+            'hmax': resultado['hmax'],
+            'tr (anos)': tr.tolist(),
+            'td (min)': td.tolist(),
+            'intensidade (mm/h)': intensidade.tolist(),
+        }
+
+    async def consultar_spi(self, consulta):
+        codigo, distancia = self._codigo(consulta)
+        inicio = _texto(consulta, 'inicio', '')
+        fim = _texto(consulta, 'fim', '9999-12')
+        spi = (await self.resultado(codigo))['spi']
+        selecao = [i for i, ano_mes in enumerate(spi['ano_mes']) if inicio <= ano_mes <= fim]
+        return {
+            'estacao': self._estacoes.get(codigo),
+            'distancia (km)': distancia,
+            **{chave: [valores[i] for i in selecao] for chave, valores in spi.items()},
+        }
+
+    async def consultar_lote(self, corpo):
+        consultas = corpo.get('consultas') if isinstance(corpo, dict) else None
+        if not isinstance(consultas, list):
+            raise ErroConsulta("O corpo deve ter a lista 'consultas'.")
+        tipos = {'idf': self.consultar_idf, 'spi': self.consultar_spi}
+
+        async def uma(consulta):
+            try:
+                if not isinstance(consulta, dict):
+                    raise ErroConsulta("Cada consulta deve ser um objeto JSON.")
+                if not isinstance(consulta.get('tipo'), str) or consulta['tipo'] not in tipos:
+                    raise ErroConsulta("Tipo de consulta deve ser 'idf' ou 'spi'.")
+                return await tipos[consulta['tipo']](consulta)
+            except ErroConsulta as e:
+                return {'erro': str(e)}
+
+        return {'resultados': await asyncio.gather(*(uma(c) for c in consultas))}
+
+    async def tratar(self, metodo, caminho, consulta, corpo):
+        """
+        Encaminha a requisição para a rota e retorna (status, objeto de resposta).
+        """
+        if metodo == 'GET' and caminho == '/estacoes':
+            return HTTPStatus.OK, {'estacoes': list(self._estacoes.values())}
+        if metodo == 'GET' and caminho == '/idf':
+            return HTTPStatus.OK, await self.consultar_idf(consulta)
+        if metodo == 'GET' and caminho == '/spi':
+            return HTTPStatus.OK, await self.consultar_spi(consulta)
+        if metodo == 'POST' and caminho == '/lote':
+            return HTTPStatus.OK, await self.consultar_lote(corpo)
+        raise ErroConsulta(f"Rota não encontrada: {metodo} {caminho}", HTTPStatus.NOT_FOUND)
+
+    async def atender(self, leitor, escritor):
+        """
+        Atende uma conexão HTTP/1.1 (com keep-alive), uma requisição por vez.
+        """
+        try:
+            while True:
+                try:
+                    linha = await leitor.readline()
+                    if not linha:
+                        break
+                    metodo, alvo, _ = linha.decode('latin-1').split()
+                    cabecalhos = {}
+                    while (cabecalho := await leitor.readline()) not in (b'\r\n', b'\n', b''):
+                        chave, _, valor = cabecalho.decode('latin-1').partition(':')
+                        cabecalhos[chave.strip().lower()] = valor.strip()
+                    tamanho = int(cabecalhos.get('content-length', 0) or 0)
+                    if tamanho < 0:
+                        raise ValueError("Content-Length negativo.")
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Linha de requisição ou cabeçalho malformado ou maior que o limite do leitor
+                    await self._responder(escritor, HTTPStatus.BAD_REQUEST, {'erro': 'Requisição inválida.'}, False)
+                    break
+                if tamanho > TAMANHO_MAXIMO_CORPO:
+                    await self._responder(escritor, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                          {'erro': f"Corpo maior que {TAMANHO_MAXIMO_CORPO} bytes."}, False)
+                    break
+                bruto = await leitor.readexactly(tamanho) if tamanho else b''
+
+                partes = urlsplit(alvo)
+                consulta = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+                try:
+                    corpo = json.loads(bruto) if bruto else None
+                    status, resposta = await self.tratar(metodo.upper(), partes.path, consulta, corpo)
+                except ErroConsulta as e:
+                    status, resposta = e.status, {'erro': str(e)}
+                except json.JSONDecodeError:
+                    status, resposta = HTTPStatus.BAD_REQUEST, {'erro': 'JSON inválido.'}
+                except Exception as e:
+                    # Erro inesperado: responde 500 em vez de derrubar a conexão
+                    status, resposta = HTTPStatus.INTERNAL_SERVER_ERROR, {'erro': f"Erro interno: {type(e).__name__}: {e}"}
+
+                manter = cabecalhos.get('connection', '').lower() != 'close'
+                await self._responder(escritor, status, resposta, manter)
+                if not manter:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    async def _responder(escritor, status, resposta, manter):
+        """
+        Escreve a resposta HTTP com o objeto 'resposta' em JSON.
+        """
+        conteudo = json.dumps(_json_seguro(resposta), ensure_ascii=False).encode('utf-8')
+        escritor.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(conteudo)}\r\n"
+            f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode('latin-1') + conteudo)
+        await escritor.drain()
+
+
+async def servir(pasta, host='127.0.0.1', porta=8765, workers=None, precalcular=False):
+    catalogo = carregar_catalogo(pasta)
+    servico = ServicoIDFSPI(catalogo, workers=workers)
+    servidor = await asyncio.start_server(servico.atender, host, porta)
+    print(f"Servindo {len(catalogo.rotulos)} estações em http://{host}:{porta}")
+    if precalcular:
+        servico.iniciar_precalculo()
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        servico.fechar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço HTTP local de consultas IDF e SPI.")
+    parser.add_argument("--pasta", required=True, help="Pasta (ou ZIP) com os arquivos CSV do BDMEP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--precalcular", action="store_true", help="Calcula todas as estações ao iniciar.")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.pasta, args.host, args.porta, args.workers, args.precalcular))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())